@@ -8,7 +8,10 @@ from app.agents.common.mcp_client_base import (
     MCPClientBase,
     MCPTool,
     MCPToolCall,
+    MCPClientRegistry,
     create_mcp_client,
+    get_mcp_client,
+    mcp_client_registry,
 )
 from app.agents.common.base_single_agent import BaseSingleAgent
 
@@ -16,7 +19,10 @@ __all__ = [
     "MCPClientBase",
     "MCPTool",
     "MCPToolCall",
+    "MCPClientRegistry",
     "create_mcp_client",
+    "get_mcp_client",
+    "mcp_client_registry",
     "BaseSingleAgent",
 ]
 
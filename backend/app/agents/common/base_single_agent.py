@@ -19,7 +19,7 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, Tool
 from langchain_core.tools import BaseTool, StructuredTool
 from langchain_openai import ChatOpenAI
 
-from app.agents.common.mcp_client_base import MCPClientBase, MCPTool, create_mcp_client
+from app.agents.common.mcp_client_base import MCPClientBase, MCPTool, get_mcp_client
 
 logger = logging.getLogger(__name__)
 
@@ -171,8 +171,8 @@ class BaseSingleAgent(ABC):
         if self.mcp_client is not None:
             return
         
-        # MCP 클라이언트 초기화
-        self.mcp_client = await create_mcp_client(
+        # 공유 MCP 클라이언트 (같은 서버/서비스의 에이전트 간 재사용)
+        self.mcp_client = await get_mcp_client(
             server_name=self.MCP_SERVER_NAME,
             service_name=self.SERVICE_NAME
         )
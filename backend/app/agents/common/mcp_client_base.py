@@ -8,7 +8,7 @@ DART 에이전트의 MCPStdioClientWrapper를 일반화.
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -68,6 +68,8 @@ class MCPClientBase:
         self._tools: List[MCPTool] = []
         self._stdio_client = None
         self._server_info: Optional[Dict[str, Any]] = None
+        self._process_generation = 0
+        self._reconnect_lock = asyncio.Lock()
     
     @property
     def is_connected(self) -> bool:
@@ -140,6 +142,7 @@ class MCPClientBase:
             existing_process = process_manager.get_process(self.server_id)
             if existing_process is None:
                 raise RuntimeError(f"Process {self.server_id} not found in process_manager")
+            self._process_generation = process_manager.get_process_generation(self.server_id)
             
             # 연결
             tools = await self._stdio_client.connect(
@@ -174,6 +177,18 @@ class MCPClientBase:
             raise RuntimeError("Not connected to MCP server")
         return self._tools
     
+    @property
+    def is_stale(self) -> bool:
+        """연결 이후 프로세스가 재시작되었거나 종료되었는지 확인"""
+        from app.mcp.process_manager import process_manager
+        
+        if not self._connected:
+            return True
+        process = process_manager.get_process(self.server_id)
+        if process is None or process.returncode is not None:
+            return True
+        return self._process_generation != process_manager.get_process_generation(self.server_id)
+    
     @property
     def tool_count(self) -> int:
         """도구 수"""
@@ -187,15 +202,29 @@ class MCPClientBase:
         return tools
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> MCPToolCall:
-        """도구 호출"""
+        """도구 호출 (조회성 도구는 결과 캐시 사용)"""
         from app.mcp.process_manager import process_manager
+        from app.mcp.result_cache import tool_result_cache
+        from app.mcp.stdio_client import MCPToolError
         
         if not self._connected or not self._stdio_client:
             raise RuntimeError("Not connected to MCP server")
         
         start_time = datetime.now()
         
+        cached = await tool_result_cache.get(self.server_id, tool_name, arguments)
+        if cached is not None:
+            logger.debug(f"[{self.service_name}] Tool {tool_name} served from result cache")
+            return MCPToolCall(name=tool_name, result=cached, error=None)
+        
         try:
+            # 프로세스가 재시작되었으면 새 프로세스로 다시 연결 (initialize + 도구 목록 갱신)
+            if self.is_stale:
+                async with self._reconnect_lock:
+                    if self.is_stale:
+                        logger.info(f"[{self.service_name}] MCP server process changed, reconnecting: {self.server_id}")
+                        await self.connect()
+            
             # 연결 상태 확인 및 재연결
             if not self._stdio_client.is_connected():
                 command = self._server_info.get('command')
@@ -251,11 +280,21 @@ class MCPClientBase:
             latency_ms = (datetime.now() - start_time).total_seconds() * 1000
             logger.debug(f"[{self.service_name}] Tool {tool_name} completed in {latency_ms:.1f}ms")
             
+            await tool_result_cache.set(self.server_id, tool_name, arguments, result)
+            
             return MCPToolCall(
                 name=tool_name,
                 result=result,
                 error=None
             )
+        except MCPToolError as e:
+            # 도구 오류 결과(isError)는 캐시하지 않음
+            logger.warning(f"[{self.service_name}] Tool {tool_name} returned an error: {e}")
+            return MCPToolCall(
+                name=tool_name,
+                result=None,
+                error=str(e)
+            )
         except Exception as e:
             logger.error(f"[{self.service_name}] Failed to call tool {tool_name}: {e}", exc_info=True)
             return MCPToolCall(
@@ -271,6 +310,131 @@ class MCPClientBase:
         logger.info(f"[{self.service_name}] Disconnected from MCP server: {self.server_id}")
 
 
+async def _resolve_server_id(server_name: str) -> str:
+    """서버 이름으로 MCP 서버 ID 조회"""
+    from app.services.mcp_service import mcp_service
+    
+    servers = await mcp_service.list_servers()
+    for server in servers.get("servers", []):
+        if server.get("name") == server_name:
+            return server.get("id")
+    
+    raise RuntimeError(f"MCP server not found: {server_name}")
+
+
+class MCPClientRegistry:
+    """
+    프로세스 전역 MCP 클라이언트 레지스트리.
+    
+    (서버 이름, 서비스 이름)마다 연결된 MCPClientBase 하나를 공유합니다.
+    그래프 노드가 실행될 때마다 DB 조회, 프로세스 확인, tools/list를 반복하지 않도록
+    연결된 클라이언트를 재사용하고, ProcessManager가 프로세스 (재)시작을 알리면
+    해당 서버의 항목을 무효화해 다음 조회 때 다시 연결합니다.
+    
+    Example:
+        client = await get_mcp_client("mcp-kr-legislation", "agent-legislation")
+        result = await client.call_tool("search_law_unified", {"query": "민법"})
+    """
+    
+    def __init__(self):
+        self._clients: Dict[Tuple[str, str], MCPClientBase] = {}
+        self._server_ids: Dict[str, str] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._listening = False
+    
+    def _ensure_listener(self) -> None:
+        """ProcessManager (재)시작 알림 구독 (최초 1회)"""
+        if self._listening:
+            return
+        from app.mcp.process_manager import process_manager
+        process_manager.add_start_listener(self.invalidate)
+        self._listening = True
+    
+    async def get_client(
+        self,
+        server_name: str,
+        service_name: str = "agent-mcp"
+    ) -> MCPClientBase:
+        """
+        연결된 MCP 클라이언트 반환 (없거나 무효화되었으면 연결).
+        
+        Args:
+            server_name: MCP 서버 이름 (예: "mcp-kr-legislation")
+            service_name: 서비스 이름 (OTEL 트레이싱용)
+        
+        Returns:
+            연결된 MCP 클라이언트
+        """
+        self._ensure_listener()
+        key = (server_name, service_name)
+        
+        client = self._clients.get(key)
+        if client is not None and not client.is_stale:
+            return client
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            client = self._clients.get(key)
+            if client is not None and not client.is_stale:
+                return client
+            
+            server_id = self._server_ids.get(server_name)
+            if server_id is None:
+                server_id = await _resolve_server_id(server_name)
+                self._server_ids[server_name] = server_id
+            
+            if client is None:
+                client = MCPClientBase(server_id=server_id, service_name=service_name)
+            try:
+                await client.connect()
+            except Exception:
+                # 서버가 삭제/변경되었을 수 있으므로 이름 매핑도 다시 조회
+                self._clients.pop(key, None)
+                self._server_ids.pop(server_name, None)
+                raise
+            
+            self._clients[key] = client
+            logger.info(f"[{service_name}] Registered shared MCP client: {server_name}")
+            return client
+    
+    def invalidate(self, server_id: Optional[str] = None) -> None:
+        """
+        서버의 공유 클라이언트 무효화 (None이면 전체).
+        
+        다음 get_client 호출 때 다시 연결합니다.
+        
+        Args:
+            server_id: MCP 서버 ID
+        """
+        for key, client in list(self._clients.items()):
+            if server_id is None or client.server_id == server_id:
+                del self._clients[key]
+        for server_name, cached_id in list(self._server_ids.items()):
+            if server_id is None or cached_id == server_id:
+                del self._server_ids[server_name]
+
+
+# Singleton 인스턴스
+mcp_client_registry = MCPClientRegistry()
+
+
+async def get_mcp_client(
+    server_name: str,
+    service_name: str = "agent-mcp"
+) -> MCPClientBase:
+    """
+    공유 레지스트리에서 연결된 MCP 클라이언트 조회
+    
+    Args:
+        server_name: MCP 서버 이름 (예: "mcp-kr-legislation")
+        service_name: 서비스 이름 (OTEL 트레이싱용)
+    
+    Returns:
+        연결된 MCP 클라이언트 (같은 서버/서비스 호출 간 공유)
+    """
+    return await mcp_client_registry.get_client(server_name, service_name)
+
+
 async def create_mcp_client(
     server_name: str,
     service_name: str = "agent-mcp"
@@ -285,18 +449,8 @@ async def create_mcp_client(
     Returns:
         연결된 MCP 클라이언트
     """
-    from app.services.mcp_service import mcp_service
-    
     # 서버 이름으로 ID 조회
-    servers = await mcp_service.list_servers()
-    server_id = None
-    for server in servers.get("servers", []):
-        if server.get("name") == server_name:
-            server_id = server.get("id")
-            break
-    
-    if not server_id:
-        raise RuntimeError(f"MCP server not found: {server_name}")
+    server_id = await _resolve_server_id(server_name)
     
     client = MCPClientBase(server_id=server_id, service_name=service_name)
     await client.connect()
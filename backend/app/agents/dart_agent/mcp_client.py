@@ -25,9 +25,10 @@ from app.agents.dart_agent.metrics import start_tool_call_span, inject_context_t
 logger = logging.getLogger(__name__)
 
 # stdio MCP 클라이언트 import
-from app.mcp.stdio_client import MCPStdioClient
+from app.mcp.stdio_client import MCPStdioClient, MCPToolError
 from app.mcp.process_manager import process_manager
 from app.mcp.http_adapter import http_adapter
+from app.mcp.result_cache import tool_result_cache
 
 
 # =============================================================================
@@ -247,6 +248,15 @@ class MCPStdioClientWrapper:
         
         # OTEL span으로 도구 호출 기록 (parent context 전달)
         with start_tool_call_span(tool_name, arguments, parent_carrier=current_carrier if current_carrier else None) as (span, record_result):
+            # 조회성 도구는 결과 캐시 확인
+            cached = await tool_result_cache.get(self.server_id, tool_name, arguments)
+            if cached is not None:
+                if hasattr(span, "set_attribute"):
+                    span.set_attribute("gen_ai.tool.cache_hit", True)
+                latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+                record_result({"result": str(cached)[:500], "latency_ms": latency_ms})
+                return MCPToolCall(name=tool_name, result=cached, error=None)
+            
             try:
                 # stdio 클라이언트를 통해 도구 호출
                 # MCPStdioClient는 call_tool 메서드를 사용
@@ -316,11 +326,23 @@ class MCPStdioClientWrapper:
                 latency_ms = (datetime.now() - start_time).total_seconds() * 1000
                 record_result({"result": str(result)[:500], "latency_ms": latency_ms})
                 
+                await tool_result_cache.set(self.server_id, tool_name, arguments, result)
+                
                 return MCPToolCall(
                     name=tool_name,
                     result=result,
                     error=None
                 )
+            except MCPToolError as e:
+                # 도구 오류 결과(isError)는 캐시하지 않음
+                logger.warning(f"Tool {tool_name} returned an error: {e}")
+                latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+                record_result({"error": str(e), "latency_ms": latency_ms})
+                return MCPToolCall(
+                    name=tool_name,
+                    result=None,
+                    error=str(e)
+                )
             except Exception as e:
                 logger.error(f"Failed to call tool {tool_name}: {e}", exc_info=True)
                 latency_ms = (datetime.now() - start_time).total_seconds() * 1000
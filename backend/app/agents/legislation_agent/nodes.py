@@ -24,7 +24,7 @@ from .metrics import (
     inject_context_to_carrier,
     record_tool_call
 )
-from app.agents.common.mcp_client_base import create_mcp_client
+from app.agents.common.mcp_client_base import get_mcp_client
 
 logger = logging.getLogger(__name__)
 
@@ -219,12 +219,11 @@ async def search_laws_node(state: LegislationAgentState) -> LegislationAgentStat
         start_time = time.time()
         
         try:
-            # MCP 클라이언트 생성
-            mcp_client = await create_mcp_client(
+            # 공유 MCP 클라이언트 (이미 연결된 클라이언트 재사용)
+            mcp_client = await get_mcp_client(
                 server_name=MCP_SERVER_NAME,
                 service_name=SERVICE_NAME
             )
-            await mcp_client.connect()
             
             # 계획에서 검색 키워드 추출
             plan = state.get("plan", {})
@@ -334,12 +333,11 @@ async def get_details_node(state: LegislationAgentState) -> LegislationAgentStat
                 logger.warning("법령 ID/이름이 없어 상세 정보 조회 건너뜀")
                 return state
             
-            # MCP 클라이언트 생성
-            mcp_client = await create_mcp_client(
+            # 공유 MCP 클라이언트 (이미 연결된 클라이언트 재사용)
+            mcp_client = await get_mcp_client(
                 server_name=MCP_SERVER_NAME,
                 service_name=SERVICE_NAME
             )
-            await mcp_client.connect()
             
             # 법령 상세 정보 조회
             # MCP 도구: get_law_summary (요약), get_law_detail (상세)
@@ -172,11 +172,12 @@ async def dialect_resolver(state: SqlAgentState) -> SqlAgentState:
 
 async def schema_selector(state: SqlAgentState) -> SqlAgentState:
     """
-    스키마 메타데이터 조회.
+    질문과 관련된 스키마 선택.
     
     책임:
-    - connection_id로 스키마 조회
-    - 스키마를 프롬프트용 문자열로 포맷
+    - connection_id의 스키마 인덱스(BM25 + 임베딩)로 질문과 관련된 테이블/컬럼 선택
+      (외래키로 연결된 조인 이웃 테이블 포함)
+    - 선택한 스키마를 프롬프트용 문자열로 포맷
     
     OTEL:
     - span: "text2sql.schema_selector" (parent: dialect_resolver)
@@ -188,8 +189,10 @@ async def schema_selector(state: SqlAgentState) -> SqlAgentState:
         try:
             from app.services.datacloud_service import datacloud_service
             
-            # 스키마 메타데이터 조회
-            schema = await datacloud_service.get_schema_metadata(state["connection_id"])
+            # 질문과 관련된 테이블/컬럼 조회
+            schema = await datacloud_service.select_relevant_schema(
+                state["connection_id"], state["question"]
+            )
             
             if not schema or "error" in schema:
                 state["execution_error"] = schema.get("error", "Failed to fetch schema")
@@ -201,26 +204,42 @@ async def schema_selector(state: SqlAgentState) -> SqlAgentState:
             tables = schema.get("tables", [])
             
             schema_lines = []
-            for table in tables[:20]:  # 최대 20개 테이블
+            relations = []
+            for table in tables:
                 table_name = table.get("name", "unknown")
                 columns = table.get("columns", [])
                 
                 col_defs = []
-                for col in columns[:30]:  # 테이블당 최대 30개 컬럼
+                for col in columns:
                     col_name = col.get("name", "")
                     col_type = col.get("type", "")
                     pk = " (PK)" if col.get("primary_key") or col.get("is_primary_key") else ""
-                    fk = " (FK)" if col.get("foreign_key") or col.get("is_foreign_key") else ""
-                    col_defs.append(f"  - {col_name}: {col_type}{pk}{fk}")
+                    fk_ref = col.get("foreign_key_ref")
+                    if fk_ref:
+                        fk = f" (FK → {fk_ref})"
+                        relations.append({"from": f"{table_name}.{col_name}", "to": fk_ref})
+                    else:
+                        fk = " (FK)" if col.get("foreign_key") or col.get("is_foreign_key") else ""
+                    comment = f" -- {col['comment']}" if col.get("comment") else ""
+                    col_defs.append(f"  - {col_name}: {col_type}{pk}{fk}{comment}")
                 
-                schema_lines.append(f"Table: {table_name}")
+                header = f"Table: {table_name}"
+                if table.get("comment"):
+                    header += f" -- {table['comment']}"
+                if table.get("join_neighbour"):
+                    header += " (join)"
+                schema_lines.append(header)
                 schema_lines.extend(col_defs)
+                omitted = table.get("column_count", len(columns)) - len(columns)
+                if omitted > 0:
+                    schema_lines.append(f"  - ... {omitted} more columns")
                 schema_lines.append("")
             
             state["schema_summary"] = "\n".join(schema_lines)
             state["schema_graph"] = {
                 "tables": [t.get("name") for t in tables],
-                "table_count": len(tables)
+                "relations": relations,
+                "table_count": schema.get("table_count", len(tables))
             }
             
             # Latency 기록
@@ -232,7 +251,7 @@ async def schema_selector(state: SqlAgentState) -> SqlAgentState:
                 "dialect": state.get("dialect", "unknown")
             })
             
-            logger.info(f"Schema selected: {len(tables)} tables")
+            logger.info(f"Schema selected: {len(tables)} of {schema.get('table_count', len(tables))} tables")
             
             return state
             
@@ -32,6 +32,22 @@ class Settings(BaseSettings):
     CLICKHOUSE_DATABASE: str = "otel_2"
     CLICKHOUSE_USER: str = "default"
     CLICKHOUSE_PASSWORD: str = "password"
+    CLICKHOUSE_QUERY_TIMEOUT: float = 30.0  # 모니터링 쿼리 타임아웃 (초)
+    CLICKHOUSE_MAX_CONNECTIONS: int = 20  # 공유 ClickHouse HTTP keep-alive 연결 수
+    MONITORING_TRACE_SUMMARY_ENABLED: bool = True  # 트레이스 목록을 otel_trace_summary에서 조회 (테이블이 없으면 otel_traces 사용)
+    MONITORING_USAGE_ROLLUPS_ENABLED: bool = True  # 비용/토큰 추이를 otel_usage_rollup_1m/1h/1d에서 조회 (테이블이 없으면 otel_traces 사용)
+    MONITORING_DASHBOARD_CACHE_TTL: float = 15.0  # /monitoring/dashboard 결과 캐시 TTL (초, 0이면 비활성)
+    MONITORING_DASHBOARD_BUCKET_SECONDS: int = 60  # 대시보드 캐시 키의 기간 반올림 단위 (초)
+    MONITORING_REPLAY_PAGE_SIZE: int = 200  # 세션 리플레이 스트리밍 시 한 번에 읽는 스팬 수
+    MONITORING_LIVE_TAIL_INTERVAL: float = 2.0  # /monitoring/traces/live 프로젝트별 폴링 주기 (초)
+    MONITORING_LIVE_TAIL_LOOKBACK: int = 30  # 늦게 들어오는 스팬을 위해 high-water mark 이전으로 겹쳐 읽는 구간 (초)
+    MONITORING_LIVE_TAIL_BATCH_SIZE: int = 1000  # 폴링 1회 최대 스팬 수
+    MONITORING_LIVE_TAIL_QUEUE_SIZE: int = 50  # 구독자별 대기 배치 수 (초과 시 오래된 배치 버림)
+    AGENT_SPAN_EXPORT_QUEUE_SIZE: int = 10000  # 에이전트 스팬 저장 대기 큐 크기 (초과 시 버림)
+    AGENT_SPAN_EXPORT_BATCH_SIZE: int = 500  # 한 번에 INSERT할 최대 스팬 수
+    AGENT_SPAN_EXPORT_FLUSH_INTERVAL_MS: int = 1000  # 최대 flush 주기 (밀리초)
+    AGENT_SPAN_EXPORT_MAX_RETRIES: int = 3  # 배치 INSERT 실패 시 재시도 횟수 (모두 실패하면 버림)
+    AGENT_SPAN_EXPORT_RETRY_BACKOFF: float = 0.5  # 첫 재시도 대기 (초, 재시도마다 2배)
     
     # Default workspace filter
     DEFAULT_WORKSPACE_FILTER: str = "ws_default"
@@ -42,6 +58,26 @@ class Settings(BaseSettings):
     # MariaDB
     MARIADB_ROOT_PASSWORD: str = "rootpass"
     MARIADB_DATABASE: str = "agent_portal"
+    MARIADB_POOL_MIN_SIZE: int = 1  # 공유 커넥션 풀 최소 연결 수
+    MARIADB_POOL_MAX_SIZE: int = 20  # 공유 커넥션 풀 최대 연결 수
+    MARIADB_POOL_RECYCLE: int = 3600  # 이 시간(초)보다 오래된 연결은 교체 (-1이면 비활성)
+    MARIADB_POOL_PRE_PING: bool = True  # 체크아웃 시 ping으로 끊긴 연결 교체
+    
+    # DataCloud (외부 DB 직접 연결)
+    DATACLOUD_POOL_MAX_SIZE: int = 5  # connection_id별 최대 드라이버 연결 수
+    DATACLOUD_POOL_MAX_LIFETIME: float = 1800.0  # 이 시간(초)보다 오래된 풀/연결은 교체
+    DATACLOUD_POOL_IDLE_TIMEOUT: float = 300.0  # 이 시간(초) 동안 쓰지 않은 풀/연결은 닫음
+    DATACLOUD_POOL_PING_INTERVAL: float = 30.0  # 이 시간(초) 이상 쉬었던 연결은 체크아웃 시 ping
+    DATACLOUD_STREAM_BATCH_SIZE: int = 1000  # /query/stream에서 커서로 한 번에 읽고 전송하는 행 수
+    DATACLOUD_QUERY_TIMEOUT: float = 300.0  # 드라이버 호출(실행/fetch) 하나의 제한 시간(초), 초과 시 드라이버 cancel
+    DATACLOUD_SCHEMA_TIMEOUT: float = 600.0  # 스키마 메타데이터 조회 제한 시간(초)
+    DATACLOUD_SCHEMA_CONCURRENCY: int = 4  # SQLAlchemy 리플렉션 시 동시에 조회하는 테이블 수 (DATACLOUD_EXECUTOR_MAX_QUEUE 이하)
+    DATACLOUD_SCHEMA_INDEX_TOP_K: int = 15  # Text2SQL 질문당 선택하는 테이블 수 (FK 조인 이웃 제외)
+    DATACLOUD_SCHEMA_INDEX_MAX_COLUMNS: int = 30  # 선택한 테이블당 프롬프트에 넣는 최대 컬럼 수
+    DATACLOUD_SCHEMA_INDEX_NEIGHBOURS: int = 10  # 외래키로 추가하는 조인 이웃 테이블 최대 수
+    DATACLOUD_SCHEMA_EMBEDDING_MODEL: str = "text-embedding-3-small"  # LiteLLM 임베딩 모델 (빈 값이면 BM25만 사용)
+    DATACLOUD_EXECUTOR_MAX_WORKERS: int = 4  # 동기 드라이버(dialect)별 전용 스레드 수
+    DATACLOUD_EXECUTOR_MAX_QUEUE: int = 32  # dialect별 최대 대기+실행 호출 수 (초과 시 즉시 실패)
     
     # News Data
     # 로컬 PC: /Users/lchangoo/Workspace/mcp-naver-news/src/data
@@ -55,6 +91,24 @@ class Settings(BaseSettings):
     MCP_STORAGE_PATH: str = "/data/mcp"  # Docker 볼륨 경로
     MCP_PROCESS_TIMEOUT: int = 30  # 프로세스 시작 타임아웃
     MCP_MAX_LOG_LINES: int = 1000  # 최대 로그 라인 수
+    MCP_MAX_IN_FLIGHT_REQUESTS: int = 16  # 서버별 동시 진행 요청 수
+    MCP_STDIN_WRITE_BUFFER_LIMIT: int = 1024 * 1024  # stdin 쓰기 버퍼 한도 (초과 시 back-pressure)
+    MCP_PROCESS_POOL_SERVERS: str = ""  # 프로세스 풀을 사용할 stdio 서버 이름/ID (쉼표 구분, 비우면 비활성)
+    MCP_PROCESS_POOL_MIN_SIZE: int = 1  # 서버별 최소(사전 기동) 워커 수
+    MCP_PROCESS_POOL_MAX_SIZE: int = 4  # 서버별 최대 워커 수
+    MCP_PROCESS_POOL_HEALTH_INTERVAL: int = 10  # 워커 헬스 체크 주기 (초)
+    MCP_TOOL_RESULT_CACHE_ENABLED: bool = True  # 조회성 MCP 도구 결과 캐시
+    MCP_TOOL_RESULT_CACHE_TTLS: str = ""  # 도구별 TTL 추가/변경 ("tool:초,tool:초", 0이면 캐시 제외)
+    MCP_TOOL_RESULT_CACHE_MAX_ENTRIES: int = 5000  # 메모리 LRU 최대 항목 수
+    MCP_TOOL_RESULT_CACHE_DIR: str = ""  # 디스크 캐시 경로 (비우면 메모리만 사용)
+    MCP_CALL_LOG_QUEUE_SIZE: int = 10000  # mcp_call_logs 대기 큐 크기 (초과 시 버림)
+    MCP_CALL_LOG_BATCH_SIZE: int = 200  # 한 번에 INSERT할 최대 행 수
+    MCP_CALL_LOG_FLUSH_INTERVAL_MS: int = 500  # 최대 flush 주기 (밀리초)
+    MCP_CALL_LOG_WRITE_TIMEOUT: int = 5  # 배치 INSERT 타임아웃 (초, 초과 시 버림)
+    MCP_METADATA_CACHE_SERVER_TTL: float = 30.0  # proxy_mcp 서버 레코드 캐시 TTL (초, 0이면 비활성)
+    MCP_METADATA_CACHE_PERMISSION_TTL: float = 30.0  # proxy_mcp 권한 확인 캐시 TTL (초, 0이면 비활성)
+    MCP_METADATA_CACHE_REDIS_URL: str = ""  # 워커 간 캐시 무효화 채널 (예: redis://:pass@redis:6379/0, 비우면 로컬만)
+    MCP_METADATA_CACHE_CHANNEL: str = "mcp:metadata:invalidate"  # 무효화 pub/sub 채널 이름
     
     def get_news_data_path(self) -> str:
         """환경에 따른 뉴스 데이터 경로 반환.
@@ -2,6 +2,7 @@
 import logging
 import os
 import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -36,10 +37,64 @@ except Exception as e:
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: 공유 리소스 기동/정리."""
+    from app.mcp.process_pool import pool_manager
+    from app.services.mcp_service import mcp_service
+    from app.services.db_pool import db_pool_manager
+    from app.services.mcp_metadata_cache import mcp_metadata_cache
+    from app.services.clickhouse_client import clickhouse_client
+    from app.services.trace_live_tail import trace_live_tail
+    from app.services.agent_trace_adapter import agent_trace_adapter
+    from app.services.datacloud_pool import datacloud_pool_registry
+    from app.services.datacloud_executor import datacloud_executors
+    from app.services.datacloud_schema_index import schema_index_registry
+    
+    # 서비스 공유 MariaDB 커넥션 풀
+    await db_pool_manager.start()
+    
+    # 모니터링 ClickHouse keep-alive 클라이언트
+    await clickhouse_client.start()
+    trace_live_tail.start()
+    
+    # DataCloud 외부 DB warm 드라이버 풀 (connection_id별, 첫 쿼리 시 생성)
+    # 동기 드라이버는 dialect별 전용 스레드 풀에서 실행
+    datacloud_executors.configure_from_settings()
+    # Text2SQL 스키마 인덱스 (스키마 캐시 갱신 시 connection_id별로 구성)
+    schema_index_registry.configure_from_settings()
+    await datacloud_pool_registry.start()
+    
+    # proxy_mcp 메타데이터 캐시 (워커 간 무효화 채널 구독)
+    await mcp_metadata_cache.start()
+    
+    # stdio MCP 프로세스 풀 사전 기동 (MCP_PROCESS_POOL_SERVERS 설정 시)
+    try:
+        await mcp_service.prewarm_stdio_pools()
+    except Exception as e:
+        logger.error(f"❌ stdio MCP process pool pre-warm failed: {e}")
+    
+    yield
+    
+    await pool_manager.shutdown()
+    # 대기 중인 mcp_call_logs 기록
+    await mcp_service.call_log_writer.stop()
+    # 대기 중인 에이전트 스팬 기록 (ClickHouse 클라이언트/MariaDB 풀을 닫기 전에)
+    await agent_trace_adapter.span_exporter.stop()
+    await mcp_metadata_cache.stop()
+    await trace_live_tail.stop()
+    await datacloud_pool_registry.close()
+    datacloud_executors.shutdown()
+    await clickhouse_client.close()
+    await db_pool_manager.close()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     description="Agent Portal Backend for Frontend (BFF) - Chat, Observability, and Admin Tools",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
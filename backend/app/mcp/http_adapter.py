@@ -11,7 +11,7 @@ from typing import Dict, Any, Optional
 from fastapi import Request, Response, HTTPException
 from fastapi.responses import JSONResponse
 
-from .stdio_client import MCPStdioClient
+from .stdio_client import MCPStdioClient, MCPToolError
 
 logger = logging.getLogger(__name__)
 
@@ -85,17 +85,18 @@ class HTTPAdapter:
             # Connect if not connected
             # For stdio MCP, we need to connect to the existing process, not start a new one
             if not client.is_connected():
-                # Check if process is already running via ProcessManager
-                from app.mcp.process_manager import process_manager
-                existing_process = process_manager.get_process(server_id)
-                
-                if existing_process and existing_process.returncode is None:
-                    # Process is already running, connect to it
-                    # Note: stdio_client will start a new process, so we need a different approach
-                    # For now, we'll still use connect but it should reuse if possible
-                    logger.info(f"Process {server_id} already running, connecting to it")
-                
-                await client.connect(command, cwd, env, reuse_existing_process=True)
+                # 동시 요청이 각각 connect하지 않도록 연결만 직렬화 (요청 자체는 세션에서 병렬 처리)
+                async with self._client_locks.setdefault(server_id, asyncio.Lock()):
+                    if not client.is_connected():
+                        # Check if process is already running via ProcessManager
+                        from app.mcp.process_manager import process_manager
+                        existing_process = process_manager.get_process(server_id)
+                        
+                        if existing_process and existing_process.returncode is None:
+                            # Process is already running, connect to it
+                            logger.info(f"Process {server_id} already running, connecting to it")
+                        
+                        await client.connect(command, cwd, env, reuse_existing_process=True)
             
             # Route request based on path
             path = request.url.path
@@ -225,6 +226,16 @@ class HTTPAdapter:
         
         except HTTPException:
             raise
+        except MCPToolError as e:
+            # 도구 오류는 MCP 규약대로 isError 결과로 전달
+            return JSONResponse({
+                "jsonrpc": "2.0",
+                "id": payload.get("id"),
+                "result": {
+                    "content": e.content,
+                    "isError": True
+                }
+            })
         except Exception as e:
             logger.error(f"Error handling request for {server_id}: {e}", exc_info=True)
             return JSONResponse(
@@ -0,0 +1,128 @@
+"""
+OTEL Metrics for stdio MCP Servers
+
+stdio MCP 프로세스 관리(버퍼, 요청 라우팅 등)용 metrics 헬퍼 함수들.
+"""
+
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# OTEL meter는 telemetry/otel.py에서 초기화
+_meter = None
+_counters = {}
+_histograms = {}
+_up_down_counters = {}
+
+
+def _get_meter():
+    """Meter 인스턴스 획득 (지연 초기화)."""
+    global _meter
+    if _meter is None:
+        try:
+            from app.telemetry.otel import get_meter
+            _meter = get_meter("mcp")
+        except ImportError:
+            logger.warning("OTEL meter not available, using no-op")
+            _meter = _NoOpMeter()
+    return _meter
+
+
+class _NoOpMeter:
+    """No-op meter for when OTEL is not available."""
+    def create_counter(self, name, **kwargs):
+        return _NoOpCounter()
+    
+    def create_histogram(self, name, **kwargs):
+        return _NoOpHistogram()
+    
+    def create_up_down_counter(self, name, **kwargs):
+        return _NoOpCounter()
+
+
+class _NoOpCounter:
+    """No-op counter."""
+    def add(self, value, attributes=None):
+        pass
+
+
+class _NoOpHistogram:
+    """No-op histogram."""
+    def record(self, value, attributes=None):
+        pass
+
+
+def record_counter(name: str, attributes: Optional[Dict[str, str]] = None, value: int = 1):
+    """
+    Counter 기록.
+    
+    Args:
+        name: Counter 이름 (예: "mcp_stdout_buffer_evicted_total")
+        attributes: 태그/라벨
+        value: 증가량 (기본 1)
+    """
+    try:
+        meter = _get_meter()
+        
+        if name not in _counters:
+            _counters[name] = meter.create_counter(
+                name,
+                description=f"Counter for {name}"
+            )
+        
+        _counters[name].add(value, attributes=attributes)
+    
+    except Exception as e:
+        logger.debug(f"Failed to record counter {name}: {e}")
+
+
+def record_histogram(name: str, value: float, attributes: Optional[Dict[str, str]] = None):
+    """
+    Histogram 기록.
+    
+    Args:
+        name: Histogram 이름 (예: "mcp_request_latency_ms")
+        value: 기록할 값
+        attributes: 태그/라벨
+    """
+    try:
+        meter = _get_meter()
+        
+        if name not in _histograms:
+            _histograms[name] = meter.create_histogram(
+                name,
+                description=f"Histogram for {name}"
+            )
+        
+        _histograms[name].record(value, attributes=attributes)
+    
+    except Exception as e:
+        logger.debug(f"Failed to record histogram {name}: {e}")
+
+
+def record_up_down(name: str, value: int, attributes: Optional[Dict[str, str]] = None):
+    """
+    UpDownCounter 기록 (버퍼 크기처럼 증감하는 값).
+    
+    Args:
+        name: UpDownCounter 이름 (예: "mcp_stdout_buffer_messages")
+        value: 증감량 (음수 가능)
+        attributes: 태그/라벨
+    """
+    if not value:
+        return
+    
+    try:
+        meter = _get_meter()
+        
+        if name not in _up_down_counters:
+            _up_down_counters[name] = meter.create_up_down_counter(
+                name,
+                description=f"UpDownCounter for {name}"
+            )
+        
+        _up_down_counters[name].add(value, attributes=attributes)
+    
+    except Exception as e:
+        logger.debug(f"Failed to record up/down counter {name}: {e}")
@@ -5,14 +5,18 @@ Manages the lifecycle of stdio-based MCP server processes.
 """
 
 import os
+import time
 import asyncio
 import logging
 import signal
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Deque, Tuple, Callable
 from enum import Enum
 import json
 
+from .metrics import record_counter, record_up_down
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +28,131 @@ class ProcessStatus(Enum):
     ERROR = "error"
 
 
+class MessageBuffer:
+    """Bounded buffer for unmatched JSON-RPC messages of one stdio server.
+    
+    대기 중인 요청이 없는 메시지(알림, 타임아웃 이후 도착한 응답 등)만 보관합니다.
+    메시지는 consume()으로 꺼내면 제거되고, 개수/바이트/보관 시간 한도를
+    넘으면 오래된 것부터 버려집니다. 크기는 OTEL 메트릭으로 보고합니다.
+    """
+    
+    def __init__(
+        self,
+        server_id: str,
+        max_messages: int = 1000,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_age: float = 300.0
+    ):
+        """Initialize message buffer.
+        
+        Args:
+            server_id: Server ID (metric attribute)
+            max_messages: Maximum number of buffered messages
+            max_bytes: Maximum total size of buffered messages in bytes
+            max_age: Maximum age of a buffered message in seconds
+        """
+        self.server_id = server_id
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        # (received_at, message_id, line)
+        self._messages: Deque[Tuple[float, Any, str]] = deque()
+        self._bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._messages)
+    
+    @property
+    def size_bytes(self) -> int:
+        """Total size of buffered messages in bytes."""
+        return self._bytes
+    
+    def append(self, line: str, message_id: Any = None) -> None:
+        """Add a message and evict expired/overflowing ones.
+        
+        Args:
+            line: Raw JSON-RPC line
+            message_id: JSON-RPC id (None for notifications)
+        """
+        now = time.monotonic()
+        self._messages.append((now, message_id, line))
+        self._bytes += len(line)
+        self._report(1, len(line))
+        
+        self.expire(now)
+        evicted = 0
+        while self._messages and (
+            len(self._messages) > self.max_messages or self._bytes > self.max_bytes
+        ):
+            self._pop_left()
+            evicted += 1
+        if evicted:
+            record_counter(
+                "mcp_stdout_buffer_evicted_total",
+                {"server_id": self.server_id, "reason": "size"},
+                evicted
+            )
+    
+    def consume(self, message_id: Any) -> Optional[str]:
+        """Remove and return the message with the given JSON-RPC id.
+        
+        Args:
+            message_id: JSON-RPC id
+            
+        Returns:
+            Raw JSON-RPC line or None
+        """
+        for index, (_, buffered_id, line) in enumerate(self._messages):
+            if buffered_id is not None and buffered_id == message_id:
+                del self._messages[index]
+                self._bytes -= len(line)
+                self._report(-1, -len(line))
+                return line
+        return None
+    
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop messages older than max_age.
+        
+        Args:
+            now: Current monotonic time (default: time.monotonic())
+            
+        Returns:
+            Number of expired messages
+        """
+        cutoff = (now if now is not None else time.monotonic()) - self.max_age
+        expired = 0
+        while self._messages and self._messages[0][0] < cutoff:
+            self._pop_left()
+            expired += 1
+        if expired:
+            record_counter(
+                "mcp_stdout_buffer_evicted_total",
+                {"server_id": self.server_id, "reason": "age"},
+                expired
+            )
+        return expired
+    
+    def lines(self) -> List[str]:
+        """Snapshot of buffered raw lines (oldest first)."""
+        return [line for _, _, line in self._messages]
+    
+    def clear(self) -> None:
+        """Remove all buffered messages."""
+        self._report(-len(self._messages), -self._bytes)
+        self._messages.clear()
+        self._bytes = 0
+    
+    def _pop_left(self) -> None:
+        _, _, line = self._messages.popleft()
+        self._bytes -= len(line)
+        self._report(-1, -len(line))
+    
+    def _report(self, messages: int, size: int) -> None:
+        attributes = {"server_id": self.server_id}
+        record_up_down("mcp_stdout_buffer_messages", messages, attributes)
+        record_up_down("mcp_stdout_buffer_bytes", size, attributes)
+
+
 class ProcessManager:
     """Manages stdio MCP server processes."""
     
@@ -32,8 +161,20 @@ class ProcessManager:
         self.processes: Dict[str, asyncio.subprocess.Process] = {}
         self.process_status: Dict[str, ProcessStatus] = {}
         self.process_logs: Dict[str, List[str]] = {}
-        self._stdout_buffers: Dict[str, List[str]] = {}  # JSON-RPC 메시지 버퍼
+        self._stdout_buffers: Dict[str, MessageBuffer] = {}  # 매칭되지 않은 JSON-RPC 메시지 버퍼
+        # server_id -> request_id -> 응답 대기 Future (JSON-RPC 응답 라우팅용)
+        self._pending_requests: Dict[str, Dict[Any, asyncio.Future]] = {}
+        # server_id -> 응답 전에 포기된 요청 ID (늦게 도착한 응답은 버퍼에 쌓지 않음)
+        self._abandoned_requests: Dict[str, "OrderedDict[Any, None]"] = {}
         self.max_log_lines = 1000
+        self.max_buffer_messages = 1000
+        self.max_buffer_bytes = 10 * 1024 * 1024  # 10MB
+        self.max_buffer_age = 300.0  # 5분
+        self.max_abandoned_requests = 1000
+        # server_id -> 프로세스 세대 (start_process 성공 시마다 증가)
+        self._generations: Dict[str, int] = {}
+        self._start_listeners: List[Callable[[str], None]] = []
+        self._notification_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
     
     async def start_process(
         self,
@@ -102,6 +243,8 @@ class ProcessManager:
             
             self.processes[server_id] = process
             self.process_status[server_id] = ProcessStatus.RUNNING
+            self._generations[server_id] = self._generations.get(server_id, 0) + 1
+            self._notify_start_listeners(server_id)
             
             # Increase readline buffer limit for large MCP responses (10MB)
             if process.stdout and hasattr(process.stdout, '_limit'):
@@ -128,6 +271,51 @@ class ProcessManager:
             logger.error(f"Failed to start process {server_id}: {e}")
             raise
     
+    def get_process_generation(self, server_id: str) -> int:
+        """Get process generation (incremented on every (re)start).
+        
+        Args:
+            server_id: Server ID
+            
+        Returns:
+            Generation number (0 if never started)
+        """
+        return self._generations.get(server_id, 0)
+    
+    def add_start_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback invoked with server_id whenever a process (re)starts.
+        
+        Args:
+            listener: Callback
+        """
+        if listener not in self._start_listeners:
+            self._start_listeners.append(listener)
+    
+    def _notify_start_listeners(self, server_id: str) -> None:
+        for listener in self._start_listeners:
+            try:
+                listener(server_id)
+            except Exception as e:
+                logger.warning(f"Process start listener failed for {server_id}: {e}")
+    
+    def add_notification_listener(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Register a callback invoked with (server_id, message) for server notifications.
+        
+        Args:
+            listener: Callback
+        """
+        if listener not in self._notification_listeners:
+            self._notification_listeners.append(listener)
+    
+    def _notify_notification_listeners(self, server_id: str, message: Any) -> None:
+        if not isinstance(message, dict) or "method" not in message or "id" in message:
+            return
+        for listener in self._notification_listeners:
+            try:
+                listener(server_id, message)
+            except Exception as e:
+                logger.warning(f"Notification listener failed for {server_id}: {e}")
+    
     async def _read_logs(
         self,
         server_id: str,
@@ -145,14 +333,10 @@ class ProcessManager:
         if server_id not in self.process_logs:
             self.process_logs[server_id] = []
         
-        # stdout 버퍼 (JSON-RPC 메시지와 로그를 구분하기 위해)
-        if not hasattr(self, '_stdout_buffers'):
-            self._stdout_buffers = {}
-        if server_id not in self._stdout_buffers:
-            self._stdout_buffers[server_id] = []
+        # stdout 버퍼 (대기 중인 요청이 없는 JSON-RPC 메시지용)
+        buffer = self._get_buffer(server_id)
         
         try:
-            import json
             while True:
                 if process.stdout is None:
                     break
@@ -162,20 +346,37 @@ class ProcessManager:
                     break
                 
                 line_text = line.decode('utf-8', errors='replace').rstrip()
+                stripped = line_text.strip()
                 
                 # JSON-RPC 메시지인지 확인 ({"jsonrpc": "2.0"로 시작)
-                try:
-                    if line_text.strip().startswith('{') and '"jsonrpc"' in line_text:
-                        # JSON-RPC 메시지 - 버퍼에 저장 (MCP 통신용)
-                        logger.debug(f"[DEBUG] Found JSON-RPC message for {server_id}: {line_text[:100]}")
-                        self._stdout_buffers[server_id].append(line_text)
-                        # 버퍼 크기 제한 없음 (에이전트용)
-                    else:
-                        # 일반 로그
+                if stripped.startswith('{') and '"jsonrpc"' in stripped:
+                    try:
+                        message = json.loads(stripped)
+                    except json.JSONDecodeError as e:
+                        # 파싱 실패 시 일반 로그로 처리
+                        logger.debug(f"[DEBUG] Failed to parse JSON-RPC line: {e}")
                         self._add_log(server_id, line_text)
-                except Exception as e:
-                    # 파싱 실패 시 일반 로그로 처리
-                    logger.debug(f"[DEBUG] Failed to check JSON-RPC: {e}")
+                        continue
+                    
+                    # 대기 중인 요청의 응답이면 Future로 바로 전달
+                    if self._resolve_request(server_id, message):
+                        continue
+                    
+                    # 이미 포기된 요청의 늦은 응답은 버림
+                    if self._drop_abandoned_response(server_id, message):
+                        continue
+                    
+                    # 서버 알림 (notifications/tools/list_changed 등) 구독자에게 전달
+                    self._notify_notification_listeners(server_id, message)
+                    
+                    # 매칭되지 않은 메시지 (알림 등) - 버퍼에 저장
+                    logger.debug(f"[DEBUG] Unmatched JSON-RPC message for {server_id}: {line_text[:100]}")
+                    message_id = message.get("id") if isinstance(message, dict) else None
+                    if not isinstance(message_id, (str, int)):
+                        message_id = None
+                    buffer.append(line_text, message_id)
+                else:
+                    # 일반 로그
                     self._add_log(server_id, line_text)
                 
                 # Check if process exited
@@ -189,15 +390,143 @@ class ProcessManager:
             if server_id in self.process_status:
                 if self.process_status[server_id] == ProcessStatus.RUNNING:
                     self.process_status[server_id] = ProcessStatus.STOPPED
+            # 재시작된 새 프로세스의 요청은 건드리지 않음
+            if self.processes.get(server_id) in (None, process):
+                self._fail_pending_requests(
+                    server_id,
+                    RuntimeError(f"Process {server_id} exited before responding")
+                )
             logger.info(f"Process {server_id} log reader stopped")
     
+    def register_request(self, server_id: str, request_id: Any) -> asyncio.Future:
+        """Register a pending JSON-RPC request.
+        
+        요청을 stdin에 쓰기 전에 호출해야 응답을 놓치지 않습니다.
+        
+        Args:
+            server_id: Server ID
+            request_id: JSON-RPC request ID
+            
+        Returns:
+            Future resolved with the parsed JSON-RPC response
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_requests.setdefault(server_id, {})[request_id] = future
+        return future
+    
+    def discard_request(self, server_id: str, request_id: Any) -> None:
+        """Remove a pending JSON-RPC request (after response, timeout or error).
+        
+        응답을 받기 전에 포기된 요청이면 ID를 기억해 두었다가
+        늦게 도착한 응답이 버퍼에 남지 않도록 버립니다.
+        
+        Args:
+            server_id: Server ID
+            request_id: JSON-RPC request ID
+        """
+        pending = self._pending_requests.get(server_id)
+        if pending is None:
+            return
+        future = pending.pop(request_id, None)
+        if future is None or (future.done() and not future.cancelled()):
+            return
+        
+        # 응답이 이미 버퍼에 들어와 있으면 바로 제거
+        buffer = self._stdout_buffers.get(server_id)
+        if buffer is not None and buffer.consume(request_id) is not None:
+            return
+        
+        abandoned = self._abandoned_requests.setdefault(server_id, OrderedDict())
+        abandoned[request_id] = None
+        while len(abandoned) > self.max_abandoned_requests:
+            abandoned.popitem(last=False)
+    
+    def _drop_abandoned_response(self, server_id: str, message: Any) -> bool:
+        """Drop a late response to a request that was already abandoned.
+        
+        Args:
+            server_id: Server ID
+            message: Parsed JSON-RPC message
+            
+        Returns:
+            True if the message was dropped
+        """
+        if not isinstance(message, dict) or "id" not in message:
+            return False
+        abandoned = self._abandoned_requests.get(server_id)
+        if not abandoned or not isinstance(message["id"], (str, int)) or message["id"] not in abandoned:
+            return False
+        del abandoned[message["id"]]
+        record_counter("mcp_late_responses_dropped_total", {"server_id": server_id})
+        return True
+    
+    def _resolve_request(self, server_id: str, message: Any) -> bool:
+        """Resolve the pending request matching a JSON-RPC response.
+        
+        Args:
+            server_id: Server ID
+            message: Parsed JSON-RPC message
+            
+        Returns:
+            True if the message was delivered to a waiting request
+        """
+        if not isinstance(message, dict) or "id" not in message:
+            return False
+        if "result" not in message and "error" not in message:
+            # 서버 -> 클라이언트 요청 (sampling 등)은 응답이 아님
+            return False
+        if not isinstance(message["id"], (str, int)):
+            return False
+        
+        future = self._pending_requests.get(server_id, {}).pop(message["id"], None)
+        if future is None:
+            return False
+        if not future.done():
+            future.set_result(message)
+        return True
+    
+    def _fail_pending_requests(self, server_id: str, error: Exception) -> None:
+        """Fail all pending requests for a server.
+        
+        Args:
+            server_id: Server ID
+            error: Exception to set on waiting futures
+        """
+        pending = self._pending_requests.pop(server_id, {})
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+    
+    def _get_buffer(self, server_id: str) -> MessageBuffer:
+        """Get or create the message buffer for a server.
+        
+        Args:
+            server_id: Server ID
+            
+        Returns:
+            Message buffer
+        """
+        buffer = self._stdout_buffers.get(server_id)
+        if buffer is None:
+            buffer = MessageBuffer(
+                server_id,
+                max_messages=self.max_buffer_messages,
+                max_bytes=self.max_buffer_bytes,
+                max_age=self.max_buffer_age
+            )
+            self._stdout_buffers[server_id] = buffer
+        return buffer
+    
     def get_stdout_buffers(self) -> Dict[str, List[str]]:
         """Get stdout buffers for all servers.
         
         Returns:
-            Dictionary of server_id -> list of JSON-RPC messages
+            Dictionary of server_id -> list of unmatched JSON-RPC messages
         """
-        return self._stdout_buffers
+        return {
+            server_id: buffer.lines()
+            for server_id, buffer in self._stdout_buffers.items()
+        }
     
     def get_stdout_buffer(self, server_id: str) -> List[str]:
         """Get stdout buffer for JSON-RPC messages.
@@ -206,9 +535,44 @@ class ProcessManager:
             server_id: Server ID
             
         Returns:
-            List of JSON-RPC messages
+            List of unmatched JSON-RPC messages (oldest first)
         """
-        return self._stdout_buffers.get(server_id, [])
+        buffer = self._stdout_buffers.get(server_id)
+        if buffer is None:
+            return []
+        buffer.expire()
+        return buffer.lines()
+    
+    def consume_stdout_message(self, server_id: str, message_id: Any) -> Optional[str]:
+        """Remove and return a buffered JSON-RPC message by id.
+        
+        Args:
+            server_id: Server ID
+            message_id: JSON-RPC id
+            
+        Returns:
+            Raw JSON-RPC line or None
+        """
+        buffer = self._stdout_buffers.get(server_id)
+        if buffer is None:
+            return None
+        return buffer.consume(message_id)
+    
+    def get_buffer_stats(self, server_id: str) -> Dict[str, Any]:
+        """Get stdout buffer statistics.
+        
+        Args:
+            server_id: Server ID
+            
+        Returns:
+            Buffer size in messages/bytes and number of pending requests
+        """
+        buffer = self._stdout_buffers.get(server_id)
+        return {
+            "buffered_messages": len(buffer) if buffer is not None else 0,
+            "buffered_bytes": buffer.size_bytes if buffer is not None else 0,
+            "pending_requests": len(self._pending_requests.get(server_id, {})),
+        }
     
     def clear_stdout_buffer(self, server_id: str) -> None:
         """Clear stdout buffer.
@@ -217,7 +581,7 @@ class ProcessManager:
             server_id: Server ID
         """
         if server_id in self._stdout_buffers:
-            self._stdout_buffers[server_id] = []
+            self._stdout_buffers[server_id].clear()
     
     def _add_log(self, server_id: str, log_line: str) -> None:
         """Add log line to buffer.
@@ -385,6 +749,9 @@ class ProcessManager:
             del self.process_logs[server_id]
         if server_id in self.process_status:
             del self.process_status[server_id]
+        if server_id in self._stdout_buffers:
+            self._stdout_buffers.pop(server_id).clear()
+        self._abandoned_requests.pop(server_id, None)
 
 
 # Singleton instance
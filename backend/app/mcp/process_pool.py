@@ -0,0 +1,344 @@
+"""
+Process Pool for stdio MCP Servers
+
+Optional pool of pre-warmed worker processes per stdio MCP server.
+
+- 워커 0은 기존 단일 프로세스(server_id)이고, 추가 워커는 "{server_id}#{n}"으로
+  ProcessManager에 등록됩니다 (응답 라우팅/버퍼/세션을 그대로 재사용).
+- 요청은 진행 중인 요청 수가 가장 적은 워커로 보냅니다.
+- 모든 워커가 바쁘면 max_size까지 워커를 늘립니다.
+- 주기적인 헬스 체크로 죽은 워커를 교체하고 min_size를 유지합니다.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional, List
+
+from .process_manager import process_manager
+from .session import session_manager, StdioSession
+from .metrics import record_counter
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPool:
+    """Pool of worker processes for one stdio MCP server."""
+    
+    def __init__(
+        self,
+        server_id: str,
+        command: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        min_size: int = 1,
+        max_size: int = 4,
+        health_interval: float = 10.0
+    ):
+        """Initialize process pool.
+        
+        Args:
+            server_id: Server ID
+            command: Command to execute
+            cwd: Working directory
+            env: Environment variables
+            min_size: Number of workers kept running
+            max_size: Maximum number of workers
+            health_interval: Health check interval in seconds
+        """
+        if min_size < 1 or max_size < min_size:
+            raise ValueError("Pool size must satisfy 1 <= min_size <= max_size")
+        
+        self.server_id = server_id
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.min_size = min_size
+        self.max_size = max_size
+        self.health_interval = health_interval
+        
+        self._workers: List[str] = []
+        self._lock = asyncio.Lock()
+        self._scale_task: Optional[asyncio.Task] = None
+        self._health_task: Optional[asyncio.Task] = None
+    
+    def _worker_id(self, index: int) -> str:
+        """Worker ID for a pool slot (slot 0 is the primary process)."""
+        return self.server_id if index == 0 else f"{self.server_id}#{index}"
+    
+    @property
+    def size(self) -> int:
+        """Number of workers in the pool."""
+        return len(self._workers)
+    
+    def _is_running(self, worker_id: str) -> bool:
+        process = process_manager.get_process(worker_id)
+        return process is not None and process.returncode is None
+    
+    async def _start_worker(self, worker_id: str) -> None:
+        """Start (or adopt) a worker process and run the initialize handshake.
+        
+        Args:
+            worker_id: Worker ID
+        """
+        if not self._is_running(worker_id):
+            await process_manager.start_process(
+                server_id=worker_id,
+                command=self.command,
+                cwd=self.cwd,
+                env=self.env
+            )
+        
+        response = await session_manager.get_session(worker_id).initialize()
+        if "error" in response:
+            raise RuntimeError(f"MCP initialize error on {worker_id}: {response['error']}")
+    
+    async def start(self) -> None:
+        """Pre-warm min_size workers and start the health check loop."""
+        async with self._lock:
+            slots = [self._worker_id(i) for i in range(self.min_size)]
+            results = await asyncio.gather(
+                *(self._start_worker(worker_id) for worker_id in slots),
+                return_exceptions=True
+            )
+            for worker_id, result in zip(slots, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to start pool worker {worker_id}: {result}")
+                    continue
+                self._workers.append(worker_id)
+        
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+        
+        logger.info(f"Process pool {self.server_id} started with {self.size}/{self.max_size} workers")
+    
+    async def select_session(self) -> StdioSession:
+        """Pick the least-loaded initialized worker.
+        
+        Returns:
+            Session of the selected worker
+        
+        Raises:
+            RuntimeError: If no worker is available
+        """
+        candidates = [
+            session_manager.get_session(worker_id)
+            for worker_id in self._workers
+            if self._is_running(worker_id)
+        ]
+        ready = [session for session in candidates if session.is_initialized]
+        
+        if not ready:
+            if not candidates:
+                # 모든 워커가 죽었으면 헬스 체크를 기다리지 않고 바로 교체
+                await self.health_check()
+                candidates = [
+                    session_manager.get_session(worker_id)
+                    for worker_id in self._workers
+                    if self._is_running(worker_id)
+                ]
+                if not candidates:
+                    raise RuntimeError(f"No running workers in process pool {self.server_id}")
+            # 재시작된 프로세스는 initialize 후 사용
+            session = candidates[0]
+            await session.initialize()
+            return session
+        
+        session = min(ready, key=lambda s: s.in_flight)
+        
+        # 가장 한가한 워커도 바쁘면 워커 추가 (현재 요청은 기다리지 않음)
+        if session.in_flight > 0 and self.size < self.max_size:
+            if self._scale_task is None or self._scale_task.done():
+                self._scale_task = asyncio.create_task(self._scale_up())
+        
+        return session
+    
+    async def _scale_up(self) -> None:
+        """Add one worker if the pool is below max_size."""
+        async with self._lock:
+            if self.size >= self.max_size:
+                return
+            used = set(self._workers)
+            index = next(i for i in range(self.max_size) if self._worker_id(i) not in used)
+            worker_id = self._worker_id(index)
+            try:
+                await self._start_worker(worker_id)
+            except Exception as e:
+                logger.error(f"Failed to scale up process pool {self.server_id}: {e}")
+                return
+            self._workers.append(worker_id)
+            record_counter("mcp_pool_workers_started_total", {"server_id": self.server_id, "reason": "scale_up"})
+            logger.info(f"Process pool {self.server_id} scaled up to {self.size} workers")
+    
+    async def health_check(self) -> None:
+        """Replace dead workers and keep at least min_size workers."""
+        async with self._lock:
+            for worker_id in list(self._workers):
+                if self._is_running(worker_id):
+                    if not session_manager.get_session(worker_id).is_initialized:
+                        # 외부에서 재시작된 워커 (restart_stdio_process 등)
+                        try:
+                            await session_manager.get_session(worker_id).initialize()
+                        except Exception as e:
+                            logger.error(f"Failed to initialize pool worker {worker_id}: {e}")
+                    continue
+                logger.warning(f"Pool worker {worker_id} is not running, replacing")
+                try:
+                    await self._start_worker(worker_id)
+                    record_counter("mcp_pool_workers_started_total", {"server_id": self.server_id, "reason": "replace"})
+                except Exception as e:
+                    logger.error(f"Failed to replace pool worker {worker_id}: {e}")
+            
+            index = 0
+            while self.size < self.min_size and index < self.max_size:
+                worker_id = self._worker_id(index)
+                index += 1
+                if worker_id in self._workers:
+                    continue
+                try:
+                    await self._start_worker(worker_id)
+                    self._workers.append(worker_id)
+                except Exception as e:
+                    logger.error(f"Failed to start pool worker {worker_id}: {e}")
+    
+    async def _health_loop(self) -> None:
+        """Periodic health check."""
+        while True:
+            try:
+                await asyncio.sleep(self.health_interval)
+                await self.health_check()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Process pool {self.server_id} health check failed: {e}")
+    
+    async def stop(self) -> None:
+        """Stop the health check loop and the extra workers.
+        
+        워커 0(기존 단일 프로세스)은 mcp_service가 관리하므로 종료하지 않습니다.
+        """
+        for task in (self._health_task, self._scale_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._health_task = None
+        self._scale_task = None
+        
+        async with self._lock:
+            for worker_id in self._workers:
+                if worker_id == self.server_id:
+                    continue
+                try:
+                    await process_manager.cleanup(worker_id)
+                except Exception as e:
+                    logger.warning(f"Error stopping pool worker {worker_id}: {e}")
+                session_manager.remove_session(worker_id)
+            self._workers = []
+    
+    def stats(self) -> Dict[str, Any]:
+        """Pool statistics.
+        
+        Returns:
+            Pool size limits and per-worker state
+        """
+        return {
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "workers": [
+                {
+                    "worker_id": worker_id,
+                    "pid": process_manager.get_process_pid(worker_id),
+                    "in_flight": session_manager.get_session(worker_id).in_flight,
+                }
+                for worker_id in self._workers
+            ],
+        }
+
+
+class ProcessPoolManager:
+    """Registry of ProcessPool per server."""
+    
+    def __init__(self):
+        """Initialize pool manager."""
+        self.pools: Dict[str, ProcessPool] = {}
+    
+    def get_pool(self, server_id: str) -> Optional[ProcessPool]:
+        """Get the pool for a server (None if pooling is not enabled).
+        
+        Args:
+            server_id: Server ID
+        
+        Returns:
+            Process pool or None
+        """
+        return self.pools.get(server_id)
+    
+    async def create_pool(
+        self,
+        server_id: str,
+        command: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        min_size: int = 1,
+        max_size: int = 4,
+        health_interval: float = 10.0
+    ) -> ProcessPool:
+        """Create and pre-warm a pool for a server.
+        
+        Args:
+            server_id: Server ID
+            command: Command to execute
+            cwd: Working directory
+            env: Environment variables
+            min_size: Number of workers kept running
+            max_size: Maximum number of workers
+            health_interval: Health check interval in seconds
+        
+        Returns:
+            Started process pool
+        """
+        await self.remove_pool(server_id)
+        
+        pool = ProcessPool(
+            server_id,
+            command,
+            cwd=cwd,
+            env=env,
+            min_size=min_size,
+            max_size=max_size,
+            health_interval=health_interval
+        )
+        self.pools[server_id] = pool
+        await pool.start()
+        return pool
+    
+    async def remove_pool(self, server_id: str) -> None:
+        """Stop and remove the pool for a server.
+        
+        Args:
+            server_id: Server ID
+        """
+        pool = self.pools.pop(server_id, None)
+        if pool is not None:
+            await pool.stop()
+    
+    async def select_session(self, server_id: str) -> StdioSession:
+        """Pick the session to send a request to.
+        
+        Args:
+            server_id: Server ID
+        
+        Returns:
+            Pool worker session, or the single-process session if no pool exists
+        """
+        pool = self.pools.get(server_id)
+        if pool is None:
+            return session_manager.get_session(server_id)
+        return await pool.select_session()
+    
+    async def shutdown(self) -> None:
+        """Stop every pool."""
+        for server_id in list(self.pools):
+            await self.remove_pool(server_id)
+
+
+# Singleton instance
+pool_manager = ProcessPoolManager()
@@ -0,0 +1,265 @@
+"""
+Tool Result Cache for MCP Tool Calls
+
+Caches results of idempotent (pure lookup) MCP tools.
+
+- 키: (server_id, tool_name, 정규화된 arguments JSON)의 SHA-256
+- 허용 목록에 있는 도구만 캐시하며 도구별 TTL 적용
+- 메모리 LRU (항목 수 제한) + 선택적 디스크 계층 (MCP_TOOL_RESULT_CACHE_DIR)
+- 히트/미스는 OTEL counter로 기록 (mcp_tool_result_cache_hits_total 등)
+- 호출 측이 결과를 수정해도 캐시 항목이 바뀌지 않도록 저장/조회 시 복사본 사용
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .metrics import record_counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 5000
+
+# 도구 이름 -> TTL (초). 공공 API 조회 도구처럼 같은 인자에 같은 결과를 주는 도구만 등록
+DEFAULT_TOOL_TTLS: Dict[str, float] = {
+    "get_corporation_code_by_name": 86400.0,
+    "get_corporation_info": 3600.0,
+    "get_law_summary": 86400.0,
+    "get_disclosure_list": 600.0,
+}
+
+
+def parse_tool_ttls(value: str) -> Dict[str, float]:
+    """Parse "tool:ttl,tool:ttl" into a TTL map.
+    
+    Args:
+        value: Comma-separated tool:ttl pairs
+    
+    Returns:
+        Tool name -> TTL in seconds
+    """
+    ttls: Dict[str, float] = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, ttl = item.partition(":")
+        try:
+            ttls[name.strip()] = float(ttl)
+        except ValueError:
+            logger.warning(f"Invalid tool result cache TTL entry: {item}")
+    return ttls
+
+
+def make_cache_key(server_id: str, tool_name: str, arguments: Optional[Dict[str, Any]]) -> str:
+    """Build the canonical cache key for a tool call.
+    
+    인자 순서/공백과 무관하도록 키를 정렬한 compact JSON으로 해시합니다.
+    
+    Args:
+        server_id: MCP server ID
+        tool_name: Tool name
+        arguments: Tool arguments
+    
+    Returns:
+        Hex digest
+    """
+    canonical = json.dumps(
+        arguments or {},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str
+    )
+    payload = f"{server_id}\x00{tool_name}\x00{canonical}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """디스크 계층 JSON 직렬화 (MCP SDK content 객체는 model_dump로 변환)."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ToolResultCache:
+    """LRU + TTL cache for MCP tool call results."""
+    
+    def __init__(
+        self,
+        tool_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_path: Optional[str] = None,
+        enabled: bool = True
+    ):
+        """Initialize result cache.
+        
+        Args:
+            tool_ttls: Cacheable tool name -> TTL in seconds (allow-list)
+            max_entries: Maximum number of in-memory entries
+            disk_path: Directory for the on-disk tier (None = memory only)
+            enabled: Enable caching
+        """
+        self.tool_ttls = dict(DEFAULT_TOOL_TTLS if tool_ttls is None else tool_ttls)
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self.enabled = enabled
+        
+        # key -> (expires_at, result)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        
+        if self.disk_path:
+            os.makedirs(self.disk_path, exist_ok=True)
+    
+    @classmethod
+    def from_settings(cls) -> "ToolResultCache":
+        """Create a cache configured from application settings."""
+        try:
+            from app.config import get_settings
+            settings = get_settings()
+            tool_ttls = dict(DEFAULT_TOOL_TTLS)
+            tool_ttls.update(parse_tool_ttls(settings.MCP_TOOL_RESULT_CACHE_TTLS))
+            return cls(
+                tool_ttls={name: ttl for name, ttl in tool_ttls.items() if ttl > 0},
+                max_entries=settings.MCP_TOOL_RESULT_CACHE_MAX_ENTRIES,
+                disk_path=settings.MCP_TOOL_RESULT_CACHE_DIR or None,
+                enabled=settings.MCP_TOOL_RESULT_CACHE_ENABLED
+            )
+        except Exception as e:
+            logger.warning(f"Using default tool result cache settings: {e}")
+            return cls()
+    
+    def is_cacheable(self, tool_name: str) -> bool:
+        """True if results of the tool may be cached."""
+        return self.enabled and tool_name in self.tool_ttls
+    
+    async def get(
+        self,
+        server_id: str,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]]
+    ) -> Optional[Any]:
+        """Get a cached tool result.
+        
+        Args:
+            server_id: MCP server ID
+            tool_name: Tool name
+            arguments: Tool arguments
+        
+        Returns:
+            Copy of the cached result or None (miss / not cacheable)
+        """
+        if not self.is_cacheable(tool_name):
+            return None
+        
+        key = make_cache_key(server_id, tool_name, arguments)
+        now = time.time()
+        
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                record_counter("mcp_tool_result_cache_hits_total", {"tool_name": tool_name, "tier": "memory"})
+                return copy.deepcopy(result)
+            del self._entries[key]
+        
+        if self.disk_path:
+            entry = await asyncio.to_thread(self._read_disk, key, now)
+            if entry is not None:
+                self._store_memory(key, entry)
+                record_counter("mcp_tool_result_cache_hits_total", {"tool_name": tool_name, "tier": "disk"})
+                return copy.deepcopy(entry[1])
+        
+        record_counter("mcp_tool_result_cache_misses_total", {"tool_name": tool_name})
+        return None
+    
+    async def set(
+        self,
+        server_id: str,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]],
+        result: Any
+    ) -> None:
+        """Store a successful tool result (no-op for non-cacheable tools or None).
+        
+        Args:
+            server_id: MCP server ID
+            tool_name: Tool name
+            arguments: Tool arguments
+            result: Tool result (JSON serializable or MCP SDK content for the disk tier)
+        """
+        if result is None or not self.is_cacheable(tool_name):
+            return
+        
+        key = make_cache_key(server_id, tool_name, arguments)
+        entry = (time.time() + self.tool_ttls[tool_name], copy.deepcopy(result))
+        self._store_memory(key, entry)
+        
+        if self.disk_path:
+            await asyncio.to_thread(self._write_disk, key, entry)
+    
+    def _store_memory(self, key: str, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            record_counter("mcp_tool_result_cache_evictions_total")
+    
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self.disk_path, f"{key}.json")
+    
+    def _read_disk(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        path = self._disk_file(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Failed to read tool result cache file {path}: {e}")
+            return None
+        
+        if data.get("expires_at", 0) <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return data["expires_at"], data.get("result")
+    
+    def _write_disk(self, key: str, entry: Tuple[float, Any]) -> None:
+        path = self._disk_file(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            # 직렬화를 먼저 해서 실패 시 빈/깨진 파일을 남기지 않음
+            data = json.dumps(
+                {"expires_at": entry[0], "result": entry[1]},
+                ensure_ascii=False,
+                default=_json_default
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Tool result is not serializable, skipping disk cache: {e}")
+            return
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug(f"Failed to write tool result cache file {path}: {e}")
+    
+    def clear(self) -> None:
+        """Drop every in-memory entry (disk files expire by TTL)."""
+        self._entries.clear()
+
+
+# Singleton instance
+tool_result_cache = ToolResultCache.from_settings()
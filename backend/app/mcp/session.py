@@ -0,0 +1,296 @@
+"""
+stdio MCP Session Layer
+
+Multiplexes concurrent JSON-RPC requests over a single stdio MCP server process.
+
+- 서버별 단조 증가 요청 ID (uuid 기반 ID 충돌 방지)
+- 서버별 동시 진행(in-flight) 요청 수 제한
+- 자식 프로세스 stdin 버퍼가 가득 차면 drain()으로 back-pressure
+- 프로세스 세대별로 initialize는 한 번만 수행
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Dict, Any, Optional
+
+from .process_manager import process_manager
+from .metrics import record_counter, record_histogram, record_up_down
+
+logger = logging.getLogger(__name__)
+
+# Manual JSON-RPC response timeout (no timeout - agent mode)
+RESPONSE_TIMEOUT = 3600.0  # 1 hour (effectively unlimited for agent operations)
+
+DEFAULT_MAX_IN_FLIGHT = 16
+DEFAULT_WRITE_BUFFER_LIMIT = 1024 * 1024  # 1MB
+
+# MCP initialize params (agent-portal 클라이언트 정보)
+CLIENT_INIT_PARAMS: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {
+        "name": "agent-portal",
+        "version": "1.0.0"
+    }
+}
+
+# 프로세스 전체에서 단조 증가하는 요청 ID (세션이 다시 만들어져도 재사용되지 않음)
+_request_ids = itertools.count(1)
+
+
+class StdioSession:
+    """JSON-RPC session shared by every client of one stdio MCP server."""
+    
+    def __init__(
+        self,
+        server_id: str,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        write_buffer_limit: int = DEFAULT_WRITE_BUFFER_LIMIT
+    ):
+        """Initialize session.
+        
+        Args:
+            server_id: Server ID
+            max_in_flight: Maximum number of concurrent requests
+            write_buffer_limit: stdin write buffer high-water mark in bytes
+        """
+        self.server_id = server_id
+        self.max_in_flight = max_in_flight
+        self.write_buffer_limit = write_buffer_limit
+        
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._in_flight_count = 0
+        self._write_lock = asyncio.Lock()
+        self._init_lock = asyncio.Lock()
+        # initialize를 마친 프로세스 (재시작되면 다시 initialize)
+        self._initialized_process: Optional[asyncio.subprocess.Process] = None
+        self._init_result: Optional[Dict[str, Any]] = None
+        self._limited_process: Optional[asyncio.subprocess.Process] = None
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently waiting for a response."""
+        return self._in_flight_count
+    
+    @property
+    def is_initialized(self) -> bool:
+        """True if the current process finished the initialize handshake."""
+        process = process_manager.get_process(self.server_id)
+        return (
+            process is not None
+            and process.returncode is None
+            and self._initialized_process is process
+        )
+    
+    def next_id(self) -> int:
+        """Return the next request ID (monotonic)."""
+        return next(_request_ids)
+    
+    def set_max_in_flight(self, max_in_flight: int) -> None:
+        """Change the in-flight limit (applies to new requests).
+        
+        Args:
+            max_in_flight: Maximum number of concurrent requests
+        """
+        if max_in_flight == self.max_in_flight:
+            return
+        self.max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+    
+    def _get_process(self) -> asyncio.subprocess.Process:
+        """Get the running process for this server.
+        
+        Raises:
+            RuntimeError: If the process is not running
+        """
+        process = process_manager.get_process(self.server_id)
+        if process is None or process.returncode is not None or process.stdin is None:
+            raise RuntimeError(f"Process {self.server_id} is not running")
+        
+        # stdin 쓰기 버퍼 한도 설정 (한도를 넘으면 drain()이 대기 = back-pressure)
+        if process is not self._limited_process:
+            transport = getattr(process.stdin, 'transport', None)
+            if transport is not None and hasattr(transport, 'set_write_buffer_limits'):
+                transport.set_write_buffer_limits(high=self.write_buffer_limit)
+            self._limited_process = process
+        return process
+    
+    async def _write(self, process: asyncio.subprocess.Process, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message to the process stdin.
+        
+        Args:
+            process: Target process
+            message: JSON-RPC message
+        """
+        data = (json.dumps(message) + "\n").encode('utf-8')
+        async with self._write_lock:
+            process.stdin.write(data)
+            # stdin 버퍼가 high-water mark를 넘으면 여기서 대기
+            await process.stdin.drain()
+    
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = RESPONSE_TIMEOUT
+    ) -> Dict[str, Any]:
+        """Send a JSON-RPC request and wait for its response.
+        
+        응답은 process_manager의 로그 리더가 id로 라우팅해 Future를 완료시킵니다.
+        
+        Args:
+            method: JSON-RPC method
+            params: JSON-RPC params
+            timeout: Response timeout in seconds
+        
+        Returns:
+            Parsed JSON-RPC response
+        
+        Raises:
+            RuntimeError: If the process is not running
+            Exception: If the server does not respond in time
+        """
+        attributes = {"server_id": self.server_id, "method": method}
+        
+        async with self._in_flight:
+            process = self._get_process()
+            request_id = self.next_id()
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method
+            }
+            if params is not None:
+                request["params"] = params
+            
+            # 응답을 놓치지 않도록 쓰기 전에 등록
+            future = process_manager.register_request(self.server_id, request_id)
+            self._in_flight_count += 1
+            record_up_down("mcp_requests_in_flight", 1, {"server_id": self.server_id})
+            start_time = time.perf_counter()
+            try:
+                await self._write(process, request)
+                logger.debug(f"Waiting for {method} response (id={request_id})...")
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                record_counter("mcp_request_timeouts_total", attributes)
+                raise Exception(f"{method} timeout: MCP server did not respond")
+            finally:
+                process_manager.discard_request(self.server_id, request_id)
+                self._in_flight_count -= 1
+                record_up_down("mcp_requests_in_flight", -1, {"server_id": self.server_id})
+                record_histogram(
+                    "mcp_request_latency_ms",
+                    (time.perf_counter() - start_time) * 1000,
+                    attributes
+                )
+    
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a JSON-RPC notification.
+        
+        Args:
+            method: JSON-RPC method
+            params: JSON-RPC params
+        """
+        message = {
+            "jsonrpc": "2.0",
+            "method": method
+        }
+        if params is not None:
+            message["params"] = params
+        await self._write(self._get_process(), message)
+    
+    async def initialize(self, params: Dict[str, Any] = CLIENT_INIT_PARAMS) -> Dict[str, Any]:
+        """Run the MCP initialize handshake once per process.
+        
+        같은 프로세스에 여러 클라이언트가 붙어도 initialize는 한 번만 보내고,
+        이후에는 캐시된 응답을 반환합니다.
+        
+        Args:
+            params: initialize params
+        
+        Returns:
+            initialize JSON-RPC response
+        """
+        async with self._init_lock:
+            process = self._get_process()
+            if self._initialized_process is process and self._init_result is not None:
+                return self._init_result
+            
+            response = await self.request("initialize", params)
+            if "error" not in response:
+                await self.notify("notifications/initialized")
+                self._initialized_process = process
+                self._init_result = response
+            return response
+
+
+class StdioSessionManager:
+    """Registry of StdioSession per server."""
+    
+    def __init__(self):
+        """Initialize session manager."""
+        self._sessions: Dict[str, StdioSession] = {}
+        self._max_in_flight: Dict[str, int] = {}
+    
+    def _default_limits(self) -> Dict[str, int]:
+        """Read default limits from settings."""
+        try:
+            from app.config import get_settings
+            settings = get_settings()
+            return {
+                "max_in_flight": settings.MCP_MAX_IN_FLIGHT_REQUESTS,
+                "write_buffer_limit": settings.MCP_STDIN_WRITE_BUFFER_LIMIT,
+            }
+        except Exception as e:
+            logger.debug(f"Using default stdio session limits: {e}")
+            return {
+                "max_in_flight": DEFAULT_MAX_IN_FLIGHT,
+                "write_buffer_limit": DEFAULT_WRITE_BUFFER_LIMIT,
+            }
+    
+    def get_session(self, server_id: str) -> StdioSession:
+        """Get or create the session for a server.
+        
+        Args:
+            server_id: Server ID
+        
+        Returns:
+            Session
+        """
+        session = self._sessions.get(server_id)
+        if session is None:
+            limits = self._default_limits()
+            if server_id in self._max_in_flight:
+                limits["max_in_flight"] = self._max_in_flight[server_id]
+            session = StdioSession(server_id, **limits)
+            self._sessions[server_id] = session
+        return session
+    
+    def configure(self, server_id: str, max_in_flight: int) -> None:
+        """Set the in-flight request limit for a server.
+        
+        Args:
+            server_id: Server ID
+            max_in_flight: Maximum number of concurrent requests
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._max_in_flight[server_id] = max_in_flight
+        if server_id in self._sessions:
+            self._sessions[server_id].set_max_in_flight(max_in_flight)
+    
+    def remove_session(self, server_id: str) -> None:
+        """Forget the session for a server.
+        
+        Args:
+            server_id: Server ID
+        """
+        self._sessions.pop(server_id, None)
+
+
+# Singleton instance
+session_manager = StdioSessionManager()
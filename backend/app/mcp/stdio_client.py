@@ -23,6 +23,33 @@ except ImportError:
     logger.warning("MCP SDK not available. Install with: pip install mcp")
 
 
+class MCPToolError(Exception):
+    """도구가 isError=true 결과를 반환함 (JSON-RPC 호출 자체는 성공)."""
+    
+    def __init__(self, tool_name: str, content: List[Dict[str, Any]]):
+        self.tool_name = tool_name
+        self.content = content
+        message = "".join(item.get("text", "") for item in content if isinstance(item, dict))
+        super().__init__(message or f"Tool {tool_name} returned an error")
+
+
+def _error_content(content: Any) -> List[Dict[str, Any]]:
+    """isError 결과의 content를 text item 리스트로 정규화."""
+    if not isinstance(content, list):
+        content = [content]
+    items = []
+    for item in content:
+        if isinstance(item, dict):
+            items.append(item)
+        elif hasattr(item, "text"):
+            items.append({"type": "text", "text": item.text})
+        elif isinstance(item, bytes):
+            items.append({"type": "text", "text": item.decode('utf-8', errors='replace')})
+        else:
+            items.append({"type": "text", "text": str(item)})
+    return items
+
+
 class MCPStdioClient:
     """Client for stdio-based MCP servers."""
     
@@ -183,79 +210,21 @@ class MCPStdioClient:
                     pass
             raise
     
-    async def list_tools(self) -> List[Tool]:
+    async def list_tools(self, refresh: bool = False) -> List[Tool]:
         """List available tools.
         
+        Args:
+            refresh: Ignore the cached tool list and re-fetch (manual connection only)
+        
         Returns:
             List of tools
             
         Raises:
             Exception: If not connected
         """
-        # If using manual connection, send tools/list request directly
+        # If using manual connection, use the cached tool list (tools/list on miss)
         if hasattr(self, '_manual_connection') and self._manual_connection:
-            import json
-            import asyncio
-            import uuid
-            from app.mcp.process_manager import process_manager
-            
-            # Generate request ID
-            request_id = int(uuid.uuid4().hex[:8], 16)
-            
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "method": "tools/list"
-            }
-            
-            tools_json = json.dumps(tools_request) + "\n"
-            self._process_stdin.write(tools_json.encode())
-            await self._process_stdin.drain()
-            
-            # Read response from stdout buffer (no timeout - agent mode)
-            max_wait = 3600.0  # 1 hour (effectively unlimited for agent operations)
-            wait_interval = 0.1
-            waited = 0.0
-            tools_line = None
-            
-            logger.debug(f"Waiting for tools/list response (id={request_id}) in stdout buffer...")
-            while waited < max_wait:
-                buffer = process_manager.get_stdout_buffer(self.server_id)
-                for msg in buffer:
-                    try:
-                        msg_obj = json.loads(msg)
-                        if msg_obj.get("id") == request_id and "result" in msg_obj:
-                            tools_line = msg.encode('utf-8')
-                            break
-                    except:
-                        continue
-                
-                if tools_line:
-                    break
-                
-                await asyncio.sleep(wait_interval)
-                waited += wait_interval
-            
-            if not tools_line:
-                raise Exception("Tools/list timeout: MCP server did not respond")
-            
-            tools_response = json.loads(tools_line.decode('utf-8').strip())
-            if "error" in tools_response:
-                raise Exception(f"MCP tools/list error: {tools_response['error']}")
-            
-            # Convert to Tool objects
-            tools_data = tools_response.get("result", {}).get("tools", [])
-            tools = []
-            for tool_data in tools_data:
-                from mcp.types import Tool
-                tool = Tool(
-                    name=tool_data.get("name", ""),
-                    description=tool_data.get("description", ""),
-                    inputSchema=tool_data.get("inputSchema", {})
-                )
-                tools.append(tool)
-            
-            return tools
+            return await self._list_tools_cached(refresh=refresh)
         
         # Use MCP SDK session
         if not self._connected or not self.session:
@@ -283,6 +252,7 @@ class MCPStdioClient:
             Tool result
             
         Raises:
+            MCPToolError: If the tool returned isError=true
             Exception: If not connected or tool call fails
         """
         if not self._connected:
@@ -290,65 +260,14 @@ class MCPStdioClient:
         
         # If using manual connection, send tools/call request directly
         if hasattr(self, '_manual_connection') and self._manual_connection:
-            import json
-            import asyncio
-            import uuid
-            
-            # Generate request ID
-            request_id = int(uuid.uuid4().hex[:8], 16)
-            
-            # Send tools/call request
-            call_request = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "method": "tools/call",
-                "params": {
+            logger.debug(f"Sending tools/call request for {tool_name}")
+            call_response = await self._request(
+                "tools/call",
+                {
                     "name": tool_name,
                     "arguments": arguments
                 }
-            }
-            
-            call_json = json.dumps(call_request) + "\n"
-            self._process_stdin.write(call_json.encode('utf-8'))
-            await self._process_stdin.drain()
-            
-            logger.debug(f"Sent tools/call request for {tool_name}")
-            
-            # Read response from stdout buffer (no timeout - agent mode)
-            from app.mcp.process_manager import process_manager
-            
-            max_wait = 3600.0  # 1 hour (effectively unlimited for agent operations)
-            wait_interval = 0.1
-            waited = 0.0
-            response_line = None
-            
-            logger.debug(f"Waiting for tools/call response (id={request_id}) in stdout buffer...")
-            while waited < max_wait:
-                buffer = process_manager.get_stdout_buffer(self.server_id)
-                for msg in buffer:
-                    try:
-                        msg_obj = json.loads(msg)
-                        if msg_obj.get("id") == request_id and "result" in msg_obj:
-                            # msg는 이미 문자열이므로 그대로 사용
-                            response_line = msg
-                            # 응답을 찾았으므로 버퍼에서 제거하지 않음 (다른 요청에서 재사용 가능)
-                            break
-                    except json.JSONDecodeError:
-                        continue
-                    except Exception as e:
-                        logger.debug(f"Error parsing message: {e}")
-                        continue
-                
-                if response_line:
-                    break
-                
-                await asyncio.sleep(wait_interval)
-                waited += wait_interval
-            
-            if not response_line:
-                raise Exception(f"Tools/call timeout for {tool_name}")
-            
-            call_response = json.loads(response_line.strip())
+            )
             if "error" in call_response:
                 error_detail = call_response.get("error", {})
                 error_msg = error_detail.get("message", str(error_detail)) if isinstance(error_detail, dict) else str(error_detail)
@@ -357,6 +276,8 @@ class MCPStdioClient:
             # Extract content from result
             result = call_response.get("result", {})
             content = result.get("content", [])
+            if result.get("isError") is True:
+                raise MCPToolError(tool_name, _error_content(content))
             
             # Convert content to list of text strings
             # Handle bytes objects by decoding them
@@ -386,7 +307,11 @@ class MCPStdioClient:
         
         try:
             response = await self.session.call_tool(tool_name, arguments)
+            if getattr(response, "isError", False):
+                raise MCPToolError(tool_name, _error_content(response.content))
             return response.content
+        except MCPToolError:
+            raise
         except Exception as e:
             logger.error(f"Failed to call tool {tool_name}: {e}")
             raise
@@ -405,147 +330,17 @@ class MCPStdioClient:
         Returns:
             List of tools
         """
-        import json
-        import uuid
+        from app.mcp.session import session_manager
         
         try:
-            # Send initialize request
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {
-                        "name": "agent-portal",
-                        "version": "1.0.0"
-                    }
-                }
-            }
-            
-            # Write initialize request
-            init_json = json.dumps(init_request) + "\n"
-            process_stdin.write(init_json.encode())
-            await process_stdin.drain()
-            
-            # Read initialize response (no timeout - agent mode)
-            # Note: process_stdout은 process_manager의 _read_logs에서 읽고 있으므로
-            # stdout 버퍼에서 JSON-RPC 메시지를 가져와야 합니다
-            from app.mcp.process_manager import process_manager
-            
-            import asyncio
-            max_wait = 3600.0  # 1 hour (effectively unlimited for agent operations)
-            wait_interval = 0.1
-            waited = 0.0
-            response_line = None
-            
-            logger.info(f"[DEBUG] Waiting for initialize response in stdout buffer...")
-            while waited < max_wait:
-                # stdout 버퍼에서 JSON-RPC 메시지 찾기
-                buffer = process_manager.get_stdout_buffers().get(self.server_id, [])
-                logger.info(f"[DEBUG] Buffer size: {len(buffer)}, waited: {waited:.1f}s")
-                if buffer:
-                    logger.info(f"[DEBUG] Buffer contents (last 3): {buffer[-3:]}")
-                
-                for msg in buffer:
-                    try:
-                        msg_obj = json.loads(msg)
-                        logger.info(f"[DEBUG] Checking message: id={msg_obj.get('id')}, has_result={'result' in msg_obj}")
-                        if msg_obj.get("id") == 1 and "result" in msg_obj:
-                            response_line = msg.encode('utf-8')
-                            logger.info(f"[DEBUG] Found initialize response!")
-                            break
-                    except Exception as e:
-                        logger.debug(f"[DEBUG] Failed to parse message: {e}")
-                        continue
-                
-                if response_line:
-                    break
-                
-                await asyncio.sleep(wait_interval)
-                waited += wait_interval
-            
-            if not response_line:
-                buffer = process_manager.get_stdout_buffers().get(self.server_id, [])
-                logger.error(f"[DEBUG] Initialize timeout. Buffer size: {len(buffer)}, contents: {buffer[-5:]}")
-                raise Exception("Initialize timeout: MCP server did not respond")
-            
-            init_response = json.loads(response_line.decode('utf-8').strip())
+            # initialize handshake (프로세스당 한 번, 이후에는 캐시된 응답 재사용)
+            session = session_manager.get_session(self.server_id)
+            init_response = await session.initialize()
             if "error" in init_response:
                 raise Exception(f"MCP initialize error: {init_response['error']}")
             
-            # Send initialized notification
-            initialized_notification = {
-                "jsonrpc": "2.0",
-                "method": "notifications/initialized"
-            }
-            notif_json = json.dumps(initialized_notification) + "\n"
-            process_stdin.write(notif_json.encode())
-            await process_stdin.drain()
-            
-            # Send tools/list request
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list"
-            }
-            
-            tools_json = json.dumps(tools_request) + "\n"
-            process_stdin.write(tools_json.encode())
-            await process_stdin.drain()
-            
-            # Read tools/list response (no timeout - agent mode)
-            # stdout 버퍼에서 JSON-RPC 메시지 찾기
-            logger.info(f"[DEBUG] Waiting for tools/list response in stdout buffer...")
-            max_wait = 3600.0  # 1 hour (effectively unlimited for agent operations)
-            wait_interval = 0.1
-            waited = 0.0
-            tools_line = None
-            
-            while waited < max_wait:
-                # stdout 버퍼에서 JSON-RPC 메시지 찾기
-                buffer = process_manager.get_stdout_buffers().get(self.server_id, [])
-                logger.info(f"[DEBUG] Buffer size: {len(buffer)}, waited: {waited:.1f}s")
-                
-                for msg in buffer:
-                    try:
-                        msg_obj = json.loads(msg)
-                        logger.info(f"[DEBUG] Checking message: id={msg_obj.get('id')}, has_result={'result' in msg_obj}")
-                        if msg_obj.get("id") == 2 and "result" in msg_obj:
-                            tools_line = msg.encode('utf-8')
-                            logger.info(f"[DEBUG] Found tools/list response!")
-                            break
-                    except Exception as e:
-                        logger.debug(f"[DEBUG] Failed to parse message: {e}")
-                        continue
-                
-                if tools_line:
-                    break
-                
-                await asyncio.sleep(wait_interval)
-                waited += wait_interval
-            
-            if not tools_line:
-                buffer = process_manager.get_stdout_buffers().get(self.server_id, [])
-                logger.error(f"[DEBUG] Tools/list timeout. Buffer size: {len(buffer)}, contents: {buffer[-5:]}")
-                raise Exception("Tools/list timeout: MCP server did not respond")
-            
-            tools_response = json.loads(tools_line.decode('utf-8').strip())
-            if "error" in tools_response:
-                raise Exception(f"MCP tools/list error: {tools_response['error']}")
-            
-            # Convert to Tool objects
-            tools_data = tools_response.get("result", {}).get("tools", [])
-            tools = []
-            for tool_data in tools_data:
-                from mcp.types import Tool
-                tool = Tool(
-                    name=tool_data.get("name", ""),
-                    description=tool_data.get("description", ""),
-                    inputSchema=tool_data.get("inputSchema", {})
-                )
-                tools.append(tool)
+            # tools/list (같은 프로세스 세대에서는 캐시된 목록 재사용)
+            tools = await self._list_tools_cached()
             
             # Mark as connected (but we're using manual communication)
             self._connected = True
@@ -560,6 +355,76 @@ class MCPStdioClient:
             logger.error(f"Failed to connect to existing process: {e}", exc_info=True)
             raise
     
+    async def _request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a JSON-RPC request through the shared server session.
+        
+        같은 서버의 모든 클라이언트가 하나의 세션을 공유하므로 요청 ID가 충돌하지 않고
+        여러 요청이 동시에 진행될 수 있습니다.
+        
+        프로세스 풀이 설정된 서버는 가장 한가한 워커로 보냅니다.
+        
+        Args:
+            method: JSON-RPC method
+            params: JSON-RPC params
+            
+        Returns:
+            Parsed JSON-RPC response
+        """
+        from app.mcp.process_pool import pool_manager
+        
+        session = await pool_manager.select_session(self.server_id)
+        return await session.request(method, params)
+    
+    async def _list_tools_cached(self, refresh: bool = False) -> List[Tool]:
+        """List tools through the per-server tool list cache.
+        
+        캐시는 프로세스 세대별로 유지되며, 재시작이나
+        notifications/tools/list_changed 수신 시에만 다시 tools/list를 보냅니다.
+        
+        Args:
+            refresh: Ignore the cached list and re-fetch
+            
+        Returns:
+            List of tools
+        """
+        from app.mcp.tool_cache import tool_cache
+        
+        if refresh:
+            tool_cache.invalidate(self.server_id)
+        
+        tools_data = tool_cache.get(self.server_id)
+        if tools_data is None:
+            tools_response = await self._request("tools/list")
+            if "error" in tools_response:
+                raise Exception(f"MCP tools/list error: {tools_response['error']}")
+            tools_data = tools_response.get("result", {}).get("tools", [])
+            tool_cache.set(self.server_id, tools_data)
+        
+        return self._parse_tools(tools_data)
+    
+    @staticmethod
+    def _parse_tools(tools_data: List[Dict[str, Any]]) -> List[Tool]:
+        """Convert tools/list result entries into Tool objects.
+        
+        Args:
+            tools_data: "tools" list of a tools/list result
+            
+        Returns:
+            List of tools
+        """
+        return [
+            Tool(
+                name=tool_data.get("name", ""),
+                description=tool_data.get("description", ""),
+                inputSchema=tool_data.get("inputSchema", {})
+            )
+            for tool_data in tools_data
+        ]
+    
     async def disconnect(self) -> None:
         """Disconnect from MCP server."""
         if hasattr(self, '_stdio_context') and self._stdio_context:
@@ -583,6 +448,8 @@ class MCPStdioClient:
         Returns:
             True if connected
         """
+        if getattr(self, '_manual_connection', False):
+            return self._connected
         return self._connected and self.session is not None
     
     async def __aenter__(self):
@@ -0,0 +1,121 @@
+"""
+Tool List Cache for stdio MCP Servers
+
+Caches tools/list results per server and process generation.
+
+- 프로세스가 재시작되면 (세대 변경) 자동으로 무효화
+- 서버가 notifications/tools/list_changed를 보내면 무효화
+- 명시적 새로고침 요청 시 무효화
+- 새로 조회한 목록은 등록된 persister(mcp_service.sync_server_tools)로 DB에 저장
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+from .process_manager import process_manager
+from .metrics import record_counter
+
+logger = logging.getLogger(__name__)
+
+TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
+
+def base_server_id(server_id: str) -> str:
+    """Strip the process pool worker suffix ("{server_id}#{n}")."""
+    return server_id.split("#", 1)[0]
+
+
+@dataclass
+class _ToolListEntry:
+    """Cached tools/list result."""
+    generation: int
+    tools: List[Dict[str, Any]]
+    fetched_at: float
+
+
+class ToolListCache:
+    """In-memory tools/list cache keyed by server ID and process generation."""
+    
+    def __init__(self):
+        """Initialize tool list cache."""
+        self._entries: Dict[str, _ToolListEntry] = {}
+        self._persister: Optional[Callable[[str, List[Dict[str, Any]]], Awaitable[Any]]] = None
+        process_manager.add_notification_listener(self._on_notification)
+    
+    def set_persister(
+        self,
+        persister: Callable[[str, List[Dict[str, Any]]], Awaitable[Any]]
+    ) -> None:
+        """Register a coroutine that stores freshly fetched tool lists.
+        
+        Args:
+            persister: async (server_id, tools) -> Any
+        """
+        self._persister = persister
+    
+    def get(self, server_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Get cached tools for the current process generation.
+        
+        Args:
+            server_id: Server ID (pool worker IDs map to their server)
+        
+        Returns:
+            List of raw MCP tool dicts (name, description, inputSchema) or None
+        """
+        server_id = base_server_id(server_id)
+        entry = self._entries.get(server_id)
+        if entry is None or entry.generation != process_manager.get_process_generation(server_id):
+            record_counter("mcp_tool_list_cache_misses_total", {"server_id": server_id})
+            return None
+        record_counter("mcp_tool_list_cache_hits_total", {"server_id": server_id})
+        return entry.tools
+    
+    def set(self, server_id: str, tools: List[Dict[str, Any]]) -> None:
+        """Store a freshly fetched tool list and persist it.
+        
+        Args:
+            server_id: Server ID (pool worker IDs map to their server)
+            tools: List of raw MCP tool dicts (name, description, inputSchema)
+        """
+        server_id = base_server_id(server_id)
+        self._entries[server_id] = _ToolListEntry(
+            generation=process_manager.get_process_generation(server_id),
+            tools=tools,
+            fetched_at=time.time()
+        )
+        
+        if self._persister is not None:
+            try:
+                asyncio.get_running_loop().create_task(self._persist(server_id, tools))
+            except RuntimeError:
+                pass
+    
+    async def _persist(self, server_id: str, tools: List[Dict[str, Any]]) -> None:
+        try:
+            await self._persister(server_id, tools)
+        except Exception as e:
+            logger.warning(f"Failed to persist tool list for {server_id}: {e}")
+    
+    def invalidate(self, server_id: Optional[str] = None) -> None:
+        """Drop the cached tool list (None = all servers).
+        
+        Args:
+            server_id: Server ID
+        """
+        if server_id is None:
+            self._entries.clear()
+            return
+        self._entries.pop(base_server_id(server_id), None)
+    
+    def _on_notification(self, server_id: str, message: Dict[str, Any]) -> None:
+        """Invalidate on notifications/tools/list_changed."""
+        if message.get("method") == TOOLS_LIST_CHANGED:
+            logger.info(f"Tool list changed on {server_id}, invalidating cache")
+            self.invalidate(server_id)
+
+
+# Singleton instance
+tool_cache = ToolListCache()
@@ -4,8 +4,11 @@ Data Cloud API Router - Zero Copy 데이터베이스 커넥터 API
 Salesforce Data Cloud 스타일의 데이터베이스 연결 관리 API.
 """
 
+import asyncio
+import json
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.services.datacloud_service import datacloud_service
@@ -81,6 +84,12 @@ class QueryRequest(BaseModel):
     max_rows: int = Field(1000, description="최대 반환 행 수")
 
 
+class StreamQueryRequest(BaseModel):
+    """스트리밍 쿼리 실행 요청"""
+    query: str = Field(..., description="SQL 쿼리 (SELECT)")
+    max_rows: int = Field(100000, ge=1, description="최대 반환 행 수")
+
+
 class QueryResult(BaseModel):
     """쿼리 실행 결과"""
     success: bool
@@ -233,16 +242,76 @@ async def get_schema(
 async def execute_query(
     connection_id: str,
     request: QueryRequest,
+    http_request: Request,
     user_id: str = Query("anonymous", description="실행 사용자 ID")
 ):
-    """SQL 쿼리 실행 (Zero Copy)"""
-    result = await datacloud_service.execute_query(
+    """SQL 쿼리 실행 (Zero Copy)
+    
+    클라이언트가 응답 전에 연결을 끊으면 실행 중인 쿼리를 취소함 (드라이버 cancel API).
+    """
+    task = asyncio.create_task(datacloud_service.execute_query(
         connection_id=connection_id,
         query=request.query,
         user_id=user_id,
         max_rows=request.max_rows
+    ))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=1.0)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+@router.post("/connections/{connection_id}/query/stream")
+@api_router.post("/connections/{connection_id}/query/stream")
+async def stream_query(
+    connection_id: str,
+    request: StreamQueryRequest,
+    user_id: str = Query("anonymous", description="실행 사용자 ID")
+):
+    """SELECT 결과 스트리밍 (NDJSON).
+    
+    서버 측 커서로 읽는 대로 한 줄씩 전송하므로 결과 크기와 관계없이 메모리 사용량이 일정함.
+    Kong Gateway에 등록된 연결은 Kong 인증/로깅을 우회하지 않도록 400 (/query 사용).
+    
+    Lines:
+        {"type": "columns", "columns": [...]}
+        {"type": "rows", "rows": [[...], ...]}  (여러 번)
+        {"type": "end", "rows": int, "truncated": bool, "execution_time_ms": int}
+        또는 {"type": "error", "error": str}
+    """
+    conn_info = await datacloud_service.get_connection_by_id(connection_id)
+    if not conn_info:
+        raise HTTPException(status_code=404, detail="Connection not found")
+    if not request.query.strip().upper().startswith(('SELECT', 'WITH')):
+        raise HTTPException(status_code=400, detail="Only SELECT queries can be streamed")
+    if conn_info.get('kong_service_id') and conn_info.get('kong_api_key'):
+        raise HTTPException(
+            status_code=400,
+            detail="Streaming is not available for Kong-routed connections; use /query"
+        )
+    
+    async def generate():
+        async for line in datacloud_service.stream_query(
+            conn_info, request.query, user_id, request.max_rows
+        ):
+            yield json.dumps(line, ensure_ascii=False, default=str) + "\n"
+    
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"}
     )
-    return result
 
 
 # =====================
@@ -744,11 +744,15 @@ def _parse_sse_response(response_text: str) -> Optional[Dict[str, Any]]:
 
 @router.get("/servers/{server_id}/tools", response_model=List[MCPToolResponse])
 @api_router.get("/servers/{server_id}/tools", response_model=List[MCPToolResponse])
-async def get_mcp_server_tools(server_id: str):
+async def get_mcp_server_tools(
+    server_id: str,
+    refresh: bool = Query(False, description="캐시를 무시하고 도구 목록 다시 조회")
+):
     """MCP 서버의 도구 목록 조회.
     
     Args:
         server_id: 서버 ID
+        refresh: 캐시된 도구 목록을 무시하고 서버에서 다시 조회 (stdio)
         
     Returns:
         도구 목록
@@ -757,7 +761,7 @@ async def get_mcp_server_tools(server_id: str):
     if not server:
         raise HTTPException(status_code=404, detail="MCP server not found")
     
-    tools = await mcp_service.get_server_tools(server_id)
+    tools = await mcp_service.get_server_tools(server_id, refresh=refresh)
     return tools
 
 
@@ -5,14 +5,26 @@ Monitoring API Routes
 ClickHouse 기반 트레이스 조회.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, Optional
 from datetime import datetime
+import asyncio
+import json
+import logging
 from app.services.monitoring_adapter import monitoring_adapter
+from app.services.trace_live_tail import trace_live_tail
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/monitoring", tags=["Monitoring"])
 
 
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 형식으로 데이터 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
 @router.get("/traces")
 async def get_traces(
     project_id: str = Query(..., description="Project ID"),
@@ -20,21 +32,30 @@ async def get_traces(
     end_time: datetime = Query(..., description="End time (ISO 8601)"),
     search: Optional[str] = Query(None, description="Search query"),
     trace_type: Optional[str] = Query(None, description="Trace type filter: 'agent', 'llm', or 'all'"),
-    page: int = Query(1, ge=1, description="Page number"),
-    size: int = Query(20, ge=1, le=100, description="Page size")
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is set)"),
+    size: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination)"),
+    count_mode: str = Query("exact", description="Total count: 'exact', 'approx' (uniqCombined), or 'none' (has_more only)")
 ):
     """
     트레이스 목록 조회.
     
+    무한 스크롤은 page 대신 이전 응답의 next_cursor를 cursor로 전달
+    (OFFSET 없이 조회하므로 깊은 페이지도 비용이 같음).
+    
     Args:
         trace_type: 'agent' (tool calls), 'llm' (LLM calls), 'all' (no filter)
+        cursor: 이전 응답의 next_cursor
+        count_mode: 'exact', 'approx', 'none' (total = null)
     
     Returns:
         {
             "traces": [...],
-            "total": int,
+            "total": int | null,
             "page": int,
-            "size": int
+            "size": int,
+            "has_more": bool,
+            "next_cursor": str | null
         }
     """
     try:
@@ -45,13 +66,58 @@ async def get_traces(
             search=search,
             trace_type=trace_type,
             page=page,
-            size=size
+            size=size,
+            cursor=cursor,
+            count_mode=count_mode
         )
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch traces: {str(e)}")
 
 
+@router.get("/traces/live")
+async def stream_live_traces(
+    request: Request,
+    project_id: str = Query(..., description="Project ID")
+):
+    """
+    신규 스팬 라이브 테일 (SSE).
+    
+    프로젝트별 폴러 하나가 otel_traces를 주기적으로 조회하고 모든 구독자에게 전달하므로
+    시청자 수와 관계없이 ClickHouse 쿼리는 간격당 1회.
+    
+    Events:
+        ready: {"project_id": str}
+        spans: {"spans": [{trace_id, span_id, parent_span_id, span_name, service_name,
+                           timestamp, duration, status_code, model, total_tokens, cost}]}
+    """
+    async def event_generator():
+        async with trace_live_tail.subscribe(project_id) as queue:
+            yield _format_sse("ready", {"project_id": project_id})
+            while True:
+                try:
+                    spans = await asyncio.wait_for(queue.get(), timeout=15.0)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    # 프록시 idle timeout 방지
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _format_sse("spans", {"spans": spans})
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @router.get("/traces/{trace_id}")
 async def get_trace_detail(trace_id: str):
     """
@@ -137,11 +203,66 @@ async def get_session_replay(trace_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch session replay: {str(e)}")
 
 
+@router.get("/replay/{trace_id}/stream")
+async def stream_session_replay(
+    trace_id: str,
+    page_size: Optional[int] = Query(None, ge=1, le=5000, description="Spans fetched per ClickHouse page")
+):
+    """
+    세션 리플레이 스트리밍 (SSE).
+    스팬을 페이지 단위로 읽어 이벤트가 만들어지는 대로 전송.
+    
+    Events:
+        start: {"trace_id": str, "start_time": int}
+        event: get_session_replay의 events 항목
+        end: {"trace_id": str, "total_duration": int, "event_count": int}
+        error: {"message": str}
+    """
+    stream = monitoring_adapter.stream_session_replay(trace_id, page_size=page_size)
+    
+    # 첫 페이지는 응답 전에 읽어서 없는 트레이스는 404로 응답
+    try:
+        first = await anext(stream, None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch session replay: {str(e)}")
+    if first is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
+    
+    async def event_generator():
+        try:
+            yield _format_sse(*first)
+            async for event, data in stream:
+                yield _format_sse(event, data)
+        except Exception as e:
+            logger.error(f"Session replay stream error: {e}", exc_info=True)
+            yield _format_sse("error", {"message": str(e)})
+        finally:
+            await stream.aclose()
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @router.get("/timeline/{trace_id}")
-async def get_trace_timeline(trace_id: str):
+async def get_trace_timeline(
+    trace_id: str,
+    max_depth: Optional[int] = Query(None, ge=0, description="Max tree depth to return (truncated nodes keep child_count)"),
+    span_id: Optional[str] = Query(None, description="Return only the subtree rooted at this span"),
+    window_start: Optional[int] = Query(None, description="Only spans ending after this time (epoch ms)"),
+    window_end: Optional[int] = Query(None, description="Only spans starting before this time (epoch ms)")
+):
     """
     트레이스 타임라인 조회 (계층 구조 포함).
     
+    큰 트레이스는 max_depth로 상위 몇 단계만 받고, 펼칠 때 span_id로 하위 트리를 요청.
+    
     Returns:
         {
             "trace_id": str,
@@ -153,7 +274,13 @@ async def get_trace_timeline(trace_id: str):
         }
     """
     try:
-        result = await monitoring_adapter.get_trace_timeline(trace_id)
+        result = await monitoring_adapter.get_trace_timeline(
+            trace_id,
+            max_depth=max_depth,
+            root_span_id=span_id,
+            window_start=window_start,
+            window_end=window_end
+        )
         if not result:
             raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
         return result
@@ -163,6 +290,44 @@ async def get_trace_timeline(trace_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch trace timeline: {str(e)}")
 
 
+@router.get("/dashboard")
+async def get_dashboard(
+    project_id: str = Query(..., description="Project ID"),
+    start_time: datetime = Query(..., description="Start time (ISO 8601)"),
+    end_time: datetime = Query(..., description="End time (ISO 8601)"),
+    interval: str = Query("day", description="Time interval for cost/token trends (hour/day/week)")
+):
+    """
+    대시보드 데이터 일괄 조회.
+    
+    metrics, cost-trend, token-usage, performance, guardrails, agents/usage를
+    한 번의 요청으로 동시에 조회 (기간은 버킷 단위로 맞춰 짧게 캐시).
+    
+    Returns:
+        {
+            "metrics": {...},
+            "cost_trend": [...],
+            "token_usage": [...],
+            "performance": [...],
+            "guardrails": {...},
+            "agent_usage": [...],
+            "start_time": str,
+            "end_time": str,
+            "errors": {section: str}
+        }
+    """
+    try:
+        result = await monitoring_adapter.get_dashboard(
+            project_id=project_id,
+            start_time=start_time,
+            end_time=end_time,
+            interval=interval
+        )
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch dashboard: {str(e)}")
+
+
 @router.get("/analytics/cost-trend")
 async def get_cost_trend(
     project_id: str = Query(..., description="Project ID"),
@@ -475,8 +475,8 @@ async def proxy_mcp(
     Returns:
         MCP 서버 응답
     """
-    # MCP 서버 조회
-    server = await mcp_service.get_server(server_id)
+    # MCP 서버 조회 (hot path - 짧은 TTL 캐시)
+    server = await mcp_service.get_server(server_id, use_cache=True)
     if not server:
         raise HTTPException(status_code=404, detail="MCP server not found")
     
@@ -510,7 +510,8 @@ async def proxy_mcp(
         has_permission = await mcp_service.check_user_permission(
             server_id=server_id,
             user_id=user_id,
-            group_ids=group_ids
+            group_ids=group_ids,
+            use_cache=True
         )
         
         if not has_permission:
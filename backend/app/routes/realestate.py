@@ -67,10 +67,10 @@ def _format_sse(event_data: Dict[str, Any]) -> str:
 @api_router.get("/health", summary="RealEstate Agent Health Check")
 async def health_check():
     """부동산 에이전트 헬스 체크"""
-    from app.agents.common.mcp_client_base import create_mcp_client
+    from app.agents.common.mcp_client_base import get_mcp_client
     
     try:
-        client = await create_mcp_client(
+        client = await get_mcp_client(
             server_name="mcp-kr-realestate",
             service_name="agent-realestate"
         )
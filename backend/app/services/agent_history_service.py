@@ -15,6 +15,8 @@ from contextlib import asynccontextmanager
 
 import aiomysql
 
+from app.services.db_pool import db_pool_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,19 +37,16 @@ class AgentHistoryService:
     
     @asynccontextmanager
     async def get_connection(self):
-        """MariaDB 연결 획득"""
-        conn = await aiomysql.connect(
+        """MariaDB 연결 획득 (공유 풀)"""
+        async with db_pool_manager.acquire(
+            f"{self.agent_type}_history",
             host=self.db_host,
             port=self.db_port,
             user=self.db_user,
             password=self.db_password,
-            db=self.db_name,
-            autocommit=True
-        )
-        try:
+            db=self.db_name
+        ) as conn:
             yield conn
-        finally:
-            conn.close()
     
     async def list_history(
         self, 
@@ -15,6 +15,8 @@ from enum import Enum
 
 import aiomysql
 
+from app.services.db_pool import db_pool_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,24 +50,18 @@ class AgentRegistryService:
         self.db_user = os.getenv("MARIADB_USER", "root")
         self.db_password = os.getenv("MARIADB_ROOT_PASSWORD", "rootpass")
         self.db_name = os.getenv("MARIADB_DATABASE", "agent_portal")
-        self._pool: Optional[aiomysql.Pool] = None
         logger.info("AgentRegistryService initialized")
     
-    async def _get_pool(self) -> aiomysql.Pool:
-        """커넥션 풀 획득"""
-        if self._pool is None or self._pool.closed:
-            self._pool = await aiomysql.create_pool(
-                host=self.db_host,
-                port=self.db_port,
-                user=self.db_user,
-                password=self.db_password,
-                db=self.db_name,
-                charset='utf8mb4',
-                autocommit=True,
-                minsize=1,
-                maxsize=10
-            )
-        return self._pool
+    def _acquire(self):
+        """공유 풀에서 MariaDB 연결 획득 (async with로 사용)"""
+        return db_pool_manager.acquire(
+            "agent_registry",
+            host=self.db_host,
+            port=self.db_port,
+            user=self.db_user,
+            password=self.db_password,
+            db=self.db_name
+        )
     
     async def register_or_get(
         self,
@@ -93,9 +89,7 @@ class AgentRegistryService:
         Returns:
             에이전트 정보 딕셔너리
         """
-        pool = await self._get_pool()
-        
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
                 # 기존 에이전트 조회
                 await cur.execute("""
@@ -144,9 +138,7 @@ class AgentRegistryService:
     
     async def get_by_id(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """ID로 에이전트 조회"""
-        pool = await self._get_pool()
-        
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
                 await cur.execute("SELECT * FROM agents WHERE id = %s", (agent_id,))
                 row = await cur.fetchone()
@@ -158,9 +150,7 @@ class AgentRegistryService:
         agent_type: Optional[AgentType] = None
     ) -> Optional[Dict[str, Any]]:
         """외부 ID로 에이전트 조회 (Langflow flow_id 등)"""
-        pool = await self._get_pool()
-        
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
                 if agent_type:
                     await cur.execute("""
@@ -184,8 +174,6 @@ class AgentRegistryService:
         offset: int = 0
     ) -> List[Dict[str, Any]]:
         """에이전트 목록 조회"""
-        pool = await self._get_pool()
-        
         conditions = []
         params = []
         
@@ -201,7 +189,7 @@ class AgentRegistryService:
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
                 await cur.execute(f"""
                     SELECT * FROM agents 
@@ -222,8 +210,6 @@ class AgentRegistryService:
         status: Optional[AgentStatus] = None
     ) -> Optional[Dict[str, Any]]:
         """에이전트 정보 업데이트"""
-        pool = await self._get_pool()
-        
         updates = []
         params = []
         
@@ -245,7 +231,7 @@ class AgentRegistryService:
         
         params.append(agent_id)
         
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
                 await cur.execute(f"""
                     UPDATE agents SET {", ".join(updates)} WHERE id = %s
@@ -255,9 +241,7 @@ class AgentRegistryService:
     
     async def update_last_used(self, agent_id: str) -> None:
         """last_used_at 업데이트"""
-        pool = await self._get_pool()
-        
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute("""
                     UPDATE agents SET last_used_at = NOW() WHERE id = %s
@@ -265,9 +249,7 @@ class AgentRegistryService:
     
     async def delete_agent(self, agent_id: str) -> bool:
         """에이전트 삭제 (soft delete - status를 inactive로)"""
-        pool = await self._get_pool()
-        
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute("""
                     UPDATE agents SET status = 'inactive' WHERE id = %s
@@ -280,8 +262,6 @@ class AgentRegistryService:
         agent_type: Optional[AgentType] = None
     ) -> int:
         """에이전트 수 조회"""
-        pool = await self._get_pool()
-        
         conditions = ["status = 'active'"]
         params = []
         
@@ -294,7 +274,7 @@ class AgentRegistryService:
         
         where_clause = " AND ".join(conditions)
         
-        async with pool.acquire() as conn:
+        async with self._acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(f"""
                     SELECT COUNT(*) FROM agents WHERE {where_clause}
@@ -0,0 +1,267 @@
+"""
+Agent Span Exporter
+
+Background sink for AgentTraceAdapter spans.
+
+- end_trace() 경로에서는 bounded queue에 넣기만 하고 바로 반환
+- 백그라운드 태스크가 N개 또는 T밀리초마다 모아서
+  ClickHouse otel_traces에 JSONEachRow INSERT 1회 (공유 keep-alive 연결),
+  MariaDB agent_sessions에 multi-row upsert 1회
+- 실패 시 지수 back-off로 재시도, 모두 실패하면 배치를 버리고 counter로 기록
+- 종료 시 남은 스팬을 flush
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, List, Optional
+
+import aiomysql
+
+from app.mcp.metrics import record_counter, record_histogram
+from app.services.clickhouse_client import clickhouse_client
+
+logger = logging.getLogger(__name__)
+
+OTEL_TRACES_COLUMNS = [
+    "Timestamp",
+    "TraceId",
+    "SpanId",
+    "ParentSpanId",
+    "TraceState",
+    "SpanName",
+    "SpanKind",
+    "ServiceName",
+    "ResourceAttributes",
+    "ScopeName",
+    "ScopeVersion",
+    "SpanAttributes",
+    "Duration",
+    "StatusCode",
+    "StatusMessage",
+]
+
+AGENT_SESSIONS_UPSERT = """
+INSERT INTO agent_sessions (
+    session_id, project_id, agent_name, status,
+    start_time, end_time, duration, tags,
+    total_cost, total_tokens, error_message
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    end_time = VALUES(end_time),
+    duration = VALUES(duration),
+    status = VALUES(status),
+    total_cost = VALUES(total_cost),
+    total_tokens = VALUES(total_tokens),
+    error_message = VALUES(error_message)
+"""
+
+# stop()이 큐에 넣는 종료 표시
+_STOP = object()
+
+
+def to_otel_row(span_data: Dict[str, Any]) -> Dict[str, Any]:
+    """AgentTraceAdapter 스팬 데이터를 otel_traces JSONEachRow 행으로 변환."""
+    resource_attrs = {
+        'service.name': span_data['service_name'],
+        'project_id': span_data['project_id']
+    }
+    
+    span_attrs = {
+        'agent.id': span_data['agent_id'],
+        'agent.name': span_data['agent_name'],
+        'agent.type': span_data['agent_type'],
+        'metadata.agent_id': span_data['agent_id'],
+        'metadata.agent_name': span_data['agent_name'],
+        'gen_ai.usage.total_cost': str(span_data['cost']),
+        'gen_ai.usage.total_tokens': str(span_data['tokens'])
+    }
+    
+    if span_data['inputs']:
+        span_attrs['agent.inputs'] = json.dumps(span_data['inputs'])[:1000]
+    if span_data['outputs']:
+        span_attrs['agent.outputs'] = json.dumps(span_data['outputs'])[:1000]
+    if span_data['tags']:
+        span_attrs['agent.tags'] = json.dumps(span_data['tags'])
+    
+    return {
+        "Timestamp": span_data['start_time'].strftime('%Y-%m-%d %H:%M:%S.%f'),
+        "TraceId": span_data['trace_id'],
+        "SpanId": span_data['span_id'],
+        "ParentSpanId": span_data['parent_span_id'],
+        "TraceState": "",
+        "SpanName": span_data['span_name'],
+        "SpanKind": span_data['span_kind'],
+        "ServiceName": span_data['service_name'],
+        "ResourceAttributes": {k: str(v) for k, v in resource_attrs.items()},
+        "ScopeName": "agent-portal",
+        "ScopeVersion": "1.0.0",
+        "SpanAttributes": span_attrs,
+        "Duration": span_data['duration_ns'],
+        "StatusCode": span_data['status_code'],
+        "StatusMessage": span_data.get('status_message') or "",
+    }
+
+
+def to_session_row(span_data: Dict[str, Any]) -> tuple:
+    """AgentTraceAdapter 스팬 데이터를 agent_sessions 행으로 변환 (AGENT_SESSIONS_UPSERT 순서)."""
+    return (
+        span_data['trace_id'],
+        span_data['project_id'],
+        span_data['agent_name'],
+        'error' if span_data['status_code'] == 'ERROR' else 'completed',
+        span_data['start_time'],
+        span_data['end_time'],
+        span_data['duration_ns'] // 1_000_000,  # ms
+        json.dumps(span_data['tags']),
+        span_data['cost'],
+        span_data['tokens'],
+        span_data.get('status_message')
+    )
+
+
+class AgentSpanExporter:
+    """Batched, non-blocking exporter for agent execution spans."""
+    
+    def __init__(
+        self,
+        acquire: Callable[[], AsyncContextManager[aiomysql.Connection]],
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5
+    ):
+        """Initialize exporter.
+        
+        Args:
+            acquire: Returns a context manager yielding a pooled autocommit connection
+            queue_size: Maximum number of queued spans (excess spans are dropped)
+            batch_size: Flush when this many spans are collected
+            flush_interval: Flush at least this often in seconds
+            max_retries: Retries per batch and sink after the first attempt
+            retry_backoff: First retry delay in seconds (doubles every retry)
+        """
+        self._acquire = acquire
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """True if the background flush task is running."""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if self.is_running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info("Agent span exporter started")
+    
+    def enqueue(self, span_data: Dict[str, Any]) -> bool:
+        """Queue one finished span without waiting for ClickHouse/MariaDB.
+        
+        Args:
+            span_data: AgentTraceAdapter.end_trace가 만든 스팬 데이터
+        
+        Returns:
+            False if the span was dropped because the queue is full
+        """
+        if not self.is_running:
+            self.start()
+        try:
+            self._queue.put_nowait(span_data)
+            return True
+        except asyncio.QueueFull:
+            record_counter("agent_spans_dropped_total", {"reason": "queue_full"})
+            return False
+    
+    async def _run(self) -> None:
+        """Collect spans into batches and export them until stop() is requested."""
+        stopping = False
+        while not stopping:
+            try:
+                item = await self._queue.get()
+                if item is _STOP:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                await self._export_batch(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Agent span exporter error: {e}")
+    
+    async def _export_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Write one batch to both sinks concurrently.
+        
+        Args:
+            batch: Span data list
+        """
+        await asyncio.gather(
+            self._with_retry("clickhouse", len(batch), lambda: clickhouse_client.insert(
+                "otel_traces", OTEL_TRACES_COLUMNS, [to_otel_row(span) for span in batch]
+            )),
+            self._with_retry("mariadb", len(batch), lambda: self._upsert_sessions(
+                [to_session_row(span) for span in batch]
+            ))
+        )
+    
+    async def _with_retry(self, sink: str, size: int, write: Callable[[], Awaitable[None]]) -> None:
+        """Run write() with exponential back-off (dropped after the last retry).
+        
+        Args:
+            sink: Metrics label ("clickhouse" / "mariadb")
+            size: Number of spans in the batch
+            write: Creates the write coroutine for one attempt
+        """
+        start_time = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                await write()
+                break
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    logger.warning(f"Dropping {size} agent spans ({sink}, {attempt + 1} attempts): {e}")
+                    record_counter("agent_spans_dropped_total", {"reason": "write_error", "sink": sink}, value=size)
+                    return
+                delay = self.retry_backoff * (2 ** attempt)
+                logger.info(f"Agent span export to {sink} failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+        
+        record_counter("agent_spans_exported_total", {"sink": sink}, value=size)
+        record_histogram("agent_span_export_ms", (time.perf_counter() - start_time) * 1000, {"sink": sink})
+    
+    async def _upsert_sessions(self, rows: List[tuple]) -> None:
+        async with self._acquire() as conn, conn.cursor() as cursor:
+            # aiomysql은 INSERT ... VALUES ... ON DUPLICATE KEY UPDATE의 executemany도 multi-row INSERT로 변환
+            await cursor.executemany(AGENT_SESSIONS_UPSERT, rows)
+    
+    async def stop(self) -> None:
+        """Flush every queued span and stop the export task."""
+        if self.is_running:
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+        logger.info("Agent span exporter stopped")
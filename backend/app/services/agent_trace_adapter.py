@@ -1,19 +1,19 @@
 """
 Agent Trace Adapter
 
-에이전트 트레이스 시작/종료를 관리하고 OTEL Collector 또는 ClickHouse에 저장.
+에이전트 트레이스 시작/종료를 관리하고 ClickHouse(otel_traces)와 MariaDB(agent_sessions)에 저장.
 LLM 호출과 연결할 수 있도록 parent_trace_id를 제공.
 """
 
 import os
 import uuid
-import json
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-import httpx
-import aiomysql
+from app.config import get_settings
+from app.services.agent_span_exporter import AgentSpanExporter
+from app.services.db_pool import db_pool_manager
 
 logger = logging.getLogger(__name__)
 
@@ -40,31 +40,31 @@ class AgentTraceAdapter:
             "http://monitoring-otel-collector:4318"
         )
         
-        # ClickHouse 설정 (직접 삽입용)
-        self.clickhouse_host = os.getenv("CLICKHOUSE_HOST", "monitoring-clickhouse")
-        self.clickhouse_port = int(os.getenv("CLICKHOUSE_HTTP_PORT", "8123"))
-        self.clickhouse_database = os.getenv("CLICKHOUSE_DATABASE", "otel_2")
-        
-        self._pool: Optional[aiomysql.Pool] = None
         self._active_traces: Dict[str, Dict[str, Any]] = {}
         
+        # 종료된 스팬은 백그라운드에서 배치로 저장 (ClickHouse 공유 연결, MariaDB 공유 풀)
+        settings = get_settings()
+        self.span_exporter = AgentSpanExporter(
+            self._acquire,
+            queue_size=settings.AGENT_SPAN_EXPORT_QUEUE_SIZE,
+            batch_size=settings.AGENT_SPAN_EXPORT_BATCH_SIZE,
+            flush_interval=settings.AGENT_SPAN_EXPORT_FLUSH_INTERVAL_MS / 1000,
+            max_retries=settings.AGENT_SPAN_EXPORT_MAX_RETRIES,
+            retry_backoff=settings.AGENT_SPAN_EXPORT_RETRY_BACKOFF
+        )
+        
         logger.info("AgentTraceAdapter initialized")
     
-    async def _get_pool(self) -> aiomysql.Pool:
-        """MariaDB 커넥션 풀 획득"""
-        if self._pool is None or self._pool.closed:
-            self._pool = await aiomysql.create_pool(
-                host=self.db_host,
-                port=self.db_port,
-                user=self.db_user,
-                password=self.db_password,
-                db=self.db_name,
-                charset='utf8mb4',
-                autocommit=True,
-                minsize=1,
-                maxsize=10
-            )
-        return self._pool
+    def _acquire(self):
+        """공유 풀에서 MariaDB 연결 획득 (async with로 사용)"""
+        return db_pool_manager.acquire(
+            "agent_trace",
+            host=self.db_host,
+            port=self.db_port,
+            user=self.db_user,
+            password=self.db_password,
+            db=self.db_name
+        )
     
     async def start_trace(
         self,
@@ -107,29 +107,6 @@ class AgentTraceAdapter:
         
         logger.info(f"Trace started: {trace_id} for agent {agent_name}")
         
-        # #region agent log
-        try:
-            import json
-            log_entry = {
-                "location": "agent_trace_adapter.py:108",
-                "message": "Trace started",
-                "data": {
-                    "trace_id": trace_id,
-                    "agent_id": agent_id,
-                    "agent_name": agent_name,
-                    "active_traces_count": len(self._active_traces)
-                },
-                "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A"
-            }
-            with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-        except:
-            pass
-        # #endregion
-        
         return trace_id
     
     async def end_trace(
@@ -151,53 +128,10 @@ class AgentTraceAdapter:
             tokens: 총 토큰 수
             
         Returns:
-            성공 여부
+            성공 여부 (스팬이 저장 대기열에 들어갔는지; 실제 저장은 span_exporter가 배치로 수행)
         """
-        # #region agent log
-        try:
-            import json
-            log_entry = {
-                "location": "agent_trace_adapter.py:132",
-                "message": "Trace end attempt",
-                "data": {
-                    "trace_id": trace_id,
-                    "trace_found": trace_id in self._active_traces,
-                    "active_traces_count": len(self._active_traces),
-                    "has_error": bool(error)
-                },
-                "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A"
-            }
-            with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-        except:
-            pass
-        # #endregion
-        
         if trace_id not in self._active_traces:
             logger.warning(f"Trace not found: {trace_id}")
-            # #region agent log
-            try:
-                import json
-                log_entry = {
-                    "location": "agent_trace_adapter.py:134",
-                    "message": "Trace not found in active traces",
-                    "data": {
-                        "trace_id": trace_id,
-                        "available_trace_ids": list(self._active_traces.keys())[:5]
-                    },
-                    "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "A"
-                }
-                with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                    f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-            except:
-                pass
-            # #endregion
             return False
         
         trace_data = self._active_traces.pop(trace_id)
@@ -230,285 +164,12 @@ class AgentTraceAdapter:
             'tags': trace_data['tags']
         }
         
-        # ClickHouse에 직접 저장
-        success = await self._save_to_clickhouse(span_data)
-        
-        # #region agent log
-        try:
-            import json
-            log_entry = {
-                "location": "agent_trace_adapter.py:167",
-                "message": "ClickHouse save result",
-                "data": {
-                    "trace_id": trace_id,
-                    "clickhouse_success": success,
-                    "status_code": status_code
-                },
-                "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A"
-            }
-            with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-        except:
-            pass
-        # #endregion
-        
-        # MariaDB agent_sessions 테이블에도 저장 (기존 호환성)
-        try:
-            await self._save_to_mariadb(span_data)
-            # #region agent log
-            try:
-                import json
-                log_entry = {
-                    "location": "agent_trace_adapter.py:170",
-                    "message": "MariaDB save completed",
-                    "data": {
-                        "trace_id": trace_id
-                    },
-                    "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "A"
-                }
-                with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                    f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-            except:
-                pass
-            # #endregion
-        except Exception as mariadb_error:
-            logger.error(f"MariaDB save failed: {mariadb_error}")
-            # #region agent log
-            try:
-                import json
-                log_entry = {
-                    "location": "agent_trace_adapter.py:170",
-                    "message": "MariaDB save failed",
-                    "data": {
-                        "trace_id": trace_id,
-                        "error": str(mariadb_error)[:200]
-                    },
-                    "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "A"
-                }
-                with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                    f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-            except:
-                pass
-            # #endregion
+        # ClickHouse otel_traces / MariaDB agent_sessions 저장은 백그라운드 배치로 수행
+        success = self.span_exporter.enqueue(span_data)
         
         logger.info(f"Trace ended: {trace_id}, status={status_code}, duration={duration_ns/1_000_000}ms")
         return success
     
-    async def _save_to_clickhouse(self, span_data: Dict[str, Any]) -> bool:
-        """ClickHouse에 스팬 저장"""
-        try:
-            # otel_traces 테이블에 맞는 형식으로 변환
-            resource_attrs = {
-                'service.name': span_data['service_name'],
-                'project_id': span_data['project_id']
-            }
-            
-            span_attrs = {
-                'agent.id': span_data['agent_id'],
-                'agent.name': span_data['agent_name'],
-                'agent.type': span_data['agent_type'],
-                'metadata.agent_id': span_data['agent_id'],
-                'metadata.agent_name': span_data['agent_name'],
-                'gen_ai.usage.total_cost': str(span_data['cost']),
-                'gen_ai.usage.total_tokens': str(span_data['tokens'])
-            }
-            
-            if span_data['inputs']:
-                span_attrs['agent.inputs'] = json.dumps(span_data['inputs'])[:1000]
-            if span_data['outputs']:
-                span_attrs['agent.outputs'] = json.dumps(span_data['outputs'])[:1000]
-            if span_data['tags']:
-                span_attrs['agent.tags'] = json.dumps(span_data['tags'])
-            
-            # ClickHouse INSERT 쿼리
-            query = f"""
-            INSERT INTO {self.clickhouse_database}.otel_traces (
-                Timestamp,
-                TraceId,
-                SpanId,
-                ParentSpanId,
-                TraceState,
-                SpanName,
-                SpanKind,
-                ServiceName,
-                ResourceAttributes,
-                ScopeName,
-                ScopeVersion,
-                SpanAttributes,
-                Duration,
-                StatusCode,
-                StatusMessage,
-                Events.Timestamp,
-                Events.Name,
-                Events.Attributes,
-                Links.TraceId,
-                Links.SpanId,
-                Links.TraceState,
-                Links.Attributes
-            ) VALUES (
-                '{span_data['start_time'].strftime('%Y-%m-%d %H:%M:%S.%f')}',
-                '{span_data['trace_id']}',
-                '{span_data['span_id']}',
-                '{span_data['parent_span_id']}',
-                '',
-                '{span_data['span_name']}',
-                '{span_data['span_kind']}',
-                '{span_data['service_name']}',
-                {self._format_map(resource_attrs)},
-                'agent-portal',
-                '1.0.0',
-                {self._format_map(span_attrs)},
-                {span_data['duration_ns']},
-                '{span_data['status_code']}',
-                '{span_data.get('status_message') or ''}',
-                [],
-                [],
-                [],
-                [],
-                [],
-                [],
-                []
-            )
-            """
-            
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"http://{self.clickhouse_host}:{self.clickhouse_port}/",
-                    params={"query": query, "user": "default", "password": "password"}
-                )
-                
-                if response.status_code == 200:
-                    logger.debug(f"Span saved to ClickHouse: {span_data['trace_id']}")
-                    # #region agent log
-                    try:
-                        import json
-                        log_entry = {
-                            "location": "agent_trace_adapter.py:259",
-                            "message": "ClickHouse insert success",
-                            "data": {
-                                "trace_id": span_data['trace_id'],
-                                "status_code": response.status_code
-                            },
-                            "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A"
-                        }
-                        with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-                    except:
-                        pass
-                    # #endregion
-                    return True
-                else:
-                    logger.error(f"ClickHouse insert failed: {response.text}")
-                    # #region agent log
-                    try:
-                        import json
-                        log_entry = {
-                            "location": "agent_trace_adapter.py:262",
-                            "message": "ClickHouse insert failed",
-                            "data": {
-                                "trace_id": span_data['trace_id'],
-                                "status_code": response.status_code,
-                                "response_text": response.text[:500]
-                            },
-                            "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "A"
-                        }
-                        with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-                    except:
-                        pass
-                    # #endregion
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"Failed to save span to ClickHouse: {e}")
-            # #region agent log
-            try:
-                import json
-                log_entry = {
-                    "location": "agent_trace_adapter.py:265",
-                    "message": "ClickHouse save exception",
-                    "data": {
-                        "trace_id": span_data.get('trace_id', 'unknown'),
-                        "error_type": type(e).__name__,
-                        "error_message": str(e)[:200]
-                    },
-                    "timestamp": int(datetime.utcnow().timestamp() * 1000),
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "A"
-                }
-                with open("/Users/lchangoo/Workspace/agent-portal/.cursor/debug.log", "a", encoding="utf-8") as f:
-                    f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-            except:
-                pass
-            # #endregion
-            return False
-    
-    async def _save_to_mariadb(self, span_data: Dict[str, Any]) -> None:
-        """MariaDB agent_sessions에 저장 (기존 호환성)"""
-        try:
-            pool = await self._get_pool()
-            
-            async with pool.acquire() as conn:
-                async with conn.cursor() as cur:
-                    await cur.execute("""
-                        INSERT INTO agent_sessions (
-                            session_id, project_id, agent_name, status,
-                            start_time, end_time, duration, tags,
-                            total_cost, total_tokens, error_message
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON DUPLICATE KEY UPDATE
-                            end_time = VALUES(end_time),
-                            duration = VALUES(duration),
-                            status = VALUES(status),
-                            total_cost = VALUES(total_cost),
-                            total_tokens = VALUES(total_tokens),
-                            error_message = VALUES(error_message)
-                    """, (
-                        span_data['trace_id'],
-                        span_data['project_id'],
-                        span_data['agent_name'],
-                        'error' if span_data['status_code'] == 'ERROR' else 'completed',
-                        span_data['start_time'],
-                        span_data['end_time'],
-                        span_data['duration_ns'] // 1_000_000,  # ms
-                        json.dumps(span_data['tags']),
-                        span_data['cost'],
-                        span_data['tokens'],
-                        span_data.get('status_message')
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Failed to save to MariaDB: {e}")
-    
-    def _format_map(self, d: Dict[str, Any]) -> str:
-        """ClickHouse Map 형식으로 변환"""
-        if not d:
-            return "map()"
-        
-        pairs = []
-        for k, v in d.items():
-            # 값을 문자열로 변환하고 이스케이프
-            v_str = str(v).replace("'", "\\'")
-            pairs.append(f"'{k}', '{v_str}'")
-        
-        return f"map({', '.join(pairs)})"
-    
     def get_active_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
         """활성 트레이스 조회"""
         return self._active_traces.get(trace_id)
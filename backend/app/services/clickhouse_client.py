@@ -0,0 +1,198 @@
+"""
+ClickHouse HTTP Client
+
+Application-scoped ClickHouse client for monitoring queries.
+
+- FastAPI lifespan에서 start()/close() 호출 (keep-alive 연결 재사용)
+- 결과는 JSONCompactEachRowWithNamesAndTypes로 받아 줄 단위로 스트리밍 디코딩
+  (행마다 컬럼 이름을 반복하지 않아 JSONEachRow보다 응답/파싱 비용이 작음)
+- 서버 측 쿼리 파라미터 지원: SQL에 {name:Type}, params={"name": value}
+- insert(): 여러 행을 JSONEachRow 본문 하나로 INSERT (MergeTree part는 요청당 1개)
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RESULT_FORMAT = "JSONCompactEachRowWithNamesAndTypes"
+
+
+class ClickHouseError(Exception):
+    """ClickHouse가 결과 스트리밍 도중 보낸 예외."""
+
+
+def _param_value(value: Any) -> str:
+    """Python 값을 ClickHouse HTTP 쿼리 파라미터 문자열로 변환."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if hasattr(value, "strftime"):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(json.dumps(v) if isinstance(v, str) else str(v) for v in value) + "]"
+    return str(value)
+
+
+class ClickHouseClient:
+    """Shared keep-alive ClickHouse HTTP client."""
+    
+    def __init__(
+        self,
+        host: str = "monitoring-clickhouse",
+        port: int = 8123,
+        user: str = "default",
+        password: str = "password",
+        database: str = "otel_2",
+        timeout: float = 30.0,
+        max_connections: int = 20
+    ):
+        """Initialize client.
+        
+        Args:
+            host: ClickHouse host
+            port: ClickHouse HTTP port
+            user: User
+            password: Password
+            database: Default database
+            timeout: Query timeout in seconds
+            max_connections: Maximum concurrent HTTP connections
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.timeout = timeout
+        self.max_connections = max_connections
+        
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+    
+    def configure_from_settings(self) -> None:
+        """Apply CLICKHOUSE_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.host = settings.CLICKHOUSE_HOST
+        self.port = settings.CLICKHOUSE_HTTP_PORT
+        self.user = settings.CLICKHOUSE_USER
+        self.password = settings.CLICKHOUSE_PASSWORD
+        self.database = settings.CLICKHOUSE_DATABASE
+        self.timeout = settings.CLICKHOUSE_QUERY_TIMEOUT
+        self.max_connections = settings.CLICKHOUSE_MAX_CONNECTIONS
+    
+    async def start(self) -> None:
+        """Apply settings and open the connection pool."""
+        await self.close()
+        self.configure_from_settings()
+        self._get_client()
+        logger.info(f"ClickHouse client ready ({self.base_url}, max {self.max_connections} connections)")
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 (lifespan 밖에서 호출되면 지연 생성)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "X-ClickHouse-User": self.user,
+                    "X-ClickHouse-Key": self.password,
+                },
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=30.0
+                )
+            )
+        return self._client
+    
+    async def query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Run a SELECT and decode rows while the response streams in.
+        
+        Args:
+            query: SQL (FORMAT 절 없이), 파라미터는 {name:Type} 형식
+            params: 서버 측 쿼리 파라미터 값
+        
+        Returns:
+            행 리스트 (컬럼 이름 -> 값)
+        
+        Raises:
+            httpx.HTTPStatusError: ClickHouse가 오류 상태 코드를 반환한 경우
+            ClickHouseError: 결과 전송 도중 ClickHouse 예외가 발생한 경우
+        """
+        url_params = {"database": self.database}
+        for name, value in (params or {}).items():
+            url_params[f"param_{name}"] = _param_value(value)
+        
+        client = self._get_client()
+        request = client.build_request(
+            "POST",
+            "",
+            params=url_params,
+            content=f"{query} FORMAT {RESULT_FORMAT}"
+        )
+        response = await client.send(request, stream=True)
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+                response.raise_for_status()
+            
+            rows: List[Dict[str, Any]] = []
+            names: Optional[List[str]] = None
+            header_lines = 0
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                # 첫 줄: 컬럼 이름, 둘째 줄: 컬럼 타입
+                if header_lines < 2:
+                    if header_lines == 0:
+                        names = json.loads(line)
+                    header_lines += 1
+                    continue
+                if line.startswith("Code:"):
+                    raise ClickHouseError(line)
+                rows.append(dict(zip(names, json.loads(line))))
+            return rows
+        finally:
+            await response.aclose()
+    
+    async def insert(self, table: str, columns: List[str], rows: List[Dict[str, Any]]) -> None:
+        """Insert rows in one request (JSONEachRow body).
+        
+        Args:
+            table: 테이블 이름 (database 미포함)
+            columns: INSERT 컬럼 목록 (나머지는 기본값)
+            rows: 컬럼 이름 -> 값
+        
+        Raises:
+            httpx.HTTPError: 연결 실패 또는 ClickHouse가 오류 상태 코드를 반환한 경우
+        """
+        if not rows:
+            return
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        body = "\n".join(json.dumps(row, ensure_ascii=False, default=str) for row in rows)
+        
+        response = await self._get_client().post(
+            "",
+            params={
+                "database": self.database,
+                "query": f"INSERT INTO {table} ({column_list}) FORMAT JSONEachRow"
+            },
+            content=body.encode("utf-8")
+        )
+        response.raise_for_status()
+    
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Singleton instance
+clickhouse_client = ClickHouseClient()
@@ -0,0 +1,190 @@
+"""
+DataCloud Blocking Driver Executors
+
+Bounded, per-dialect thread pools for blocking database drivers.
+
+- Oracle/HANA/Databricks/ClickHouse 드라이버와 SQLAlchemy 리플렉션 호출은 dialect별 전용 스레드 풀에서 실행
+  (느린 웨어하우스 쿼리가 기본 executor나 이벤트 루프를 막아 다른 요청/SSE 스트림까지 멈추지 않도록)
+- dialect별 대기 작업 수 상한 (초과 시 즉시 실패), 대기 작업 수/대기 시간을 OTEL metrics로 기록
+- timeout 초과 또는 요청 취소(클라이언트 연결 종료) 시 드라이버 cancel API 호출
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_instruments: Optional[Dict[str, Any]] = None
+
+
+def _get_instruments() -> Dict[str, Any]:
+    """OTEL instruments (지연 초기화)."""
+    global _instruments
+    if _instruments is None:
+        from app.telemetry.otel import get_meter
+        meter = get_meter("datacloud_executor")
+        _instruments = {
+            "queue_depth": meter.create_up_down_counter(
+                "datacloud_executor_queue_depth",
+                description="Blocking DataCloud driver calls submitted and not yet finished"
+            ),
+            "wait": meter.create_histogram(
+                "datacloud_executor_queue_wait_ms",
+                description="Time a blocking driver call waited for a worker thread"
+            ),
+            "rejected": meter.create_counter(
+                "datacloud_executor_rejected_total",
+                description="Blocking driver calls rejected because the dialect queue was full"
+            ),
+            "cancelled": meter.create_counter(
+                "datacloud_executor_cancelled_total",
+                description="Blocking driver calls cancelled by timeout or client disconnect"
+            ),
+        }
+    return _instruments
+
+
+def _record(name: str, value: float, driver: str, **attributes: str) -> None:
+    try:
+        instrument = _get_instruments()[name]
+        attributes = {"driver": driver, **attributes}
+        if hasattr(instrument, "record"):
+            instrument.record(value, attributes=attributes)
+        else:
+            instrument.add(value, attributes=attributes)
+    except Exception as e:
+        logger.debug(f"Failed to record datacloud executor metric {name}: {e}")
+
+
+class DriverExecutorFull(RuntimeError):
+    """dialect 실행 대기열이 가득 참."""
+
+
+class DataCloudExecutors:
+    """Per-dialect bounded thread pools for blocking driver calls."""
+    
+    def __init__(self, max_workers: int = 4, max_queue: int = 32):
+        """Initialize executors.
+        
+        Args:
+            max_workers: Worker threads per dialect
+            max_queue: Maximum calls per dialect waiting for or holding a worker
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._pending: Dict[str, int] = {}
+    
+    def configure_from_settings(self) -> None:
+        """Apply DATACLOUD_EXECUTOR_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.max_workers = settings.DATACLOUD_EXECUTOR_MAX_WORKERS
+        self.max_queue = settings.DATACLOUD_EXECUTOR_MAX_QUEUE
+    
+    def _get_executor(self, driver: str) -> ThreadPoolExecutor:
+        executor = self._executors.get(driver)
+        if executor is None:
+            executor = self._executors[driver] = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"datacloud-{driver}"
+            )
+        return executor
+    
+    async def run(
+        self,
+        driver: str,
+        func: Callable[[], Any],
+        timeout: Optional[float] = None,
+        cancel: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        """Run a blocking call on the dialect's thread pool.
+        
+        Args:
+            driver: 드라이버 종류 (datacloud_pool.driver_type)
+            func: 실행할 동기 함수
+            timeout: 초과 시 cancel 호출 후 asyncio.TimeoutError
+            cancel: 실행 중인 호출을 중단하는 드라이버 API (예: oracledb Connection.cancel)
+        
+        Raises:
+            DriverExecutorFull: 대기열이 가득 찬 경우
+            asyncio.TimeoutError: timeout 초과
+        """
+        pending = self._pending.get(driver, 0)
+        if pending >= self.max_queue:
+            _record("rejected", 1, driver)
+            raise DriverExecutorFull(f"Too many pending {driver} queries ({pending})")
+        
+        submitted_at = time.perf_counter()
+        
+        def _run():
+            _record("wait", (time.perf_counter() - submitted_at) * 1000, driver)
+            return func()
+        
+        loop = asyncio.get_running_loop()
+        
+        def _on_done(_):
+            # 워커 스레드가 실제로 끝났을 때만 대기열 슬롯 반환
+            try:
+                loop.call_soon_threadsafe(self._release, driver)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘 (종료 중)
+                pass
+        
+        self._pending[driver] = pending + 1
+        _record("queue_depth", 1, driver)
+        # asyncio future는 cancel() 시 스레드 실행 여부와 관계없이 바로 취소되므로
+        # concurrent future로 실행 상태를 판단
+        thread_future = self._get_executor(driver).submit(_run)
+        thread_future.add_done_callback(_on_done)
+        future = asyncio.wrap_future(thread_future)
+        # shield로 기다리다 취소되면 결과를 아무도 읽지 않으므로 예외를 여기서 소비
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            reason = "timeout" if isinstance(e, asyncio.TimeoutError) else "cancelled"
+            _record("cancelled", 1, driver, reason=reason)
+            if not thread_future.cancel() and thread_future.running() and cancel is not None:
+                # 이미 실행 중 - 드라이버 cancel API로 중단 (같은 풀에서 기다리지 않도록 별도 스레드)
+                try:
+                    await loop.run_in_executor(None, cancel)
+                except Exception as cancel_error:
+                    logger.warning(f"Failed to cancel {driver} call: {cancel_error}")
+            raise
+    
+    def _release(self, driver: str) -> None:
+        self._pending[driver] = max(0, self._pending.get(driver, 1) - 1)
+        _record("queue_depth", -1, driver)
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Pending call counts keyed by driver."""
+        return {
+            driver: {"pending": self._pending.get(driver, 0), "max_workers": self.max_workers}
+            for driver in self._executors
+        }
+    
+    def shutdown(self) -> None:
+        """Stop every thread pool (실행 중인 호출은 끝까지 진행)."""
+        executors = list(self._executors.values())
+        self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton instance
+datacloud_executors = DataCloudExecutors()
+
+
+async def run_blocking(
+    driver: str,
+    func: Callable[[], Any],
+    timeout: Optional[float] = None,
+    cancel: Optional[Callable[[], Any]] = None
+) -> Any:
+    """동기 드라이버 호출을 dialect 전용 스레드 풀에서 실행 (datacloud_executors.run)."""
+    return await datacloud_executors.run(driver, func, timeout=timeout, cancel=cancel)
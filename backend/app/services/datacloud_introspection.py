@@ -0,0 +1,377 @@
+"""
+DataCloud Schema Introspection
+
+Bulk schema metadata collection for DataCloud connections.
+
+- MariaDB/MySQL: information_schema, PostgreSQL: pg_catalog, ClickHouse: system.tables/system.columns
+  → warm 드라이버 풀 연결 하나로 테이블/컬럼/키 정보를 쿼리 3~4회에 조회
+- 그 외 dialect (Oracle/HANA/Databricks) 또는 bulk 조회 실패 시 SQLAlchemy 리플렉션
+  (Oracle은 SQLAlchemy 2.0 get_multi_* 스키마 단위 bulk, 나머지는 테이블 단위로 동시 실행)
+- table_fingerprint(): 테이블 구조 해시 (캐시 저장 시 바뀐 테이블만 다시 기록)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import aiomysql
+
+from app.services.datacloud_executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# 메타데이터 수집에서 제외하는 시스템 스키마
+SYSTEM_SCHEMAS = (
+    'information_schema', 'INFORMATION_SCHEMA',
+    'pg_catalog', 'pg_toast',
+    'mysql', 'performance_schema', 'sys',
+    'system',
+)
+
+_SYSTEM_SCHEMA_LIST = ", ".join(f"'{schema}'" for schema in SYSTEM_SCHEMAS)
+
+MYSQL_TABLES_QUERY = f"""
+SELECT TABLE_SCHEMA AS table_schema, TABLE_NAME AS table_name,
+       TABLE_COMMENT AS table_comment, TABLE_ROWS AS row_count
+FROM information_schema.TABLES
+WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA NOT IN ({_SYSTEM_SCHEMA_LIST})
+"""
+
+MYSQL_COLUMNS_QUERY = f"""
+SELECT TABLE_SCHEMA AS table_schema, TABLE_NAME AS table_name, COLUMN_NAME AS column_name,
+       UPPER(COLUMN_TYPE) AS data_type, IS_NULLABLE = 'YES' AS is_nullable,
+       COLUMN_KEY = 'PRI' AS is_primary_key, COLUMN_DEFAULT AS column_default,
+       COLUMN_COMMENT AS column_comment
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA NOT IN ({_SYSTEM_SCHEMA_LIST})
+ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+"""
+
+MYSQL_FOREIGN_KEYS_QUERY = f"""
+SELECT TABLE_SCHEMA AS table_schema, TABLE_NAME AS table_name, COLUMN_NAME AS column_name,
+       REFERENCED_TABLE_SCHEMA AS ref_schema, REFERENCED_TABLE_NAME AS ref_table,
+       REFERENCED_COLUMN_NAME AS ref_column
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE REFERENCED_TABLE_NAME IS NOT NULL AND TABLE_SCHEMA NOT IN ({_SYSTEM_SCHEMA_LIST})
+"""
+
+# PostgreSQL information_schema 뷰는 권한 검사 때문에 느려서 pg_catalog를 직접 조회
+_PG_SCHEMA_FILTER = f"""
+n.nspname NOT IN ({_SYSTEM_SCHEMA_LIST})
+AND n.nspname NOT LIKE 'pg_temp%'
+AND n.nspname NOT LIKE 'pg_toast_temp%'
+"""
+
+PG_TABLES_QUERY = f"""
+SELECT n.nspname AS table_schema, c.relname AS table_name,
+       obj_description(c.oid, 'pg_class') AS table_comment,
+       GREATEST(c.reltuples, 0)::bigint AS row_count
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p') AND NOT c.relispartition AND {_PG_SCHEMA_FILTER}
+"""
+
+PG_COLUMNS_QUERY = f"""
+SELECT n.nspname AS table_schema, c.relname AS table_name, a.attname AS column_name,
+       format_type(a.atttypid, a.atttypmod) AS data_type, NOT a.attnotnull AS is_nullable,
+       EXISTS (
+           SELECT 1 FROM pg_constraint con
+           WHERE con.conrelid = c.oid AND con.contype = 'p' AND a.attnum = ANY(con.conkey)
+       ) AS is_primary_key,
+       pg_get_expr(d.adbin, d.adrelid) AS column_default,
+       col_description(c.oid, a.attnum) AS column_comment
+FROM pg_attribute a
+JOIN pg_class c ON c.oid = a.attrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+WHERE a.attnum > 0 AND NOT a.attisdropped
+  AND c.relkind IN ('r', 'p') AND NOT c.relispartition AND {_PG_SCHEMA_FILTER}
+ORDER BY n.nspname, c.relname, a.attnum
+"""
+
+PG_FOREIGN_KEYS_QUERY = f"""
+SELECT n.nspname AS table_schema, c.relname AS table_name, a.attname AS column_name,
+       rn.nspname AS ref_schema, rc.relname AS ref_table, ra.attname AS ref_column
+FROM pg_constraint con
+JOIN pg_class c ON c.oid = con.conrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_class rc ON rc.oid = con.confrelid
+JOIN pg_namespace rn ON rn.oid = rc.relnamespace
+CROSS JOIN LATERAL unnest(con.conkey, con.confkey) AS k(attnum, ref_attnum)
+JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+JOIN pg_attribute ra ON ra.attrelid = con.confrelid AND ra.attnum = k.ref_attnum
+WHERE con.contype = 'f' AND {_PG_SCHEMA_FILTER}
+"""
+
+CLICKHOUSE_TABLES_QUERY = f"""
+SELECT database AS table_schema, name AS table_name,
+       comment AS table_comment, total_rows AS row_count
+FROM system.tables
+WHERE database NOT IN ({_SYSTEM_SCHEMA_LIST})
+  AND NOT is_temporary AND engine NOT LIKE '%View'
+"""
+
+CLICKHOUSE_COLUMNS_QUERY = f"""
+SELECT database AS table_schema, table AS table_name, name AS column_name,
+       type AS data_type, startsWith(type, 'Nullable(') AS is_nullable,
+       is_in_primary_key AS is_primary_key, default_expression AS column_default,
+       comment AS column_comment
+FROM system.columns
+WHERE database NOT IN ({_SYSTEM_SCHEMA_LIST})
+ORDER BY database, table, position
+"""
+
+# 카탈로그를 직접 조회하는 드라이버 (datacloud_pool.driver_type 기준)
+BULK_DRIVERS = ('mysql', 'postgresql', 'clickhouse')
+
+# SQLAlchemy 2.0 get_multi_* 를 스키마 단위 쿼리로 구현한 dialect
+MULTI_REFLECTION_DRIVERS = ('oracle',)
+
+# fingerprint 계산에 쓰는 테이블/컬럼 속성 (row_count처럼 자주 바뀌는 값은 제외)
+_FINGERPRINT_TABLE_KEYS = ('schema', 'name', 'type', 'comment')
+_FINGERPRINT_COLUMN_KEYS = ('name', 'type', 'nullable', 'primary_key', 'foreign_key', 'foreign_key_ref', 'comment', 'default')
+
+
+def table_fingerprint(table: Dict[str, Any]) -> str:
+    """테이블 구조(컬럼/키/코멘트)의 SHA-256 해시."""
+    payload = {key: table.get(key) for key in _FINGERPRINT_TABLE_KEYS}
+    payload['columns'] = [
+        {key: col.get(key) for key in _FINGERPRINT_COLUMN_KEYS}
+        for col in table.get('columns', [])
+    ]
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _assemble_tables(
+    table_rows: Iterable[Dict[str, Any]],
+    column_rows: Iterable[Dict[str, Any]],
+    foreign_key_rows: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """카탈로그 조회 결과를 _fetch_schema_from_db 테이블 형식으로 조립."""
+    tables: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for row in table_rows:
+        key = (row['table_schema'], row['table_name'])
+        tables[key] = {
+            'schema': row['table_schema'],
+            'name': row['table_name'],
+            'type': 'table',
+            'comment': row['table_comment'] or None,
+            'row_count': int(row['row_count']) if row['row_count'] is not None else None,
+            'columns': []
+        }
+    
+    foreign_keys = {
+        (row['table_schema'], row['table_name'], row['column_name']):
+            f"{row['ref_schema']}.{row['ref_table']}.{row['ref_column']}"
+        for row in foreign_key_rows
+    }
+    
+    for row in column_rows:
+        table = tables.get((row['table_schema'], row['table_name']))
+        if table is None:
+            # 뷰/파티션 등 수집 대상이 아닌 테이블의 컬럼
+            continue
+        foreign_key_ref = foreign_keys.get((row['table_schema'], row['table_name'], row['column_name']))
+        table['columns'].append({
+            'name': row['column_name'],
+            'type': str(row['data_type']),
+            'nullable': bool(row['is_nullable']),
+            'primary_key': bool(row['is_primary_key']),
+            'foreign_key': foreign_key_ref is not None,
+            'foreign_key_ref': foreign_key_ref,
+            'comment': row['column_comment'] or None,
+            'default': str(row['column_default']) if row['column_default'] else None
+        })
+    
+    return list(tables.values())
+
+
+async def introspect_bulk(driver: str, driver_conn: Any, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """카탈로그 bulk 조회로 전체 테이블 메타데이터 수집.
+    
+    Args:
+        driver: BULK_DRIVERS 중 하나
+        driver_conn: datacloud_pool_registry.acquire()가 준 연결
+        timeout: 쿼리 하나의 제한 시간(초)
+    
+    Returns:
+        테이블 리스트 (schema, name, type, comment, row_count, columns)
+    """
+    if driver == 'mysql':
+        results = []
+        async with driver_conn.cursor(aiomysql.DictCursor) as cur:
+            for query in (MYSQL_TABLES_QUERY, MYSQL_COLUMNS_QUERY, MYSQL_FOREIGN_KEYS_QUERY):
+                await asyncio.wait_for(cur.execute(query), timeout)
+                results.append(await cur.fetchall())
+        return _assemble_tables(*results)
+    
+    if driver == 'postgresql':
+        results = [
+            await driver_conn.fetch(query, timeout=timeout)
+            for query in (PG_TABLES_QUERY, PG_COLUMNS_QUERY, PG_FOREIGN_KEYS_QUERY)
+        ]
+        return _assemble_tables(*results)
+    
+    if driver == 'clickhouse':
+        def _query(query: str) -> List[Dict[str, Any]]:
+            settings = {'max_execution_time': int(timeout)} if timeout else None
+            return list(driver_conn.query(query, settings=settings).named_results())
+        
+        table_rows = await run_blocking(driver, lambda: _query(CLICKHOUSE_TABLES_QUERY), timeout=timeout)
+        column_rows = await run_blocking(driver, lambda: _query(CLICKHOUSE_COLUMNS_QUERY), timeout=timeout)
+        # ClickHouse에는 외래키가 없음
+        return _assemble_tables(table_rows, column_rows, [])
+    
+    raise ValueError(f"Bulk introspection is not supported for {driver}")
+
+
+def _reflected_table(
+    schema: Optional[str],
+    table_name: str,
+    comment: Optional[str],
+    columns: List[Dict[str, Any]],
+    pk: Optional[Dict[str, Any]],
+    fks: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """SQLAlchemy Inspector 결과를 테이블 형식으로 변환."""
+    pk_columns = pk.get('constrained_columns', []) if pk else []
+    foreign_keys = {}
+    for fk in fks:
+        referred_schema = fk.get('referred_schema') or schema
+        for column, referred_column in zip(fk.get('constrained_columns', []), fk.get('referred_columns', [])):
+            foreign_keys[column] = f"{referred_schema}.{fk.get('referred_table')}.{referred_column}"
+    
+    return {
+        'schema': schema,
+        'name': table_name,
+        'type': 'table',
+        'comment': comment,
+        'row_count': None,
+        'columns': [
+            {
+                'name': col['name'],
+                'type': str(col['type']),
+                'nullable': col.get('nullable', True),
+                'primary_key': col['name'] in pk_columns,
+                'foreign_key': col['name'] in foreign_keys,
+                'foreign_key_ref': foreign_keys.get(col['name']),
+                'comment': col.get('comment'),
+                'default': str(col.get('default')) if col.get('default') else None
+            }
+            for col in columns
+        ]
+    }
+
+
+def _reflect_one(engine: Any, schema: Optional[str], table_name: str) -> Optional[Dict[str, Any]]:
+    """테이블 하나 리플렉션 (동기, 실패 시 None)."""
+    from sqlalchemy import inspect
+    
+    try:
+        with engine.connect() as connection:
+            inspector = inspect(connection)
+            columns = inspector.get_columns(table_name, schema=schema)
+            pk = inspector.get_pk_constraint(table_name, schema=schema)
+            fks = inspector.get_foreign_keys(table_name, schema=schema)
+            try:
+                table_comment = inspector.get_table_comment(table_name, schema=schema)
+                comment = table_comment.get('text') if table_comment else None
+            except Exception:
+                comment = None
+    except Exception as e:
+        logger.warning(f"Failed to inspect table {table_name}: {e}")
+        return None
+    return _reflected_table(schema, table_name, comment, columns, pk, fks)
+
+
+def _reflect_schema_multi(engine: Any, schema: Optional[str]) -> List[Dict[str, Any]]:
+    """스키마 하나를 get_multi_* 로 리플렉션 (동기)."""
+    from sqlalchemy import inspect
+    
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        columns = inspector.get_multi_columns(schema=schema)
+        pks = inspector.get_multi_pk_constraint(schema=schema)
+        fks = inspector.get_multi_foreign_keys(schema=schema)
+        try:
+            comments = inspector.get_multi_table_comment(schema=schema)
+        except Exception:
+            comments = {}
+    
+    return [
+        _reflected_table(
+            schema, key[1],
+            (comments.get(key) or {}).get('text'),
+            table_columns, pks.get(key), fks.get(key, [])
+        )
+        for key, table_columns in columns.items()
+    ]
+
+
+def _list_tables(engine: Any) -> List[Tuple[Optional[str], str]]:
+    """(schema, table_name) 목록 (동기)."""
+    from sqlalchemy import inspect
+    
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        try:
+            schemas = inspector.get_schema_names()
+        except Exception:
+            schemas = [None]
+        
+        table_keys = []
+        for schema in schemas:
+            if schema in SYSTEM_SCHEMAS:
+                continue
+            try:
+                table_names = inspector.get_table_names(schema=schema)
+            except Exception:
+                table_names = inspector.get_table_names()
+            table_keys.extend((schema, table_name) for table_name in table_names)
+        return table_keys
+
+
+async def reflect_schema(driver: str, url: str, concurrency: int) -> List[Dict[str, Any]]:
+    """SQLAlchemy 리플렉션으로 전체 테이블 메타데이터 수집.
+    
+    MULTI_REFLECTION_DRIVERS는 스키마 단위 bulk 조회, 나머지는 테이블 단위 조회를
+    concurrency개까지 동시에 실행 (dialect 전용 스레드 풀).
+    
+    Args:
+        driver: 드라이버 종류 (datacloud_pool.driver_type)
+        url: SQLAlchemy URL
+        concurrency: 동시에 리플렉션할 테이블/스키마 수
+    
+    Returns:
+        테이블 리스트 (introspect_bulk와 같은 형식)
+    """
+    from sqlalchemy import create_engine
+    
+    engine = create_engine(url, pool_pre_ping=True, pool_size=concurrency, max_overflow=0)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _bounded(func):
+        async with semaphore:
+            return await run_blocking(driver, func)
+    
+    try:
+        table_keys = await run_blocking(driver, lambda: _list_tables(engine))
+        
+        if driver in MULTI_REFLECTION_DRIVERS:
+            schemas = list(dict.fromkeys(schema for schema, _ in table_keys))
+            results = await asyncio.gather(*(
+                _bounded(lambda schema=schema: _reflect_schema_multi(engine, schema))
+                for schema in schemas
+            ))
+            return [table for tables in results for table in tables]
+        
+        results = await asyncio.gather(*(
+            _bounded(lambda schema=schema, table_name=table_name: _reflect_one(engine, schema, table_name))
+            for schema, table_name in table_keys
+        ))
+        return [table for table in results if table is not None]
+    finally:
+        await run_blocking(driver, engine.dispose)
@@ -0,0 +1,497 @@
+"""
+DataCloud Driver Pool Registry
+
+Warm, bounded driver pools for DataCloud query execution, keyed by connection_id.
+
+- MariaDB/MySQL: aiomysql pool, PostgreSQL: asyncpg pool, ClickHouse: 공유 clickhouse_connect client
+- Oracle/HANA/Databricks (동기 DB-API 드라이버): _SyncConnectionPool
+- 비밀번호는 풀을 만들 때 한 번만 복호화
+- max_lifetime이 지난 풀/연결은 교체, idle_timeout 동안 쓰지 않은 풀은 닫음
+- ping_interval 이상 쉬었던 연결은 체크아웃 시 ping (끊긴 연결 교체)
+- update_connection/delete_connection에서 invalidate() 호출
+- 동기 드라이버 호출은 datacloud_executor의 dialect별 스레드 풀에서 실행
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import aiomysql
+
+from app.services.datacloud_executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# 동기 드라이버 health ping 쿼리
+SYNC_PING_QUERIES = {
+    'oracle': "SELECT 1 FROM DUAL",
+    'hana': "SELECT 1 FROM DUMMY",
+    'databricks': "SELECT 1",
+}
+
+# db_connections.db_type 별칭 -> 드라이버 종류
+DRIVER_TYPES = {
+    'mariadb': 'mysql',
+    'mysql': 'mysql',
+    'postgresql': 'postgresql',
+    'clickhouse': 'clickhouse',
+    'oracle': 'oracle',
+    'hana': 'hana',
+    'sap_hana': 'hana',
+    'databricks': 'databricks',
+    'spark': 'databricks',
+}
+
+
+def driver_type(db_type: str) -> str:
+    """db_type을 드라이버 종류로 변환.
+    
+    Raises:
+        ValueError: 지원하지 않는 db_type
+    """
+    try:
+        return DRIVER_TYPES[db_type]
+    except KeyError:
+        raise ValueError(f"Unsupported database type: {db_type}")
+
+
+class _SyncConnectionPool:
+    """Bounded pool of blocking DB-API connections."""
+    
+    def __init__(
+        self,
+        driver: str,
+        connect: Callable[[], Any],
+        maxsize: int,
+        max_lifetime: float,
+        idle_timeout: float,
+        ping_interval: float
+    ):
+        self.driver = driver
+        self._connect = connect
+        self.maxsize = maxsize
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        
+        # (connection, 생성 시각, 마지막 반환 시각)
+        self._idle: List[Tuple[Any, float, float]] = []
+        self._created: Dict[int, float] = {}
+        self._slots = asyncio.Semaphore(maxsize)
+    
+    @property
+    def size(self) -> int:
+        return len(self._created)
+    
+    @property
+    def freesize(self) -> int:
+        return len(self._idle)
+    
+    async def acquire(self) -> Any:
+        """Check out a connection (reused if still fresh, otherwise new)."""
+        await self._slots.acquire()
+        try:
+            now = time.monotonic()
+            while self._idle:
+                conn, created_at, released_at = self._idle.pop()
+                if now - created_at > self.max_lifetime or now - released_at > self.idle_timeout:
+                    await self._discard(conn)
+                    continue
+                if now - released_at > self.ping_interval and not await self._ping(conn):
+                    await self._discard(conn)
+                    continue
+                return conn
+            
+            conn = await run_blocking(self.driver, self._connect)
+            self._created[id(conn)] = time.monotonic()
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    async def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a connection (discard=True이면 닫고 버림)."""
+        try:
+            created_at = self._created.get(id(conn), 0.0)
+            if discard or time.monotonic() - created_at > self.max_lifetime:
+                await self._discard(conn)
+            else:
+                self._idle.append((conn, created_at, time.monotonic()))
+        finally:
+            self._slots.release()
+    
+    async def _ping(self, conn: Any) -> bool:
+        def _execute_ping():
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SYNC_PING_QUERIES[self.driver])
+                cursor.fetchall()
+            finally:
+                cursor.close()
+        
+        try:
+            await run_blocking(self.driver, _execute_ping)
+            return True
+        except Exception as e:
+            logger.info(f"Discarding dead {self.driver} connection: {e}")
+            return False
+    
+    async def _discard(self, conn: Any) -> None:
+        self._created.pop(id(conn), None)
+        try:
+            await run_blocking(self.driver, conn.close)
+        except Exception as e:
+            logger.debug(f"Error closing {self.driver} connection: {e}")
+    
+    async def evict_idle(self) -> None:
+        """idle_timeout/max_lifetime이 지난 유휴 연결 닫기."""
+        now = time.monotonic()
+        keep = []
+        for conn, created_at, released_at in self._idle:
+            if now - created_at > self.max_lifetime or now - released_at > self.idle_timeout:
+                await self._discard(conn)
+            else:
+                keep.append((conn, created_at, released_at))
+        self._idle = keep
+    
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn, _, _ in idle:
+            await self._discard(conn)
+
+
+class _PoolEntry:
+    """connection_id 하나의 드라이버 풀."""
+    
+    def __init__(self, connection_id: str, driver: str, signature: Tuple[Any, ...], pool: Any):
+        self.connection_id = connection_id
+        self.driver = driver
+        self.signature = signature
+        self.pool = pool
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.in_use = 0
+
+
+class DataCloudPoolRegistry:
+    """Registry of warm driver pools keyed by DataCloud connection_id."""
+    
+    def __init__(
+        self,
+        maxsize: int = 5,
+        max_lifetime: float = 1800.0,
+        idle_timeout: float = 300.0,
+        ping_interval: float = 30.0,
+        connect_timeout: int = 10
+    ):
+        """Initialize registry.
+        
+        Args:
+            maxsize: Maximum connections per connection_id
+            max_lifetime: Recycle pools/connections older than this many seconds
+            idle_timeout: Close pools/connections unused for this many seconds
+            ping_interval: Ping connections idle for longer than this on checkout
+            connect_timeout: Driver connect timeout in seconds
+        """
+        self.maxsize = maxsize
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self.connect_timeout = connect_timeout
+        
+        self._entries: Dict[str, _PoolEntry] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._reaper: Optional[asyncio.Task] = None
+    
+    def configure_from_settings(self) -> None:
+        """Apply DATACLOUD_POOL_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.maxsize = settings.DATACLOUD_POOL_MAX_SIZE
+        self.max_lifetime = settings.DATACLOUD_POOL_MAX_LIFETIME
+        self.idle_timeout = settings.DATACLOUD_POOL_IDLE_TIMEOUT
+        self.ping_interval = settings.DATACLOUD_POOL_PING_INTERVAL
+    
+    async def start(self) -> None:
+        """Apply settings and start the idle reaper (pools are created on first use)."""
+        self.configure_from_settings()
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap())
+        logger.info(
+            f"DataCloud pool registry ready (max {self.maxsize}/connection, "
+            f"lifetime {self.max_lifetime}s, idle {self.idle_timeout}s)"
+        )
+    
+    @asynccontextmanager
+    async def acquire(
+        self,
+        conn_info: Dict[str, Any],
+        decrypt: Callable[[str], str]
+    ) -> AsyncIterator[Any]:
+        """Check out a warm driver connection for a DataCloud connection.
+        
+        Args:
+            conn_info: get_connection_by_id 결과
+            decrypt: password_encrypted 복호화 함수 (풀 생성 시에만 호출)
+        
+        Yields:
+            MariaDB/MySQL: aiomysql.Connection (autocommit)
+            PostgreSQL: asyncpg.Connection
+            ClickHouse: clickhouse_connect Client (공유)
+            Oracle/HANA/Databricks: DB-API connection (동기, run_blocking으로 사용)
+        
+        Raises:
+            ValueError: 지원하지 않는 db_type
+        """
+        entry = await self._get_entry(conn_info, decrypt)
+        stale = time.monotonic() - entry.last_used > self.ping_interval
+        if entry.driver == 'clickhouse' and stale and not await run_blocking(entry.driver, entry.pool.ping):
+            # 공유 client가 끊김 - 새 client로 교체
+            await self.invalidate(entry.connection_id)
+            entry = await self._get_entry(conn_info, decrypt)
+        entry.in_use += 1
+        try:
+            if entry.driver == 'mysql':
+                conn = await entry.pool.acquire()
+                if stale:
+                    try:
+                        await conn.ping(reconnect=False)
+                    except Exception:
+                        # 서버가 끊은 연결 - 버리고 새 연결로 교체
+                        conn.close()
+                        entry.pool.release(conn)
+                        conn = await entry.pool.acquire()
+                try:
+                    yield conn
+                except BaseException as e:
+                    if isinstance(e, (asyncio.CancelledError, asyncio.TimeoutError)):
+                        # timeout/클라이언트 연결 종료 - 연결만 끊으면 서버에서 쿼리가 계속 실행됨
+                        await self._kill_mysql_query(entry, conn)
+                    # 결과를 다 읽지 않은 연결은 재사용하지 않음
+                    conn.close()
+                    raise
+                finally:
+                    entry.pool.release(conn)
+            
+            elif entry.driver == 'postgresql':
+                async with entry.pool.acquire() as conn:
+                    if stale:
+                        await conn.execute("SELECT 1")
+                    yield conn
+            
+            elif entry.driver == 'clickhouse':
+                yield entry.pool
+            
+            else:
+                conn = await entry.pool.acquire()
+                failed = False
+                try:
+                    yield conn
+                except BaseException:
+                    failed = True
+                    raise
+                finally:
+                    await entry.pool.release(conn, discard=failed)
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+    
+    async def _kill_mysql_query(self, entry: _PoolEntry, conn: aiomysql.Connection) -> None:
+        """실행 중인 쿼리를 같은 풀의 다른 연결에서 KILL QUERY로 중단."""
+        try:
+            thread_id = conn.thread_id()
+            killer = await asyncio.wait_for(entry.pool.acquire(), timeout=self.connect_timeout)
+            try:
+                async with killer.cursor() as cur:
+                    await asyncio.wait_for(cur.execute("KILL QUERY %s", (thread_id,)), timeout=self.connect_timeout)
+            finally:
+                entry.pool.release(killer)
+        except Exception as e:
+            logger.warning(f"Failed to kill MySQL query (connection {entry.connection_id}): {e}")
+    
+    async def _get_entry(self, conn_info: Dict[str, Any], decrypt: Callable[[str], str]) -> _PoolEntry:
+        connection_id = conn_info['id']
+        driver = driver_type(conn_info['db_type'])
+        signature = (
+            conn_info['db_type'], conn_info['host'], conn_info['port'],
+            conn_info['database_name'], conn_info['username'], conn_info['password_encrypted']
+        )
+        
+        entry = self._entries.get(connection_id)
+        if entry is not None and self._is_current(entry, signature):
+            return entry
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            entry = self._entries.get(connection_id)
+            if entry is not None and self._is_current(entry, signature):
+                return entry
+            if entry is not None:
+                # 접속 정보가 바뀌었거나 max_lifetime 초과 - 진행 중인 쿼리가 끝나면 닫음
+                self._retire(self._entries.pop(connection_id))
+            
+            pool = await self._create_pool(driver, conn_info, decrypt(conn_info['password_encrypted']))
+            entry = self._entries[connection_id] = _PoolEntry(connection_id, driver, signature, pool)
+            logger.info(f"Created DataCloud {driver} pool for connection {connection_id}")
+            return entry
+    
+    def _is_current(self, entry: _PoolEntry, signature: Tuple[Any, ...]) -> bool:
+        return entry.signature == signature and time.monotonic() - entry.created_at <= self.max_lifetime
+    
+    async def _create_pool(self, driver: str, conn_info: Dict[str, Any], password: str) -> Any:
+        host = conn_info['host']
+        port = conn_info['port']
+        database_name = conn_info['database_name']
+        username = conn_info['username']
+        
+        if driver == 'mysql':
+            return await aiomysql.create_pool(
+                host=host, port=port, user=username,
+                password=password, db=database_name,
+                autocommit=True,
+                minsize=0,
+                maxsize=self.maxsize,
+                pool_recycle=int(self.max_lifetime),
+                connect_timeout=self.connect_timeout
+            )
+        
+        if driver == 'postgresql':
+            import asyncpg
+            return await asyncpg.create_pool(
+                host=host, port=port, user=username,
+                password=password, database=database_name,
+                min_size=0,
+                max_size=self.maxsize,
+                max_inactive_connection_lifetime=self.idle_timeout,
+                timeout=self.connect_timeout
+            )
+        
+        if driver == 'clickhouse':
+            import clickhouse_connect
+            # 세션을 쓰지 않아야 같은 client로 동시 쿼리 가능
+            return await run_blocking(driver, lambda: clickhouse_connect.get_client(
+                host=host, port=port, username=username,
+                password=password, database=database_name,
+                autogenerate_session_id=False,
+                connect_timeout=self.connect_timeout
+            ))
+        
+        if driver == 'oracle':
+            import oracledb
+            
+            def connect():
+                return oracledb.connect(
+                    user=username, password=password,
+                    dsn=f"{host}:{port}/{database_name}"
+                )
+        elif driver == 'hana':
+            from hdbcli import dbapi
+            
+            def connect():
+                return dbapi.connect(
+                    address=host, port=port,
+                    user=username, password=password
+                )
+        else:
+            from databricks import sql as databricks_sql
+            
+            def connect():
+                # database_name에는 HTTP path, password 필드에는 token이 들어옴
+                return databricks_sql.connect(
+                    server_hostname=host,
+                    http_path=database_name,
+                    access_token=password
+                )
+        
+        return _SyncConnectionPool(
+            driver, connect,
+            maxsize=self.maxsize,
+            max_lifetime=self.max_lifetime,
+            idle_timeout=self.idle_timeout,
+            ping_interval=self.ping_interval
+        )
+    
+    async def invalidate(self, connection_id: str) -> None:
+        """Drop the pool of a connection (접속 정보 변경/삭제 시)."""
+        entry = self._entries.pop(connection_id, None)
+        if entry is not None:
+            self._retire(entry)
+            logger.info(f"Invalidated DataCloud pool for connection {connection_id}")
+    
+    def _retire(self, entry: _PoolEntry) -> None:
+        asyncio.create_task(self._close_entry(entry))
+    
+    async def _close_entry(self, entry: _PoolEntry, grace: float = 60.0) -> None:
+        """진행 중인 쿼리를 grace초까지 기다린 뒤 풀 닫기."""
+        deadline = time.monotonic() + grace
+        while entry.in_use and time.monotonic() < deadline:
+            await asyncio.sleep(0.5)
+        try:
+            if entry.driver == 'mysql':
+                entry.pool.close()
+                await entry.pool.wait_closed()
+            elif entry.driver == 'postgresql':
+                await entry.pool.close()
+            elif entry.driver == 'clickhouse':
+                await run_blocking(entry.driver, entry.pool.close)
+            else:
+                await entry.pool.close()
+        except Exception as e:
+            logger.warning(f"Error closing DataCloud pool for connection {entry.connection_id}: {e}")
+    
+    async def _reap(self) -> None:
+        """Close idle pools and idle sync connections periodically."""
+        interval = max(1.0, min(self.idle_timeout, 60.0) / 2)
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                now = time.monotonic()
+                for connection_id, entry in list(self._entries.items()):
+                    if not entry.in_use and now - entry.last_used > self.idle_timeout:
+                        if self._entries.get(connection_id) is entry:
+                            del self._entries[connection_id]
+                            await self._close_entry(entry)
+                    elif isinstance(entry.pool, _SyncConnectionPool):
+                        await entry.pool.evict_idle()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"DataCloud pool reaper error: {e}")
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Pool state keyed by connection_id."""
+        now = time.monotonic()
+        result = {}
+        for connection_id, entry in self._entries.items():
+            state = {
+                "driver": entry.driver,
+                "in_use": entry.in_use,
+                "age_seconds": int(now - entry.created_at),
+                "idle_seconds": int(now - entry.last_used),
+            }
+            if hasattr(entry.pool, "freesize"):
+                state["size"] = entry.pool.size
+                state["free"] = entry.pool.freesize
+            result[connection_id] = state
+        return result
+    
+    async def close(self) -> None:
+        """Stop the reaper and close every pool."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            await self._close_entry(entry, grace=5.0)
+
+
+# Singleton instance
+datacloud_pool_registry = DataCloudPoolRegistry()
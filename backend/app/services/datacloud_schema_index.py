@@ -0,0 +1,393 @@
+"""
+DataCloud Schema Index
+
+Per-connection retrieval index for Text2SQL schema selection.
+
+- 테이블 문서: 스키마/테이블 이름, 테이블 코멘트, 컬럼 이름/코멘트, 비즈니스 용어(db_business_terms)
+- 컬럼 문서: 컬럼 이름/타입/코멘트, 컬럼 비즈니스 용어
+- BM25 (테이블/컬럼 문서) + 임베딩 벡터 (테이블 문서, LiteLLM /v1/embeddings)를
+  Reciprocal Rank Fusion으로 결합해 질문과 관련된 상위 k개 테이블 선택
+- 선택한 테이블과 외래키로 연결된 테이블을 조인 이웃으로 추가
+- 테이블별로 질문과 관련된 컬럼 + PK/FK 컬럼만 남김
+- 스키마 캐시 갱신 시 재구성 (문서 내용이 같은 테이블은 이전 임베딩 재사용)
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 식별자 분리: snake_case / camelCase / 숫자 / 한글
+_TOKEN_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+|[가-힣]+')
+
+# Reciprocal Rank Fusion 상수와 랭킹별 후보 수
+_RRF_K = 60
+_RRF_CANDIDATES = 200
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """BM25용 토큰 분리.
+    
+    한글 토큰은 조사가 붙은 형태("주문의", "주문을")도 맞도록 음절 bigram을 함께 추가.
+    """
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text or ''):
+        token = token.lower()
+        tokens.append(token)
+        if '가' <= token[0] <= '힣' and len(token) > 2:
+            tokens.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return tokens
+
+
+class _BM25:
+    """Okapi BM25 over tokenized documents (역색인)."""
+    
+    def __init__(self, documents: List[List[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.avg_length = sum(self.lengths) / len(documents) if documents else 0.0
+        
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for doc_id, term_freq in enumerate(self.term_freqs):
+            for term in term_freq:
+                self.postings[term].append(doc_id)
+        
+        n = len(documents)
+        self.idf = {
+            term: math.log(1 + (n - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            for term, doc_ids in self.postings.items()
+        }
+    
+    def scores(self, query_tokens: List[str]) -> Dict[int, float]:
+        """질문 토큰과 겹치는 문서의 BM25 점수 (doc_id -> score)."""
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(query_tokens):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id in self.postings[term]:
+                freq = self.term_freqs[doc_id][term]
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / self.avg_length)
+                scores[doc_id] += idf * freq * (self.k1 + 1) / (freq + norm)
+        return scores
+
+
+def _parse_foreign_key_ref(ref: str) -> Optional[Tuple[Optional[str], str]]:
+    """'schema.table.column' -> (schema, table)."""
+    parts = ref.split('.')
+    if len(parts) < 2:
+        return None
+    schema = '.'.join(parts[:-2]) or None
+    return (None if schema in (None, 'None') else schema, parts[-2])
+
+
+class SchemaIndex:
+    """Retrieval index over one connection's schema."""
+    
+    def __init__(
+        self,
+        tables: List[Dict[str, Any]],
+        terms: List[Dict[str, Any]]
+    ):
+        """Build lexical structures (임베딩은 SchemaIndexRegistry.build에서 채움).
+        
+        Args:
+            tables: get_schema_metadata()['tables']
+            terms: get_business_terms() 결과
+        """
+        self.tables = tables
+        
+        # 용어집의 schema_name은 비어 있는 경우가 많아 테이블/컬럼 이름으로만 연결
+        table_terms: Dict[str, List[str]] = defaultdict(list)
+        column_terms: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for term in terms:
+            text = " ".join(filter(None, (term.get('business_name'), term.get('description'))))
+            if term.get('term_type') == 'column' and term.get('table_name') and term.get('column_name'):
+                column_terms[(term['table_name'], term['column_name'])].append(text)
+            elif term.get('table_name'):
+                table_terms[term['table_name']].append(text)
+        
+        key_to_index: Dict[Tuple[Optional[str], str], int] = {}
+        name_to_index: Dict[str, List[int]] = defaultdict(list)
+        self.table_texts: List[str] = []
+        table_docs: List[List[str]] = []
+        column_docs: List[List[str]] = []
+        self.column_owner: List[Tuple[int, int]] = []
+        
+        for t_idx, table in enumerate(tables):
+            key_to_index[(table.get('schema'), table['name'])] = t_idx
+            name_to_index[table['name']].append(t_idx)
+            
+            columns_text = []
+            for c_idx, col in enumerate(table.get('columns', [])):
+                col_text = " ".join(filter(None, (
+                    col['name'], col.get('type'), col.get('comment'),
+                    *column_terms.get((table['name'], col['name']), [])
+                )))
+                columns_text.append(" ".join(filter(None, (col['name'], col.get('comment')))))
+                column_docs.append(tokenize(f"{table['name']} {col_text}"))
+                self.column_owner.append((t_idx, c_idx))
+            
+            table_text = "\n".join(filter(None, (
+                f"{table.get('schema') or ''}.{table['name']}".lstrip('.'),
+                table.get('comment'),
+                *table_terms.get(table['name'], []),
+                ", ".join(columns_text)
+            )))
+            self.table_texts.append(table_text)
+            # 테이블 이름/코멘트는 한 번 더 넣어 컬럼 이름보다 가중치를 높임
+            table_docs.append(tokenize(table_text) + tokenize(f"{table['name']} {table.get('comment') or ''}"))
+        
+        self.table_bm25 = _BM25(table_docs)
+        self.column_bm25 = _BM25(column_docs)
+        
+        # 외래키 그래프 (양방향)
+        self.neighbours: Dict[int, List[int]] = defaultdict(list)
+        for t_idx, table in enumerate(tables):
+            for col in table.get('columns', []):
+                ref = col.get('foreign_key_ref')
+                target = _parse_foreign_key_ref(ref) if ref else None
+                if target is None:
+                    continue
+                candidates = [key_to_index[target]] if target in key_to_index else name_to_index.get(target[1], [])
+                for r_idx in candidates:
+                    if r_idx == t_idx:
+                        continue
+                    if r_idx not in self.neighbours[t_idx]:
+                        self.neighbours[t_idx].append(r_idx)
+                    if t_idx not in self.neighbours[r_idx]:
+                        self.neighbours[r_idx].append(t_idx)
+        
+        # 테이블 문서 해시 -> 임베딩 (문서가 바뀌지 않은 테이블은 재구성 시 재사용)
+        self.doc_hashes = [hashlib.sha256(text.encode('utf-8')).hexdigest() for text in self.table_texts]
+        self.embeddings: Dict[str, np.ndarray] = {}
+        self.vectors: Optional[np.ndarray] = None
+    
+    def missing_embeddings(self, embeddings: Dict[str, np.ndarray]) -> List[int]:
+        """embeddings에 없는 테이블 문서 인덱스."""
+        return [i for i, doc_hash in enumerate(self.doc_hashes) if doc_hash not in embeddings]
+    
+    def set_embeddings(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """모든 테이블 문서의 임베딩이 있으면 정규화된 벡터 행렬 구성."""
+        if not self.tables or self.missing_embeddings(embeddings):
+            return
+        self.embeddings = {doc_hash: embeddings[doc_hash] for doc_hash in self.doc_hashes}
+        self.vectors = np.vstack([self.embeddings[doc_hash] for doc_hash in self.doc_hashes])
+    
+    def search(
+        self,
+        question: str,
+        question_vector: Optional[np.ndarray],
+        top_k: int,
+        max_columns: int,
+        neighbour_limit: int
+    ) -> List[Dict[str, Any]]:
+        """질문과 관련된 테이블/컬럼 선택.
+        
+        Args:
+            question: 사용자 질문
+            question_vector: 정규화된 질문 임베딩 (없으면 BM25만 사용)
+            top_k: 선택할 테이블 수 (조인 이웃 제외)
+            max_columns: 테이블당 최대 컬럼 수
+            neighbour_limit: 추가할 조인 이웃 테이블 최대 수
+        
+        Returns:
+            관련도 순 테이블 리스트 (컬럼은 카탈로그 순서, 조인 이웃은 'join_neighbour': True)
+        """
+        tokens = tokenize(question)
+        table_scores = self.table_bm25.scores(tokens)
+        
+        column_scores: Dict[int, Dict[int, float]] = defaultdict(dict)
+        for doc_id, score in self.column_bm25.scores(tokens).items():
+            t_idx, c_idx = self.column_owner[doc_id]
+            column_scores[t_idx][c_idx] = score
+        
+        lexical = {
+            t_idx: table_scores.get(t_idx, 0.0) + max(column_scores.get(t_idx, {}).values(), default=0.0)
+            for t_idx in set(table_scores) | set(column_scores)
+        }
+        rankings = [sorted(lexical, key=lexical.get, reverse=True)[:_RRF_CANDIDATES]]
+        if question_vector is not None and self.vectors is not None:
+            similarity = self.vectors @ question_vector
+            rankings.append([int(i) for i in np.argsort(-similarity)[:_RRF_CANDIDATES]])
+        
+        fused: Dict[int, float] = defaultdict(float)
+        for ranking in rankings:
+            for rank, t_idx in enumerate(ranking):
+                fused[t_idx] += 1.0 / (_RRF_K + rank + 1)
+        
+        selected = sorted(fused, key=fused.get, reverse=True)[:top_k]
+        if not selected:
+            # 겹치는 토큰도 임베딩도 없음 - 카탈로그 순서
+            selected = list(range(min(top_k, len(self.tables))))
+        
+        chosen = set(selected)
+        neighbours = []
+        for t_idx in selected:
+            for r_idx in self.neighbours.get(t_idx, []):
+                if len(neighbours) >= neighbour_limit:
+                    break
+                if r_idx not in chosen:
+                    chosen.add(r_idx)
+                    neighbours.append(r_idx)
+        
+        return [
+            self._prune(t_idx, column_scores.get(t_idx, {}), max_columns, join_neighbour=False)
+            for t_idx in selected
+        ] + [
+            self._prune(t_idx, column_scores.get(t_idx, {}), max_columns, join_neighbour=True)
+            for t_idx in neighbours
+        ]
+    
+    def _prune(
+        self,
+        t_idx: int,
+        column_scores: Dict[int, float],
+        max_columns: int,
+        join_neighbour: bool
+    ) -> Dict[str, Any]:
+        """PK/FK 컬럼 → 질문 관련 컬럼 → 나머지 카탈로그 순으로 max_columns개까지 남김."""
+        table = self.tables[t_idx]
+        columns = table.get('columns', [])
+        
+        keys = [i for i, col in enumerate(columns) if col.get('primary_key') or col.get('foreign_key')]
+        matched = sorted(column_scores, key=column_scores.get, reverse=True)
+        keep = list(dict.fromkeys(keys + matched + list(range(len(columns)))))[:max_columns]
+        
+        pruned = {k: v for k, v in table.items() if k != 'columns'}
+        pruned['columns'] = [columns[i] for i in sorted(keep)]
+        pruned['column_count'] = len(columns)
+        pruned['join_neighbour'] = join_neighbour
+        return pruned
+
+
+class SchemaIndexRegistry:
+    """Schema indexes keyed by DataCloud connection_id (프로세스 메모리)."""
+    
+    def __init__(
+        self,
+        top_k: int = 15,
+        max_columns: int = 30,
+        neighbour_limit: int = 10,
+        embedding_model: str = "",
+        embedding_batch_size: int = 256
+    ):
+        """Initialize registry.
+        
+        Args:
+            top_k: Tables selected per question (excluding join neighbours)
+            max_columns: Maximum columns per selected table
+            neighbour_limit: Maximum join neighbour tables added through foreign keys
+            embedding_model: LiteLLM embedding model (빈 문자열이면 BM25만 사용)
+            embedding_batch_size: Table documents per embeddings request
+        """
+        self.top_k = top_k
+        self.max_columns = max_columns
+        self.neighbour_limit = neighbour_limit
+        self.embedding_model = embedding_model
+        self.embedding_batch_size = embedding_batch_size
+        
+        self._indexes: Dict[str, SchemaIndex] = {}
+        # 무효화된 인덱스의 임베딩 (재구성 시 재사용)
+        self._retired_embeddings: Dict[str, Dict[str, np.ndarray]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    def configure_from_settings(self) -> None:
+        """Apply DATACLOUD_SCHEMA_INDEX_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.top_k = settings.DATACLOUD_SCHEMA_INDEX_TOP_K
+        self.max_columns = settings.DATACLOUD_SCHEMA_INDEX_MAX_COLUMNS
+        self.neighbour_limit = settings.DATACLOUD_SCHEMA_INDEX_NEIGHBOURS
+        self.embedding_model = settings.DATACLOUD_SCHEMA_EMBEDDING_MODEL
+    
+    def get(self, connection_id: str) -> Optional[SchemaIndex]:
+        return self._indexes.get(connection_id)
+    
+    def invalidate(self, connection_id: str) -> None:
+        """인덱스 제거 (용어집/접속 정보 변경 시). 임베딩은 재구성 때 재사용."""
+        index = self._indexes.pop(connection_id, None)
+        if index is not None and index.embeddings:
+            self._retired_embeddings[connection_id] = index.embeddings
+    
+    def drop(self, connection_id: str) -> None:
+        """연결 삭제 시 인덱스/재사용 임베딩/lock을 모두 제거."""
+        self._indexes.pop(connection_id, None)
+        self._retired_embeddings.pop(connection_id, None)
+        self._locks.pop(connection_id, None)
+    
+    async def build(
+        self,
+        connection_id: str,
+        tables: List[Dict[str, Any]],
+        terms: List[Dict[str, Any]]
+    ) -> SchemaIndex:
+        """스키마/용어집으로 인덱스를 새로 구성하고 등록.
+        
+        문서가 바뀐 테이블만 임베딩 요청. 임베딩 실패 시 BM25만으로 동작.
+        """
+        lock = self._locks.setdefault(connection_id, asyncio.Lock())
+        async with lock:
+            previous = self._indexes.get(connection_id)
+            known = dict(self._retired_embeddings.pop(connection_id, {}))
+            if previous is not None:
+                known.update(previous.embeddings)
+            
+            index = SchemaIndex(tables, terms)
+            if self.embedding_model and tables:
+                missing = index.missing_embeddings(known)
+                try:
+                    for start in range(0, len(missing), self.embedding_batch_size):
+                        batch = missing[start:start + self.embedding_batch_size]
+                        vectors = await self._embed([index.table_texts[i] for i in batch])
+                        for i, vector in zip(batch, vectors):
+                            known[index.doc_hashes[i]] = vector
+                    index.set_embeddings(known)
+                except Exception as e:
+                    logger.warning(f"Schema index embeddings failed for {connection_id}, using BM25 only: {e}")
+                logger.info(
+                    f"Schema index built for {connection_id}: {len(tables)} tables, "
+                    f"{len(missing)} embedded, {len(tables) - len(missing)} reused"
+                )
+            
+            self._indexes[connection_id] = index
+            return index
+    
+    async def search(self, index: SchemaIndex, question: str) -> List[Dict[str, Any]]:
+        """질문으로 인덱스 조회 (질문 임베딩 실패 시 BM25만 사용)."""
+        question_vector = None
+        if index.vectors is not None:
+            try:
+                question_vector = (await self._embed([question]))[0]
+            except Exception as e:
+                logger.warning(f"Question embedding failed, using BM25 only: {e}")
+        return index.search(
+            question, question_vector,
+            top_k=self.top_k,
+            max_columns=self.max_columns,
+            neighbour_limit=self.neighbour_limit
+        )
+    
+    async def _embed(self, texts: List[str]) -> List[np.ndarray]:
+        """LiteLLM 임베딩 (L2 정규화 - 내적이 코사인 유사도)."""
+        from app.services.litellm_service import litellm_service
+        vectors = await litellm_service.embeddings(self.embedding_model, texts)
+        result = []
+        for vector in vectors:
+            array = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(array)
+            result.append(array / norm if norm else array)
+        return result
+
+
+# Singleton instance
+schema_index_registry = SchemaIndexRegistry()
@@ -14,16 +14,24 @@ SQLAlchemy 스키마 리플렉션을 활용하여 데이터 복제 없이 실시
 
 import os
 import uuid
+import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from contextlib import aclosing, asynccontextmanager
 
 import aiomysql
 from cryptography.fernet import Fernet
 
 from app.services.kong_service import kong_service
+from app.services.db_pool import db_pool_manager
+from app.services.datacloud_pool import datacloud_pool_registry, driver_type
+from app.services.datacloud_executor import run_blocking
+from app.services.datacloud_introspection import (
+    BULK_DRIVERS, introspect_bulk, reflect_schema, table_fingerprint
+)
+from app.services.datacloud_schema_index import schema_index_registry
 
 logger = logging.getLogger(__name__)
 
@@ -49,19 +57,16 @@ class DataCloudService:
     
     @asynccontextmanager
     async def get_connection(self):
-        """MariaDB 연결 획득"""
-        conn = await aiomysql.connect(
+        """MariaDB 연결 획득 (공유 풀)"""
+        async with db_pool_manager.acquire(
+            "datacloud",
             host=self.db_host,
             port=self.db_port,
             user=self.db_user,
             password=self.db_password,
-            db=self.db_name,
-            autocommit=True
-        )
-        try:
+            db=self.db_name
+        ) as conn:
             yield conn
-        finally:
-            conn.close()
     
     def encrypt_password(self, password: str) -> str:
         """비밀번호 암호화 (Fernet)"""
@@ -293,7 +298,12 @@ class DataCloudService:
             async with conn.cursor() as cur:
                 query = f"UPDATE db_connections SET {', '.join(updates)} WHERE id = %s"
                 await cur.execute(query, params)
-                return cur.rowcount > 0
+                updated = cur.rowcount > 0
+        
+        # 접속 정보가 바뀌었을 수 있으므로 warm 풀 폐기
+        await datacloud_pool_registry.invalidate(connection_id)
+        schema_index_registry.invalidate(connection_id)
+        return updated
     
     async def delete_connection(self, connection_id: str) -> bool:
         """연결 삭제"""
@@ -317,7 +327,11 @@ class DataCloudService:
         async with self.get_connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute("DELETE FROM db_connections WHERE id = %s", (connection_id,))
-                return cur.rowcount > 0
+                deleted = cur.rowcount > 0
+        
+        await datacloud_pool_registry.invalidate(connection_id)
+        schema_index_registry.drop(connection_id)
+        return deleted
     
     async def test_connection(self, connection_id: str) -> Dict[str, Any]:
         """DB 연결 테스트"""
@@ -362,13 +376,20 @@ class DataCloudService:
                 
             elif db_type == 'clickhouse':
                 import clickhouse_connect
-                client = clickhouse_connect.get_client(
-                    host=host, port=port, username=username, 
-                    password=password, database=database_name
-                )
-                result = client.query("SELECT version()")
-                server_version = result.first_row[0] if result.first_row else 'Unknown'
-                client.close()
+                
+                def _check_clickhouse():
+                    client = clickhouse_connect.get_client(
+                        host=host, port=port, username=username, 
+                        password=password, database=database_name,
+                        connect_timeout=10
+                    )
+                    try:
+                        result = client.query("SELECT version()")
+                        return result.first_row[0] if result.first_row else 'Unknown'
+                    finally:
+                        client.close()
+                
+                server_version = await run_blocking('clickhouse', _check_clickhouse, timeout=30)
                 success = True
                 
             else:
@@ -413,10 +434,45 @@ class DataCloudService:
         try:
             schema_data = await self._fetch_schema_from_db(conn_info)
             await self._save_schema_cache(connection_id, schema_data)
-            return schema_data
         except Exception as e:
             logger.error(f"Schema fetch failed for {connection_id}: {e}")
             return {'error': str(e)}
+        
+        # 캐시가 갱신되면 Text2SQL 스키마 인덱스도 재구성
+        try:
+            await self._build_schema_index(connection_id, schema_data)
+        except Exception as e:
+            logger.warning(f"Schema index build failed for {connection_id}: {e}")
+        return schema_data
+    
+    async def select_relevant_schema(self, connection_id: str, question: str) -> Dict[str, Any]:
+        """질문과 관련된 테이블/컬럼만 선택 (스키마 인덱스 - BM25 + 임베딩, FK 조인 이웃 포함).
+        
+        Args:
+            connection_id: DB 연결 ID
+            question: 자연어 질문
+        
+        Returns:
+            {'tables': 관련도 순 테이블 (컬럼 축약), 'table_count': 전체 테이블 수}
+            또는 {'error': str}
+        """
+        index = schema_index_registry.get(connection_id)
+        if index is None:
+            schema = await self.get_schema_metadata(connection_id)
+            if not schema or 'error' in schema:
+                return schema or {'error': 'Failed to fetch schema'}
+            # DB에서 새로 읽은 경우 get_schema_metadata가 이미 인덱스를 만듦
+            index = schema_index_registry.get(connection_id)
+            if index is None:
+                index = await self._build_schema_index(connection_id, schema)
+        
+        tables = await schema_index_registry.search(index, question)
+        return {'tables': tables, 'table_count': len(index.tables)}
+    
+    async def _build_schema_index(self, connection_id: str, schema: Dict[str, Any]):
+        """스키마 + 비즈니스 용어집으로 connection_id의 스키마 인덱스 구성."""
+        terms = await self.get_business_terms(connection_id)
+        return await schema_index_registry.build(connection_id, schema.get('tables', []), terms)
     
     async def _get_cached_schema(self, connection_id: str) -> Optional[Dict]:
         """캐시된 스키마 조회"""
@@ -434,7 +490,8 @@ class DataCloudService:
                 
                 await cur.execute("""
                     SELECT schema_name, table_name, column_name, data_type, 
-                           is_nullable, is_primary_key, is_foreign_key, column_comment
+                           is_nullable, is_primary_key, is_foreign_key, foreign_key_ref,
+                           column_default, column_comment
                     FROM db_schema_cache WHERE connection_id = %s
                     ORDER BY schema_name, table_name, ordinal_position
                 """, (connection_id,))
@@ -465,16 +522,33 @@ class DataCloudService:
                     'nullable': bool(c['is_nullable']),
                     'primary_key': bool(c['is_primary_key']),
                     'foreign_key': bool(c['is_foreign_key']),
-                    'comment': c['column_comment']
+                    'foreign_key_ref': c['foreign_key_ref'],
+                    'comment': c['column_comment'],
+                    'default': c['column_default']
                 })
         
         return result
     
     async def _fetch_schema_from_db(self, conn_info: Dict) -> Dict[str, Any]:
-        """SQLAlchemy 리플렉션으로 스키마 조회"""
-        from sqlalchemy import create_engine, inspect
+        """스키마 메타데이터 조회.
+        
+        MariaDB/MySQL/PostgreSQL/ClickHouse는 warm 풀 연결로 카탈로그를 bulk 조회하고,
+        그 외 dialect 또는 bulk 조회 실패 시 SQLAlchemy 리플렉션을 동시 실행.
+        """
+        from app.config import get_settings
+        settings = get_settings()
         
         db_type = conn_info['db_type']
+        driver = driver_type(db_type)
+        
+        if driver in BULK_DRIVERS:
+            try:
+                async with datacloud_pool_registry.acquire(conn_info, self.decrypt_password) as driver_conn:
+                    tables = await introspect_bulk(driver, driver_conn, timeout=settings.DATACLOUD_SCHEMA_TIMEOUT)
+                return {'tables': tables}
+            except Exception as e:
+                logger.warning(f"Bulk schema introspection failed for {conn_info['id']}, falling back to reflection: {e}")
+        
         host = conn_info['host']
         port = conn_info['port']
         database_name = conn_info['database_name']
@@ -484,104 +558,115 @@ class DataCloudService:
         # DB 타입별 SQLAlchemy URL 생성
         url = self._build_sqlalchemy_url(db_type, username, password, host, port, database_name)
         
-        engine = create_engine(url, pool_pre_ping=True)
-        inspector = inspect(engine)
-        
-        result = {'tables': []}
+        tables = await asyncio.wait_for(
+            reflect_schema(driver, url, concurrency=settings.DATACLOUD_SCHEMA_CONCURRENCY),
+            settings.DATACLOUD_SCHEMA_TIMEOUT
+        )
+        return {'tables': tables}
+    
+    async def _save_schema_cache(self, connection_id: str, schema_data: Dict) -> None:
+        """스키마 캐시 저장 (fingerprint가 바뀐 테이블만 다시 기록).
         
-        try:
-            schemas = inspector.get_schema_names()
-        except:
-            schemas = [None]
+        - 구조가 바뀐 테이블: db_schema_cache 컬럼 행을 지우고 multi-row INSERT
+        - 구조/행 수가 바뀐 테이블: db_table_cache multi-row upsert
+        - 사라진 테이블: 두 캐시에서 삭제
+        """
+        tables = schema_data.get('tables', [])
         
-        for schema in schemas:
-            if schema in ('information_schema', 'pg_catalog', 'pg_toast'):
-                continue
+        async with self.get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("""
+                    SELECT schema_name, table_name, fingerprint, row_count
+                    FROM db_table_cache WHERE connection_id = %s
+                """, (connection_id,))
+                cached = {(row[0], row[1]): (row[2], row[3]) for row in await cur.fetchall()}
             
-            try:
-                table_names = inspector.get_table_names(schema=schema)
-            except:
-                table_names = inspector.get_table_names()
+            changed = []
+            table_rows = []
+            for table in tables:
+                key = (table.get('schema'), table['name'])
+                fingerprint = table_fingerprint(table)
+                previous = cached.pop(key, None)
+                if previous is None or previous[0] != fingerprint:
+                    changed.append(table)
+                elif previous[1] == table.get('row_count'):
+                    continue
+                table_rows.append((
+                    str(uuid.uuid4()), connection_id, table.get('schema'), table['name'],
+                    table.get('type', 'table'), table.get('comment'), table.get('row_count'), fingerprint
+                ))
+            removed = list(cached)
+            
+            column_rows = [
+                (str(uuid.uuid4()), connection_id, table.get('schema'), table['name'],
+                 col['name'], col.get('type'), col.get('nullable', True),
+                 col.get('primary_key', False), col.get('foreign_key', False), col.get('foreign_key_ref'),
+                 col.get('default'), col.get('comment'), idx + 1)
+                for table in changed
+                for idx, col in enumerate(table.get('columns', []))
+            ]
             
-            for table_name in table_names:
+            if table_rows or removed:
+                changed_keys = [(table.get('schema'), table['name']) for table in changed]
+                # schema_name이 NULL인 행은 UNIQUE KEY로 upsert되지 않으므로 지우고 다시 기록
+                null_schema_keys = [key for key in changed_keys if key[0] is None]
+                
+                await conn.begin()
                 try:
-                    columns = inspector.get_columns(table_name, schema=schema)
-                    pk = inspector.get_pk_constraint(table_name, schema=schema)
-                    fks = inspector.get_foreign_keys(table_name, schema=schema)
-                    
-                    pk_columns = pk.get('constrained_columns', []) if pk else []
-                    fk_columns = set()
-                    for fk in fks:
-                        fk_columns.update(fk.get('constrained_columns', []))
-                    
-                    try:
-                        table_comment = inspector.get_table_comment(table_name, schema=schema)
-                        table_comment_text = table_comment.get('text') if table_comment else None
-                    except:
-                        table_comment_text = None
-                    
-                    table_data = {
-                        'schema': schema,
-                        'name': table_name,
-                        'type': 'table',
-                        'comment': table_comment_text,
-                        'columns': []
-                    }
-                    
-                    for col in columns:
-                        col_data = {
-                            'name': col['name'],
-                            'type': str(col['type']),
-                            'nullable': col.get('nullable', True),
-                            'primary_key': col['name'] in pk_columns,
-                            'foreign_key': col['name'] in fk_columns,
-                            'comment': col.get('comment'),
-                            'default': str(col.get('default')) if col.get('default') else None
-                        }
-                        table_data['columns'].append(col_data)
-                    
-                    result['tables'].append(table_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to inspect table {table_name}: {e}")
-        
-        engine.dispose()
-        return result
+                    async with conn.cursor() as cur:
+                        await self._delete_cached_tables(cur, 'db_schema_cache', connection_id, removed + changed_keys)
+                        await self._delete_cached_tables(cur, 'db_table_cache', connection_id, removed + null_schema_keys)
+                        if table_rows:
+                            # aiomysql executemany는 multi-row INSERT로 변환
+                            await cur.executemany("""
+                                INSERT INTO db_table_cache
+                                (id, connection_id, schema_name, table_name, table_type,
+                                 table_comment, row_count, fingerprint)
+                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                                ON DUPLICATE KEY UPDATE
+                                    table_type = VALUES(table_type),
+                                    table_comment = VALUES(table_comment),
+                                    row_count = VALUES(row_count),
+                                    fingerprint = VALUES(fingerprint),
+                                    cached_at = CURRENT_TIMESTAMP
+                            """, table_rows)
+                        if column_rows:
+                            await cur.executemany("""
+                                INSERT INTO db_schema_cache
+                                (id, connection_id, schema_name, table_name, column_name,
+                                 data_type, is_nullable, is_primary_key, is_foreign_key,
+                                 foreign_key_ref, column_default, column_comment, ordinal_position)
+                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                            """, column_rows)
+                    await conn.commit()
+                except BaseException:
+                    await conn.rollback()
+                    raise
+        
+        logger.info(
+            f"Schema cache for {connection_id}: {len(tables)} tables, "
+            f"{len(changed)} changed, {len(removed)} removed"
+        )
     
-    async def _save_schema_cache(self, connection_id: str, schema_data: Dict) -> None:
-        """스키마 캐시 저장"""
-        async with self.get_connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    "DELETE FROM db_table_cache WHERE connection_id = %s", 
-                    (connection_id,)
-                )
-                await cur.execute(
-                    "DELETE FROM db_schema_cache WHERE connection_id = %s", 
-                    (connection_id,)
-                )
-                
-                for table in schema_data.get('tables', []):
-                    table_id = str(uuid.uuid4())
-                    await cur.execute("""
-                        INSERT INTO db_table_cache 
-                        (id, connection_id, schema_name, table_name, table_type, table_comment)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    """, (table_id, connection_id, table.get('schema'), table['name'], 
-                          table.get('type', 'table'), table.get('comment')))
-                    
-                    for idx, col in enumerate(table.get('columns', [])):
-                        col_id = str(uuid.uuid4())
-                        await cur.execute("""
-                            INSERT INTO db_schema_cache 
-                            (id, connection_id, schema_name, table_name, column_name, 
-                             data_type, is_nullable, is_primary_key, is_foreign_key, 
-                             column_comment, ordinal_position)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """, (col_id, connection_id, table.get('schema'), table['name'], 
-                              col['name'], col.get('type'), col.get('nullable', True), 
-                              col.get('primary_key', False), col.get('foreign_key', False), 
-                              col.get('comment'), idx + 1))
+    @staticmethod
+    async def _delete_cached_tables(
+        cur: aiomysql.Cursor,
+        cache_table: str,
+        connection_id: str,
+        table_keys: List[Tuple[Optional[str], str]],
+        chunk_size: int = 500
+    ) -> None:
+        """(schema_name, table_name) 목록의 캐시 행을 chunk_size개씩 한 번의 DELETE로 삭제."""
+        for i in range(0, len(table_keys), chunk_size):
+            chunk = table_keys[i:i + chunk_size]
+            conditions = " OR ".join(["(schema_name <=> %s AND table_name = %s)"] * len(chunk))
+            params = [connection_id]
+            for schema_name, table_name in chunk:
+                params.extend((schema_name, table_name))
+            await cur.execute(
+                f"DELETE FROM {cache_table} WHERE connection_id = %s AND ({conditions})",
+                params
+            )
     
     async def execute_query(
         self,
@@ -622,203 +707,97 @@ class DataCloudService:
                 kong_api_key=kong_api_key
             )
         
-        # Kong에 등록되지 않은 경우 직접 연결 (fallback)
+        # Kong에 등록되지 않은 경우 직접 연결 (fallback) - connection_id별 warm 풀 사용
+        from app.config import get_settings
         db_type = conn_info['db_type']
-        host = conn_info['host']
-        port = conn_info['port']
-        database_name = conn_info['database_name']
-        username = conn_info['username']
-        password = self.decrypt_password(conn_info['password_encrypted'])
+        timeout = get_settings().DATACLOUD_QUERY_TIMEOUT
         
         start_time = datetime.now()
         success = False
+        status = 'error'
         error_msg = None
         rows = []
         columns = []
         rows_affected = 0
         
         try:
-            if db_type in ('mariadb', 'mysql'):
-                test_conn = await aiomysql.connect(
-                    host=host, port=port, user=username, 
-                    password=password, db=database_name
-                )
-                async with test_conn.cursor(aiomysql.DictCursor) as cur:
-                    await cur.execute(query)
-                    
-                    if query_type == 'select':
-                        rows = await cur.fetchmany(max_rows)
-                        rows = [dict(r) for r in rows]
-                        if rows:
-                            columns = list(rows[0].keys())
-                        rows_affected = len(rows)
-                    else:
-                        rows_affected = cur.rowcount
-                        await test_conn.commit()
-                
-                test_conn.close()
-                success = True
-                
-            elif db_type == 'postgresql':
-                import asyncpg
-                test_conn = await asyncpg.connect(
-                    host=host, port=port, user=username, 
-                    password=password, database=database_name
-                )
-                
+            async with datacloud_pool_registry.acquire(conn_info, self.decrypt_password) as driver_conn:
                 if query_type == 'select':
-                    records = await test_conn.fetch(query)
-                    if records:
-                        columns = list(records[0].keys())
-                        rows = [dict(r) for r in records[:max_rows]]
+                    # 서버 측 커서로 max_rows까지만 읽음 (연결 반환 전에 커서/트랜잭션 정리)
+                    async with aclosing(self._iter_select(
+                        db_type, driver_conn, query, max_rows, batch_size=max_rows, timeout=timeout
+                    )) as batches:
+                        async for batch_columns, batch in batches:
+                            columns = batch_columns
+                            rows.extend(dict(zip(columns, row)) for row in batch)
                     rows_affected = len(rows)
-                else:
-                    result = await test_conn.execute(query)
-                    rows_affected = int(result.split()[-1]) if result else 0
-                
-                await test_conn.close()
-                success = True
                 
-            elif db_type == 'clickhouse':
-                import clickhouse_connect
-                client = clickhouse_connect.get_client(
-                    host=host, port=port, username=username, 
-                    password=password, database=database_name
-                )
-                
-                if query_type == 'select':
-                    result = client.query(query)
-                    columns = result.column_names
-                    rows = [dict(zip(columns, row)) for row in result.result_rows[:max_rows]]
-                    rows_affected = len(rows)
-                else:
-                    client.command(query)
-                    rows_affected = 0
-                
-                client.close()
-                success = True
-            
-            elif db_type == 'oracle':
-                # Oracle: oracledb (cx_Oracle 후속) - 동기 드라이버
-                import oracledb
-                import asyncio
-                
-                def _execute_oracle():
-                    conn = oracledb.connect(
-                        user=username, password=password,
-                        dsn=f"{host}:{port}/{database_name}"
-                    )
-                    cursor = conn.cursor()
-                    cursor.execute(query)
+                elif db_type in ('mariadb', 'mysql'):
+                    # 풀 연결은 autocommit (timeout 시 registry가 KILL QUERY)
+                    async with driver_conn.cursor() as cur:
+                        await asyncio.wait_for(cur.execute(query), timeout)
+                        rows_affected = cur.rowcount
                     
-                    if query_type == 'select':
-                        cols = [desc[0] for desc in cursor.description]
-                        fetched = cursor.fetchmany(max_rows)
-                        result_rows = [dict(zip(cols, row)) for row in fetched]
-                        affected = len(result_rows)
-                    else:
-                        conn.commit()
-                        result_rows = []
-                        cols = []
-                        affected = cursor.rowcount
+                elif db_type == 'postgresql':
+                    # asyncpg는 timeout/취소 시 서버에 cancel 요청을 보냄
+                    result = await driver_conn.execute(query, timeout=timeout)
+                    rows_affected = int(result.split()[-1]) if result else 0
                     
-                    cursor.close()
-                    conn.close()
-                    return cols, result_rows, affected
-                
-                # 동기 함수를 비동기로 실행
-                columns, rows, rows_affected = await asyncio.get_event_loop().run_in_executor(
-                    None, _execute_oracle
-                )
-                success = True
-            
-            elif db_type in ('hana', 'sap_hana'):
-                # SAP HANA: hdbcli - 동기 드라이버
-                from hdbcli import dbapi
-                import asyncio
-                
-                def _execute_hana():
-                    conn = dbapi.connect(
-                        address=host, port=port,
-                        user=username, password=password
+                elif db_type == 'clickhouse':
+                    query_id = str(uuid.uuid4())
+                    await run_blocking(
+                        'clickhouse',
+                        lambda: driver_conn.command(query, settings=self._clickhouse_settings(query_id, timeout)),
+                        timeout=timeout,
+                        cancel=self._clickhouse_cancel(driver_conn, query_id)
                     )
-                    cursor = conn.cursor()
-                    cursor.execute(query)
-                    
-                    if query_type == 'select':
-                        cols = [desc[0] for desc in cursor.description]
-                        fetched = cursor.fetchmany(max_rows)
-                        result_rows = [dict(zip(cols, row)) for row in fetched]
-                        affected = len(result_rows)
-                    else:
-                        conn.commit()
-                        result_rows = []
-                        cols = []
-                        affected = cursor.rowcount
-                    
-                    cursor.close()
-                    conn.close()
-                    return cols, result_rows, affected
-                
-                columns, rows, rows_affected = await asyncio.get_event_loop().run_in_executor(
-                    None, _execute_hana
-                )
-                success = True
-            
-            elif db_type in ('databricks', 'spark'):
-                # Databricks: databricks-sql-connector
-                from databricks import sql as databricks_sql
-                import asyncio
+                    rows_affected = 0
                 
-                def _execute_databricks():
-                    # database_name에는 HTTP path가 들어옴
-                    conn = databricks_sql.connect(
-                        server_hostname=host,
-                        http_path=database_name,
-                        access_token=password  # password 필드에 token 저장
-                    )
-                    cursor = conn.cursor()
-                    cursor.execute(query)
+                else:
+                    # Oracle (oracledb), SAP HANA (hdbcli), Databricks (databricks-sql-connector) - 동기 드라이버
+                    driver = driver_type(db_type)
+                    cursor = await run_blocking(driver, driver_conn.cursor)
                     
-                    if query_type == 'select':
-                        cols = [desc[0] for desc in cursor.description]
-                        fetched = cursor.fetchmany(max_rows)
-                        result_rows = [dict(zip(cols, row)) for row in fetched]
-                        affected = len(result_rows)
-                    else:
-                        result_rows = []
-                        cols = []
-                        affected = cursor.rowcount or 0
+                    def _execute_dbapi():
+                        try:
+                            cursor.execute(query)
+                            if driver != 'databricks':
+                                driver_conn.commit()
+                            return cursor.rowcount or 0
+                        finally:
+                            cursor.close()
                     
-                    cursor.close()
-                    conn.close()
-                    return cols, result_rows, affected
-                
-                columns, rows, rows_affected = await asyncio.get_event_loop().run_in_executor(
-                    None, _execute_databricks
-                )
-                success = True
-                
-            else:
-                error_msg = f"Unsupported database type: {db_type}"
-                
+                    rows_affected = await run_blocking(
+                        driver, _execute_dbapi,
+                        timeout=timeout,
+                        cancel=self._dbapi_cancel(driver, driver_conn, cursor)
+                    )
+            
+            success = True
+            status = 'success'
+        
+        except asyncio.TimeoutError:
+            status = 'timeout'
+            error_msg = f"Query timed out after {timeout:g}s"
+            logger.error(f"Query execution timed out (connection {connection_id})")
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 - 드라이버 쿼리는 취소됨, 로그만 남기고 전파
+            execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            await self._log_query(
+                connection_id, user_id, query, query_type,
+                execution_time_ms, 0, 'cancelled', "Client disconnected"
+            )
+            raise
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Query execution failed: {e}")
         
         execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
         
-        log_id = str(uuid.uuid4())
-        async with self.get_connection() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute("""
-                    INSERT INTO db_query_logs 
-                    (id, connection_id, user_id, query_text, query_type, 
-                     execution_time_ms, rows_affected, status, error_message)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (log_id, connection_id, user_id, query[:5000], query_type, 
-                      execution_time_ms, rows_affected, 
-                      'success' if success else 'error', error_msg))
+        await self._log_query(
+            connection_id, user_id, query, query_type,
+            execution_time_ms, rows_affected, status, error_msg
+        )
         
         for row in rows:
             for key, value in row.items():
@@ -834,6 +813,258 @@ class DataCloudService:
             'error': error_msg
         }
     
+    async def _iter_select(
+        self,
+        db_type: str,
+        driver_conn: Any,
+        query: str,
+        max_rows: int,
+        batch_size: int,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[List[str], List[tuple]]]:
+        """SELECT 결과를 서버 측 커서로 batch_size행씩 읽고 max_rows에서 중단.
+        
+        전체 결과를 백엔드 메모리로 가져오지 않음. 실행/fetch 호출마다 timeout을 적용하고,
+        timeout 또는 취소 시 드라이버 cancel API로 서버 쿼리도 중단.
+        
+        Args:
+            db_type: DB 타입
+            driver_conn: datacloud_pool_registry.acquire()가 준 연결
+            query: SELECT 쿼리
+            max_rows: 최대 행 수
+            batch_size: 한 번에 읽는 행 수
+            timeout: 드라이버 호출 하나의 제한 시간(초)
+        
+        Yields:
+            (컬럼 이름, 행 튜플 리스트)
+        """
+        remaining = max_rows
+        
+        if db_type in ('mariadb', 'mysql'):
+            # SSCursor: 서버에서 행을 나눠 받음 (unbuffered)
+            cur = await driver_conn.cursor(aiomysql.SSCursor)
+            try:
+                await asyncio.wait_for(cur.execute(query), timeout)
+                columns = [desc[0] for desc in cur.description] if cur.description else []
+                while remaining > 0:
+                    batch = await asyncio.wait_for(cur.fetchmany(min(batch_size, remaining)), timeout)
+                    if not batch:
+                        break
+                    remaining -= len(batch)
+                    yield columns, list(batch)
+                else:
+                    # 남은 결과를 읽지 않고 중단 - SSCursor.close()는 나머지를 모두 읽으므로 연결을 닫아 풀에서 제외
+                    driver_conn.close()
+                    return
+            except BaseException:
+                # 호출 측이 중간에 닫음(aclose)/timeout/오류 - 같은 이유로 연결을 닫음
+                driver_conn.close()
+                raise
+            await cur.close()
+        
+        elif db_type == 'postgresql':
+            # asyncpg 커서는 트랜잭션 안에서만 사용 가능
+            async with driver_conn.transaction():
+                statement = await driver_conn.prepare(query, timeout=timeout)
+                columns = [attr.name for attr in statement.get_attributes()]
+                cursor = await statement.cursor(timeout=timeout)
+                while remaining > 0:
+                    records = await cursor.fetch(min(batch_size, remaining), timeout=timeout)
+                    if not records:
+                        break
+                    remaining -= len(records)
+                    yield columns, [tuple(r) for r in records]
+        
+        elif db_type == 'clickhouse':
+            # max_result_rows로 서버에서도 결과 크기 제한
+            query_id = str(uuid.uuid4())
+            settings = self._clickhouse_settings(query_id, timeout)
+            settings.update({'max_result_rows': max_rows, 'result_overflow_mode': 'break'})
+            cancel = self._clickhouse_cancel(driver_conn, query_id)
+            stream = await run_blocking(
+                'clickhouse',
+                lambda: driver_conn.query_row_block_stream(query, settings=settings),
+                timeout=timeout,
+                cancel=cancel
+            )
+            with stream:
+                columns = list(stream.source.column_names)
+                blocks = iter(stream)
+                while remaining > 0:
+                    block = await run_blocking(
+                        'clickhouse', lambda: next(blocks, None), timeout=timeout, cancel=cancel
+                    )
+                    if block is None:
+                        break
+                    block = block[:remaining]
+                    remaining -= len(block)
+                    yield columns, [tuple(row) for row in block]
+        
+        else:
+            # Oracle / SAP HANA / Databricks - 동기 DB-API 커서
+            driver = driver_type(db_type)
+            cursor = await run_blocking(driver, driver_conn.cursor)
+            cancel = self._dbapi_cancel(driver, driver_conn, cursor)
+            try:
+                cursor.arraysize = batch_size
+                await run_blocking(driver, lambda: cursor.execute(query), timeout=timeout, cancel=cancel)
+                columns = [desc[0] for desc in cursor.description]
+                while remaining > 0:
+                    batch = await run_blocking(
+                        driver, lambda: cursor.fetchmany(min(batch_size, remaining)),
+                        timeout=timeout, cancel=cancel
+                    )
+                    if not batch:
+                        break
+                    remaining -= len(batch)
+                    yield columns, [tuple(row) for row in batch]
+            finally:
+                await run_blocking(driver, cursor.close)
+    
+    @staticmethod
+    def _clickhouse_settings(query_id: str, timeout: Optional[float]) -> Dict[str, Any]:
+        """ClickHouse 쿼리 설정 - 서버 측 실행 시간 제한, 클라이언트가 HTTP 연결을 끊으면 읽기 쿼리 취소."""
+        settings = {'query_id': query_id, 'cancel_http_readonly_queries_on_client_close': 1}
+        if timeout:
+            settings['max_execution_time'] = int(timeout)
+        return settings
+    
+    @staticmethod
+    def _clickhouse_cancel(client: Any, query_id: str) -> Callable[[], Any]:
+        """query_id로 실행 중인 ClickHouse 쿼리를 중단하는 함수 (공유 client는 세션이 없어 동시 호출 가능)."""
+        return lambda: client.command(
+            "KILL QUERY WHERE query_id = {query_id:String} ASYNC",
+            parameters={'query_id': query_id}
+        )
+    
+    @staticmethod
+    def _dbapi_cancel(driver: str, driver_conn: Any, cursor: Any) -> Callable[[], Any]:
+        """동기 드라이버의 실행 중 호출 중단 API.
+        
+        oracledb/hdbcli는 Connection.cancel(), databricks-sql-connector는 Cursor.cancel()
+        (모두 다른 스레드에서 호출 가능).
+        """
+        if driver == 'databricks':
+            return cursor.cancel
+        return driver_conn.cancel
+    
+    async def stream_query(
+        self,
+        conn_info: Dict[str, Any],
+        query: str,
+        user_id: str,
+        max_rows: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """SELECT 결과 스트리밍 (NDJSON 라인 단위 dict).
+        
+        warm 풀로 직접 실행하고 결과를 batch 단위로 전달하므로
+        결과 크기와 관계없이 메모리 사용량이 일정함. 종료 시 db_query_logs에 기록.
+        Kong Gateway에 등록된 연결은 Kong을 우회하지 않도록 error 라인만 반환.
+        
+        Args:
+            conn_info: get_connection_by_id 결과
+            query: SELECT 쿼리
+            user_id: 실행 사용자 ID
+            max_rows: 최대 행 수
+        
+        Yields:
+            {"type": "columns", "columns": [...]} 1회,
+            {"type": "rows", "rows": [[...], ...]} batch마다,
+            {"type": "end", "rows": int, "truncated": bool, "execution_time_ms": int}
+            또는 {"type": "error", "error": str}
+        """
+        if conn_info.get('kong_service_id') and conn_info.get('kong_api_key'):
+            # Kong 경유 연결은 Kong의 인증/rate limit/로깅을 거쳐야 하므로 직접 연결하지 않음
+            yield {'type': 'error', 'error': "Streaming is not available for Kong-routed connections"}
+            return
+        
+        from app.config import get_settings
+        settings = get_settings()
+        batch_size = settings.DATACLOUD_STREAM_BATCH_SIZE
+        
+        start_time = datetime.now()
+        rows_sent = 0
+        truncated = False
+        status = 'success'
+        error_msg = None
+        columns_sent = False
+        
+        try:
+            async with datacloud_pool_registry.acquire(conn_info, self.decrypt_password) as driver_conn:
+                # 클라이언트 연결 종료 시에도 연결을 풀에 반환하기 전에 커서/트랜잭션을 정리하도록 aclosing
+                # max_rows 다음 행이 있는지 보려고 1행 더 읽음
+                async with aclosing(self._iter_select(
+                    conn_info['db_type'], driver_conn, query, max_rows + 1, batch_size,
+                    timeout=settings.DATACLOUD_QUERY_TIMEOUT
+                )) as batches:
+                    async for columns, batch in batches:
+                        if not columns_sent:
+                            yield {'type': 'columns', 'columns': columns}
+                            columns_sent = True
+                        if rows_sent + len(batch) > max_rows:
+                            batch = batch[:max_rows - rows_sent]
+                            truncated = True
+                        if batch:
+                            rows_sent += len(batch)
+                            yield {'type': 'rows', 'rows': batch}
+                        if truncated:
+                            break
+            
+            execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            yield {
+                'type': 'end',
+                'rows': rows_sent,
+                'truncated': truncated,
+                'execution_time_ms': execution_time_ms
+            }
+        except asyncio.TimeoutError:
+            status = 'timeout'
+            error_msg = f"Query timed out after {settings.DATACLOUD_QUERY_TIMEOUT:g}s"
+            logger.error(f"Query stream timed out (connection {conn_info['id']})")
+            yield {'type': 'error', 'error': error_msg}
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결 종료 - 드라이버 쿼리는 취소됨
+            status = 'cancelled'
+            error_msg = "Client disconnected"
+            raise
+        except Exception as e:
+            status = 'error'
+            error_msg = str(e)
+            logger.error(f"Query stream failed: {e}")
+            yield {'type': 'error', 'error': error_msg}
+        finally:
+            execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            try:
+                await self._log_query(
+                    conn_info['id'], user_id, query, 'select',
+                    execution_time_ms, rows_sent, status, error_msg
+                )
+            except Exception as e:
+                logger.warning(f"Failed to write query log: {e}")
+    
+    async def _log_query(
+        self,
+        connection_id: str,
+        user_id: str,
+        query: str,
+        query_type: str,
+        execution_time_ms: int,
+        rows_affected: int,
+        status: str,
+        error_msg: Optional[str]
+    ) -> None:
+        """db_query_logs 기록"""
+        log_id = str(uuid.uuid4())
+        async with self.get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("""
+                    INSERT INTO db_query_logs 
+                    (id, connection_id, user_id, query_text, query_type, 
+                     execution_time_ms, rows_affected, status, error_message)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, (log_id, connection_id, user_id, query[:5000], query_type, 
+                      execution_time_ms, rows_affected, status, error_msg))
+    
     async def _execute_query_via_kong(
         self,
         connection_id: str,
@@ -994,6 +1225,9 @@ class DataCloudService:
                       column_name, technical_name, business_name, description, 
                       examples, created_by))
         
+        # 다음 스키마 선택 때 새 용어로 인덱스 재구성
+        schema_index_registry.invalidate(connection_id)
+        
         return {'id': term_id, 'technical_name': technical_name, 'business_name': business_name}
     
     async def get_business_terms(self, connection_id: str) -> List[Dict]:
@@ -1175,25 +1409,37 @@ class DataCloudService:
             return {"success": False, "error": str(e), "sql": ""}
 
     def _build_schema_context(self, schema: Dict[str, Any]) -> str:
-        """스키마 정보를 텍스트 컨텍스트로 변환"""
+        """스키마 정보를 텍스트 컨텍스트로 변환
+        
+        schema는 select_relevant_schema() 결과 (질문과 관련된 테이블/컬럼만 포함).
+        """
         lines = []
         tables = schema.get("tables", [])
         
-        # 최대 20개 테이블만 포함 (토큰 제한)
-        for table in tables[:20]:
+        for table in tables:
             table_name = table.get("name", "unknown")
             columns = table.get("columns", [])
             
             col_defs = []
-            for col in columns[:30]:  # 테이블당 최대 30개 컬럼
+            for col in columns:
                 col_name = col.get("name", "")
                 col_type = col.get("type", "")
-                pk = " (PK)" if col.get("is_primary_key") else ""
-                fk = " (FK)" if col.get("is_foreign_key") else ""
-                col_defs.append(f"  - {col_name}: {col_type}{pk}{fk}")
+                pk = " (PK)" if col.get("primary_key") else ""
+                fk_ref = col.get("foreign_key_ref")
+                fk = f" (FK → {fk_ref})" if fk_ref else (" (FK)" if col.get("foreign_key") else "")
+                comment = f" -- {col['comment']}" if col.get("comment") else ""
+                col_defs.append(f"  - {col_name}: {col_type}{pk}{fk}{comment}")
             
-            lines.append(f"테이블: {table_name}")
+            header = f"테이블: {table_name}"
+            if table.get("comment"):
+                header += f" -- {table['comment']}"
+            if table.get("join_neighbour"):
+                header += " (조인 대상)"
+            lines.append(header)
             lines.extend(col_defs)
+            omitted = table.get("column_count", len(columns)) - len(columns)
+            if omitted > 0:
+                lines.append(f"  - ... 외 {omitted}개 컬럼")
             lines.append("")
         
         return "\n".join(lines)
@@ -0,0 +1,236 @@
+"""
+MariaDB Connection Pool Manager
+
+Application-scoped aiomysql pools shared by every portal service.
+
+- FastAPI lifespan에서 start()/close() 호출
+- 접속 정보(host, port, user, password, db)가 같은 서비스는 하나의 풀을 공유
+- pool_recycle로 오래된 연결 교체, 체크아웃 시 ping으로 끊긴 연결 제거
+- 서비스별 체크아웃 대기 시간/사용 중 연결 수를 OTEL metrics로 기록
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiomysql
+
+logger = logging.getLogger(__name__)
+
+# (host, port, user, password, db)
+PoolKey = Tuple[str, int, str, str, str]
+
+_instruments: Optional[Dict[str, Any]] = None
+
+
+def _get_instruments() -> Dict[str, Any]:
+    """OTEL instruments (지연 초기화)."""
+    global _instruments
+    if _instruments is None:
+        from app.telemetry.otel import get_meter
+        meter = get_meter("db_pool")
+        _instruments = {
+            "checkouts": meter.create_counter(
+                "db_pool_checkouts_total",
+                description="MariaDB pool checkouts per service"
+            ),
+            "wait": meter.create_histogram(
+                "db_pool_checkout_wait_ms",
+                description="Time spent waiting for a pooled MariaDB connection"
+            ),
+            "in_use": meter.create_up_down_counter(
+                "db_pool_connections_in_use",
+                description="Pooled MariaDB connections currently checked out"
+            ),
+            "ping_failures": meter.create_counter(
+                "db_pool_ping_failures_total",
+                description="Pooled MariaDB connections discarded after a failed ping"
+            ),
+        }
+    return _instruments
+
+
+def _record(name: str, value: float, service: str) -> None:
+    try:
+        instrument = _get_instruments()[name]
+        attributes = {"service": service}
+        if hasattr(instrument, "record"):
+            instrument.record(value, attributes=attributes)
+        else:
+            instrument.add(value, attributes=attributes)
+    except Exception as e:
+        logger.debug(f"Failed to record db pool metric {name}: {e}")
+
+
+class DBPoolManager:
+    """Registry of shared aiomysql pools."""
+    
+    def __init__(
+        self,
+        minsize: int = 1,
+        maxsize: int = 20,
+        pool_recycle: int = 3600,
+        pre_ping: bool = True,
+        connect_timeout: float = 10.0
+    ):
+        """Initialize pool manager.
+        
+        Args:
+            minsize: Minimum connections per pool
+            maxsize: Maximum connections per pool
+            pool_recycle: Recycle connections older than this many seconds (-1 = never)
+            pre_ping: Ping connections on checkout and replace dead ones
+            connect_timeout: MariaDB connect timeout in seconds
+        """
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.pool_recycle = pool_recycle
+        self.pre_ping = pre_ping
+        self.connect_timeout = connect_timeout
+        
+        self._pools: Dict[PoolKey, aiomysql.Pool] = {}
+        self._lock: Optional[asyncio.Lock] = None
+    
+    def configure_from_settings(self) -> None:
+        """Apply MARIADB_POOL_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.minsize = settings.MARIADB_POOL_MIN_SIZE
+        self.maxsize = settings.MARIADB_POOL_MAX_SIZE
+        self.pool_recycle = settings.MARIADB_POOL_RECYCLE
+        self.pre_ping = settings.MARIADB_POOL_PRE_PING
+    
+    async def start(self) -> None:
+        """Configure pools from settings (pools are created on first use)."""
+        self.configure_from_settings()
+        logger.info(
+            f"MariaDB pool manager ready (size {self.minsize}-{self.maxsize}, "
+            f"recycle {self.pool_recycle}s, pre_ping={self.pre_ping})"
+        )
+    
+    async def get_pool(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        db: str
+    ) -> aiomysql.Pool:
+        """Get or create the pool for a set of connection parameters.
+        
+        Args:
+            host: MariaDB host
+            port: MariaDB port
+            user: User
+            password: Password
+            db: Database name
+        
+        Returns:
+            Shared pool
+        """
+        key: PoolKey = (host, port, user, password, db)
+        pool = self._pools.get(key)
+        if pool is not None and not pool.closed:
+            return pool
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            pool = self._pools.get(key)
+            if pool is None or pool.closed:
+                pool = await aiomysql.create_pool(
+                    host=host,
+                    port=port,
+                    user=user,
+                    password=password,
+                    db=db,
+                    charset='utf8mb4',
+                    autocommit=True,
+                    minsize=self.minsize,
+                    maxsize=self.maxsize,
+                    pool_recycle=self.pool_recycle,
+                    connect_timeout=self.connect_timeout
+                )
+                self._pools[key] = pool
+                logger.info(f"Created MariaDB pool for {user}@{host}:{port}/{db}")
+            return pool
+    
+    @asynccontextmanager
+    async def acquire(
+        self,
+        service: str,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        db: str
+    ) -> AsyncIterator[aiomysql.Connection]:
+        """Check out a pooled connection (returned to the pool on exit).
+        
+        Args:
+            service: Service name for metrics (예: "mcp", "datacloud")
+            host: MariaDB host
+            port: MariaDB port
+            user: User
+            password: Password
+            db: Database name
+        
+        Yields:
+            autocommit connection
+        """
+        pool = await self.get_pool(host, port, user, password, db)
+        
+        start_time = time.perf_counter()
+        conn = await pool.acquire()
+        if self.pre_ping:
+            try:
+                await conn.ping(reconnect=False)
+            except Exception:
+                # 서버가 끊은 연결 - 버리고 새 연결로 교체
+                _record("ping_failures", 1, service)
+                conn.close()
+                pool.release(conn)
+                conn = await pool.acquire()
+        _record("wait", (time.perf_counter() - start_time) * 1000, service)
+        _record("checkouts", 1, service)
+        _record("in_use", 1, service)
+        
+        try:
+            yield conn
+        except (asyncio.CancelledError, asyncio.TimeoutError, aiomysql.OperationalError, aiomysql.InterfaceError):
+            # 취소/timeout으로 결과를 다 읽지 않았거나 끊긴 연결은 재사용하지 않음
+            # (IntegrityError 등 쿼리 오류는 연결 상태와 무관하므로 그대로 반환)
+            conn.close()
+            raise
+        finally:
+            pool.release(conn)
+            _record("in_use", -1, service)
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Pool sizes keyed by user@host:port/db."""
+        return {
+            f"{user}@{host}:{port}/{db}": {
+                "size": pool.size,
+                "free": pool.freesize,
+                "maxsize": pool.maxsize,
+            }
+            for (host, port, user, _, db), pool in self._pools.items()
+        }
+    
+    async def close(self) -> None:
+        """Close every pool."""
+        pools = list(self._pools.values())
+        self._pools.clear()
+        for pool in pools:
+            pool.close()
+        for pool in pools:
+            try:
+                await pool.wait_closed()
+            except Exception as e:
+                logger.warning(f"Error closing MariaDB pool: {e}")
+
+
+# Singleton instance
+db_pool_manager = DBPoolManager()
@@ -1,6 +1,6 @@
 """LiteLLM Service for LLM Gateway"""
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.config import get_settings
 
 settings = get_settings()
@@ -129,6 +129,36 @@ class LiteLLMService:
             except httpx.HTTPStatusError as e:
                 raise Exception(f"LiteLLM API error: {e.response.status_code} - {e.response.text}")
 
+    
+    async def embeddings(self, model: str, inputs: List[str]) -> List[List[float]]:
+        """
+        Create embeddings via LiteLLM (/v1/embeddings).
+        
+        Args:
+            model: Embedding model name
+            inputs: Texts to embed
+            
+        Returns:
+            Embedding vectors in input order
+        """
+        url = f"{self.base_url}/v1/embeddings"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {"model": model, "input": inputs}
+        
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            try:
+                response = await client.post(url, json=payload, headers=headers)
+                response.raise_for_status()
+                data = response.json()["data"]
+                return [item["embedding"] for item in sorted(data, key=lambda item: item["index"])]
+            except httpx.RequestError as e:
+                raise Exception(f"Failed to connect to LiteLLM: {str(e)}")
+            except httpx.HTTPStatusError as e:
+                raise Exception(f"LiteLLM API error: {e.response.status_code} - {e.response.text}")
+
 
 # Singleton instance
 litellm_service = LiteLLMService()
@@ -0,0 +1,153 @@
+"""
+MCP Call Log Writer
+
+Background sink for mcp_call_logs.
+
+- 프록시 요청 경로에서는 bounded queue에 넣기만 하고 바로 반환
+- 백그라운드 태스크가 N행 또는 T밀리초마다 multi-row INSERT로 기록 (공유 커넥션 풀 사용)
+- MariaDB가 느려 큐가 가득 차면 로그를 버리고 counter로 기록
+- 종료 시 남은 로그를 flush
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncContextManager, Callable, List, Optional, Tuple
+
+import aiomysql
+
+from app.mcp.metrics import record_counter, record_histogram
+
+logger = logging.getLogger(__name__)
+
+INSERT_QUERY = """
+INSERT INTO mcp_call_logs (
+    server_id, tool_name, user_id, project_id,
+    request_payload, response_payload, status, error_message, latency_ms
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# stop()이 큐에 넣는 종료 표시
+_STOP = object()
+
+
+class MCPCallLogWriter:
+    """Batched, non-blocking writer for mcp_call_logs rows."""
+    
+    def __init__(
+        self,
+        acquire: Callable[[], AsyncContextManager[aiomysql.Connection]],
+        queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        write_timeout: float = 5.0
+    ):
+        """Initialize writer.
+        
+        Args:
+            acquire: Returns a context manager yielding a pooled autocommit connection
+            queue_size: Maximum number of queued rows (excess rows are dropped)
+            batch_size: Flush when this many rows are collected
+            flush_interval: Flush at least this often in seconds
+            write_timeout: Give up on a batch after this many seconds
+        """
+        self._acquire = acquire
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.write_timeout = write_timeout
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """True if the background flush task is running."""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if self.is_running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info("MCP call log writer started")
+    
+    def enqueue(self, row: Tuple[Any, ...]) -> bool:
+        """Queue one mcp_call_logs row without waiting for MariaDB.
+        
+        Args:
+            row: Values in INSERT_QUERY column order
+        
+        Returns:
+            False if the row was dropped because the queue is full
+        """
+        if not self.is_running:
+            self.start()
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            record_counter("mcp_call_logs_dropped_total", {"reason": "queue_full"})
+            return False
+    
+    async def _run(self) -> None:
+        """Collect rows into batches and write them until stop() is requested."""
+        stopping = False
+        while not stopping:
+            try:
+                item = await self._queue.get()
+                if item is _STOP:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                await self._write_batch(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"MCP call log writer error: {e}")
+    
+    async def _write_batch(self, batch: List[Tuple[Any, ...]]) -> None:
+        """Write one batch with a single multi-row INSERT (dropped on failure).
+        
+        Args:
+            batch: Rows to insert
+        """
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._insert(batch), timeout=self.write_timeout)
+        except Exception as e:
+            reason = "timeout" if isinstance(e, asyncio.TimeoutError) else "write_error"
+            logger.warning(f"Dropping {len(batch)} MCP call logs ({reason}): {e}")
+            record_counter("mcp_call_logs_dropped_total", {"reason": reason}, value=len(batch))
+            return
+        
+        record_counter("mcp_call_logs_written_total", value=len(batch))
+        record_histogram("mcp_call_log_flush_ms", (time.perf_counter() - start_time) * 1000)
+    
+    async def _insert(self, batch: List[Tuple[Any, ...]]) -> None:
+        async with self._acquire() as conn, conn.cursor() as cursor:
+            # aiomysql은 INSERT ... VALUES의 executemany를 multi-row INSERT로 변환
+            await cursor.executemany(INSERT_QUERY, batch)
+    
+    async def stop(self) -> None:
+        """Flush every queued row and stop the flush task."""
+        if self.is_running:
+            # 큐에 남은 로그를 모두 기록한 뒤 종료 (배치마다 write_timeout 적용)
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+        logger.info("MCP call log writer stopped")
@@ -0,0 +1,277 @@
+"""
+MCP Metadata Cache
+
+In-process cache for the proxy_mcp hot path.
+
+- 서버 레코드(get_server)와 권한 확인 결과(check_user_permission)를 짧은 TTL로 캐시
+- update_server / delete_server / grant_permission / revoke_permission 시 명시적 무효화
+- 선택적으로 Redis pub/sub 채널로 다른 워커에도 무효화 전파
+  (MCP_METADATA_CACHE_REDIS_URL 설정 시, redis 패키지 필요)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "mcp:metadata:invalidate"
+
+
+class MCPMetadataCache:
+    """TTL cache for MCP server records and permission checks."""
+    
+    def __init__(
+        self,
+        server_ttl: float = 30.0,
+        permission_ttl: float = 30.0,
+        max_entries: int = 10000
+    ):
+        """Initialize metadata cache.
+        
+        Args:
+            server_ttl: Server record TTL in seconds
+            permission_ttl: Permission check TTL in seconds
+            max_entries: Maximum cached permission results per server
+        """
+        self.server_ttl = server_ttl
+        self.permission_ttl = permission_ttl
+        self.max_entries = max_entries
+        
+        # server_id -> (expires_at, server)
+        self._servers: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # server_id -> (user_id, group_ids) -> (expires_at, allowed)
+        self._permissions: Dict[str, Dict[Tuple[str, FrozenSet[str]], Tuple[float, bool]]] = {}
+        
+        # 워커 간 무효화 (선택)
+        self._origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._redis = None
+        self._channel = DEFAULT_CHANNEL
+        self._listener_task: Optional[asyncio.Task] = None
+    
+    def configure_from_settings(self) -> None:
+        """Apply MCP_METADATA_CACHE_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.server_ttl = settings.MCP_METADATA_CACHE_SERVER_TTL
+        self.permission_ttl = settings.MCP_METADATA_CACHE_PERMISSION_TTL
+    
+    # ==================== 서버 레코드 ====================
+    
+    def get_server(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached server record (None on miss or expiry).
+        
+        Args:
+            server_id: 서버 ID
+        
+        Returns:
+            Cached server record (copy) or None
+        """
+        entry = self._servers.get(server_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._servers.pop(server_id, None)
+            return None
+        return dict(entry[1])
+    
+    def set_server(self, server_id: str, server: Dict[str, Any]) -> None:
+        """Cache a server record.
+        
+        Args:
+            server_id: 서버 ID
+            server: Server record
+        """
+        if self.server_ttl <= 0:
+            return
+        self._servers[server_id] = (time.monotonic() + self.server_ttl, dict(server))
+    
+    # ==================== 권한 ====================
+    
+    @staticmethod
+    def _permission_key(user_id: str, group_ids: Optional[List[str]]) -> Tuple[str, FrozenSet[str]]:
+        return user_id, frozenset(group_ids or [])
+    
+    def get_permission(
+        self,
+        server_id: str,
+        user_id: str,
+        group_ids: Optional[List[str]] = None
+    ) -> Optional[bool]:
+        """Get a cached permission check result (None on miss or expiry).
+        
+        Args:
+            server_id: 서버 ID
+            user_id: 사용자 ID
+            group_ids: 사용자가 속한 그룹 ID 목록
+        
+        Returns:
+            Cached result or None
+        """
+        entries = self._permissions.get(server_id)
+        if not entries:
+            return None
+        key = self._permission_key(user_id, group_ids)
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            entries.pop(key, None)
+            return None
+        return entry[1]
+    
+    def set_permission(
+        self,
+        server_id: str,
+        user_id: str,
+        group_ids: Optional[List[str]],
+        allowed: bool
+    ) -> None:
+        """Cache a permission check result.
+        
+        Args:
+            server_id: 서버 ID
+            user_id: 사용자 ID
+            group_ids: 사용자가 속한 그룹 ID 목록
+            allowed: 접근 권한 여부
+        """
+        if self.permission_ttl <= 0:
+            return
+        entries = self._permissions.setdefault(server_id, {})
+        if len(entries) >= self.max_entries:
+            now = time.monotonic()
+            for key in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+                del entries[key]
+            if len(entries) >= self.max_entries:
+                entries.clear()
+        entries[self._permission_key(user_id, group_ids)] = (
+            time.monotonic() + self.permission_ttl,
+            allowed
+        )
+    
+    # ==================== 무효화 ====================
+    
+    def invalidate_server(self, server_id: Optional[str] = None, broadcast: bool = True) -> None:
+        """Drop the cached server record and permissions (None = everything).
+        
+        Args:
+            server_id: 서버 ID
+            broadcast: 다른 워커에도 무효화 전파
+        """
+        if server_id is None:
+            self._servers.clear()
+            self._permissions.clear()
+        else:
+            self._servers.pop(server_id, None)
+            self._permissions.pop(server_id, None)
+        if broadcast:
+            self._publish("server", server_id)
+    
+    def invalidate_permissions(self, server_id: Optional[str] = None, broadcast: bool = True) -> None:
+        """Drop cached permission results (None = every server).
+        
+        Args:
+            server_id: 서버 ID
+            broadcast: 다른 워커에도 무효화 전파
+        """
+        if server_id is None:
+            self._permissions.clear()
+        else:
+            self._permissions.pop(server_id, None)
+        if broadcast:
+            self._publish("permissions", server_id)
+    
+    # ==================== 워커 간 무효화 (Redis pub/sub) ====================
+    
+    async def start(self) -> None:
+        """Apply settings and subscribe to the invalidation channel if configured."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.configure_from_settings()
+        
+        if not settings.MCP_METADATA_CACHE_REDIS_URL:
+            return
+        
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            logger.warning("redis package not available, MCP metadata cache invalidation stays local")
+            return
+        
+        self._channel = settings.MCP_METADATA_CACHE_CHANNEL or DEFAULT_CHANNEL
+        try:
+            self._redis = aioredis.from_url(settings.MCP_METADATA_CACHE_REDIS_URL)
+            pubsub = self._redis.pubsub()
+            await pubsub.subscribe(self._channel)
+        except Exception as e:
+            logger.error(f"Failed to subscribe MCP metadata cache channel: {e}")
+            self._redis = None
+            return
+        
+        self._listener_task = asyncio.create_task(self._listen(pubsub))
+        logger.info(f"MCP metadata cache subscribed to {self._channel}")
+    
+    async def _listen(self, pubsub: Any) -> None:
+        """Apply invalidations published by other workers."""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                if data.get("origin") == self._origin:
+                    continue
+                if data.get("kind") == "server":
+                    self.invalidate_server(data.get("server_id"), broadcast=False)
+                elif data.get("kind") == "permissions":
+                    self.invalidate_permissions(data.get("server_id"), broadcast=False)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"MCP metadata cache channel listener stopped: {e}")
+        finally:
+            try:
+                await pubsub.close()
+            except Exception:
+                pass
+    
+    def _publish(self, kind: str, server_id: Optional[str]) -> None:
+        if self._redis is None:
+            return
+        payload = json.dumps({"kind": kind, "server_id": server_id, "origin": self._origin})
+        try:
+            asyncio.get_running_loop().create_task(self._publish_async(payload))
+        except RuntimeError:
+            pass
+    
+    async def _publish_async(self, payload: str) -> None:
+        try:
+            await self._redis.publish(self._channel, payload)
+        except Exception as e:
+            logger.warning(f"Failed to publish MCP metadata cache invalidation: {e}")
+    
+    async def stop(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._redis is not None:
+            try:
+                await self._redis.close()
+            except Exception:
+                pass
+            self._redis = None
+
+
+# Singleton instance
+mcp_metadata_cache = MCPMetadataCache()
@@ -16,6 +16,11 @@ from fastapi import HTTPException
 from app.services.kong_service import kong_service
 from app.mcp.git_manager import GitManager
 from app.mcp.process_manager import process_manager, ProcessStatus
+from app.mcp.process_pool import pool_manager
+from app.mcp.tool_cache import tool_cache
+from app.services.mcp_call_log_writer import MCPCallLogWriter
+from app.services.db_pool import db_pool_manager
+from app.services.mcp_metadata_cache import mcp_metadata_cache
 from app.mcp.http_adapter import http_adapter
 from app.config import get_settings
 import logging
@@ -46,17 +51,26 @@ class MCPService:
         self.db_name = os.getenv("MARIADB_DATABASE", "agent_portal")
         settings = get_settings()
         self.git_manager = GitManager(storage_path=settings.MCP_STORAGE_PATH)
+        # stdio 서버에서 새로 조회한 도구 목록은 DB에도 반영
+        tool_cache.set_persister(self._persist_cached_tools)
+        # mcp_call_logs는 백그라운드에서 배치로 기록 (프록시 지연에 DB 연결/커밋 미포함)
+        self.call_log_writer = MCPCallLogWriter(
+            self._get_connection,
+            queue_size=settings.MCP_CALL_LOG_QUEUE_SIZE,
+            batch_size=settings.MCP_CALL_LOG_BATCH_SIZE,
+            flush_interval=settings.MCP_CALL_LOG_FLUSH_INTERVAL_MS / 1000,
+            write_timeout=settings.MCP_CALL_LOG_WRITE_TIMEOUT
+        )
     
-    async def _get_connection(self):
-        """MariaDB 연결 생성."""
-        return await aiomysql.connect(
+    def _get_connection(self):
+        """공유 풀에서 MariaDB 연결 획득 (async with로 사용)."""
+        return db_pool_manager.acquire(
+            "mcp",
             host=self.db_host,
             port=self.db_port,
             user=self.db_user,
             password=self.db_password,
-            db=self.db_name,
-            charset='utf8mb4',
-            autocommit=True
+            db=self.db_name
         )
     
     async def _execute_query(
@@ -75,16 +89,13 @@ class MCPService:
         Returns:
             쿼리 결과 리스트
         """
-        conn = await self._get_connection()
-        try:
+        async with self._get_connection() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute(query, params)
                 if fetch:
                     result = await cursor.fetchall()
                     return list(result)
                 return []
-        finally:
-            conn.close()
     
     # ==================== CRUD 작업 ====================
     
@@ -152,15 +163,21 @@ class MCPService:
             "size": size
         }
     
-    async def get_server(self, server_id: str) -> Optional[Dict[str, Any]]:
+    async def get_server(self, server_id: str, use_cache: bool = False) -> Optional[Dict[str, Any]]:
         """MCP 서버 상세 조회.
         
         Args:
             server_id: 서버 ID
+            use_cache: 짧은 TTL 캐시 사용 (proxy_mcp 등 hot path용)
             
         Returns:
             서버 정보 또는 None
         """
+        if use_cache:
+            cached = mcp_metadata_cache.get_server(server_id)
+            if cached is not None:
+                return cached
+        
         query = """
         SELECT 
             id, name, description, endpoint_url, transport_type,
@@ -184,7 +201,10 @@ class MCPService:
             except:
                 pass
         
-        return self._filter_kong_info(server)
+        server = self._filter_kong_info(server)
+        if use_cache:
+            mcp_metadata_cache.set_server(server_id, server)
+        return server
     
     async def _get_server_internal(self, server_id: str) -> Optional[Dict[str, Any]]:
         """MCP 서버 상세 조회 (내부용, Kong 정보 포함).
@@ -396,6 +416,7 @@ class MCPService:
         """
         
         await self._execute_query(query, tuple(params), fetch=False)
+        mcp_metadata_cache.invalidate_server(server_id)
         
         # get_server는 이미 필터링된 결과를 반환
         return await self.get_server(server_id)
@@ -417,6 +438,7 @@ class MCPService:
         # stdio 서버인 경우 프로세스 정리
         if existing.get('transport_type') == 'stdio':
             try:
+                await pool_manager.remove_pool(server_id)
                 await process_manager.stop_process(server_id)
                 await http_adapter.cleanup(server_id)
             except:
@@ -432,19 +454,23 @@ class MCPService:
         # DB 삭제 (CASCADE로 tools, projects 매핑도 삭제됨)
         query = "DELETE FROM mcp_servers WHERE id = %s"
         await self._execute_query(query, (server_id,), fetch=False)
+        mcp_metadata_cache.invalidate_server(server_id)
         
         return True
     
     # ==================== 도구 관리 ====================
     
-    async def get_server_tools(self, server_id: str) -> List[Dict[str, Any]]:
+    async def get_server_tools(self, server_id: str, refresh: bool = False) -> List[Dict[str, Any]]:
         """MCP 서버의 도구 목록 조회.
         
         stdio MCP 서버의 경우 실제 서버에 연결하여 도구 목록을 가져옵니다.
+        같은 프로세스 세대에서는 캐시된 목록을 반환합니다 (재시작,
+        notifications/tools/list_changed, refresh=True 시에만 다시 조회).
         다른 transport 타입은 DB에서 조회합니다.
         
         Args:
             server_id: 서버 ID
+            refresh: 캐시를 무시하고 서버에서 다시 조회
             
         Returns:
             도구 목록
@@ -455,6 +481,25 @@ class MCPService:
         
         # stdio MCP 서버의 경우 실제 서버에 연결하여 도구 목록 가져오기
         if server.get('transport_type') == 'stdio':
+            if refresh:
+                tool_cache.invalidate(server_id)
+            
+            cached_tools = tool_cache.get(server_id)
+            if cached_tools is not None and process_manager.get_process_status(server_id) == ProcessStatus.RUNNING:
+                now = datetime.utcnow()
+                return [
+                    {
+                        'id': str(uuid.uuid4()),
+                        'server_id': server_id,
+                        'tool_name': tool.get('name', ''),
+                        'tool_description': tool.get('description') or '',
+                        'input_schema': tool.get('inputSchema', {}),
+                        'discovered_at': now,
+                        'updated_at': now
+                    }
+                    for tool in cached_tools
+                ]
+            
             try:
                 # HTTP 어댑터를 통해 실행 중인 프로세스에 연결
                 # HTTP 어댑터는 이미 실행 중인 프로세스와 통신할 수 있음
@@ -636,6 +681,25 @@ class MCPService:
         
         return len(tools)
     
+    async def _persist_cached_tools(self, server_id: str, tools: List[Dict[str, Any]]) -> None:
+        """tool_cache에 새로 저장된 stdio 도구 목록을 DB에 동기화.
+        
+        Args:
+            server_id: 서버 ID
+            tools: tools/list 결과 (name, description, inputSchema)
+        """
+        await self.sync_server_tools(
+            server_id,
+            [
+                {
+                    'name': tool.get('name', ''),
+                    'description': tool.get('description'),
+                    'input_schema': tool.get('inputSchema')
+                }
+                for tool in tools
+            ]
+        )
+    
     # ==================== 헬스 체크 ====================
     
     async def update_health_status(
@@ -685,6 +749,7 @@ class MCPService:
         WHERE id = %s
         """
         await self._execute_query(query, (new_key, server_id), fetch=False)
+        mcp_metadata_cache.invalidate_server(server_id)
         
         return new_key
     
@@ -714,29 +779,22 @@ class MCPService:
             status: 상태 (success, error, timeout)
             error_message: 에러 메시지
             latency_ms: 응답 시간 (밀리초)
-        """
-        query = """
-        INSERT INTO mcp_call_logs (
-            server_id, tool_name, user_id, project_id,
-            request_payload, response_payload, status, error_message, latency_ms
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
         
-        await self._execute_query(
-            query,
-            (
-                server_id,
-                tool_name,
-                user_id,
-                project_id,
-                json.dumps(request_payload) if request_payload else None,
-                json.dumps(response_payload) if response_payload else None,
-                status,
-                error_message,
-                latency_ms
-            ),
-            fetch=False
-        )
+        Note:
+            큐에 넣기만 하고 바로 반환합니다. 실제 INSERT는 call_log_writer가
+            배치로 수행하며, MariaDB가 느려 큐가 가득 차면 로그는 버려집니다.
+        """
+        self.call_log_writer.enqueue((
+            server_id,
+            tool_name,
+            user_id,
+            project_id,
+            json.dumps(request_payload) if request_payload else None,
+            json.dumps(response_payload) if response_payload else None,
+            status,
+            error_message,
+            latency_ms
+        ))
     
     # ==================== 권한 관리 ====================
     
@@ -788,6 +846,8 @@ class MCPService:
                 raise HTTPException(status_code=409, detail="Permission already exists")
             raise HTTPException(status_code=500, detail=f"Failed to grant permission: {str(e)}")
         
+        mcp_metadata_cache.invalidate_permissions(server_id)
+        
         from datetime import datetime
         return {
             "id": permission_id,
@@ -807,8 +867,15 @@ class MCPService:
         Returns:
             삭제 성공 여부
         """
+        # 캐시 무효화를 위해 서버 ID 조회
+        rows = await self._execute_query(
+            "SELECT server_id FROM mcp_server_permissions WHERE id = %s",
+            (permission_id,)
+        )
+        
         query = "DELETE FROM mcp_server_permissions WHERE id = %s"
         await self._execute_query(query, (permission_id,), fetch=False)
+        mcp_metadata_cache.invalidate_permissions(rows[0]['server_id'] if rows else None)
         return True
     
     async def get_server_permissions(self, server_id: str) -> List[Dict[str, Any]]:
@@ -832,7 +899,8 @@ class MCPService:
         self,
         server_id: str,
         user_id: str,
-        group_ids: List[str] = None
+        group_ids: List[str] = None,
+        use_cache: bool = False
     ) -> bool:
         """사용자의 MCP 서버 접근 권한 확인.
         
@@ -840,6 +908,7 @@ class MCPService:
             server_id: 서버 ID
             user_id: 사용자 ID
             group_ids: 사용자가 속한 그룹 ID 목록
+            use_cache: 짧은 TTL 캐시 사용 (proxy_mcp 등 hot path용)
             
         Returns:
             접근 권한 여부
@@ -847,6 +916,14 @@ class MCPService:
         if group_ids is None:
             group_ids = []
         
+        if use_cache:
+            cached = mcp_metadata_cache.get_permission(server_id, user_id, group_ids)
+            if cached is not None:
+                return cached
+            allowed = await self.check_user_permission(server_id, user_id, group_ids)
+            mcp_metadata_cache.set_permission(server_id, user_id, group_ids, allowed)
+            return allowed
+        
         # 사용자 직접 권한 확인
         user_query = """
         SELECT COUNT(*) as count
@@ -1137,6 +1214,8 @@ class MCPService:
             raise HTTPException(status_code=400, detail="Not a stdio MCP server")
         
         try:
+            # 풀 워커가 죽은 프로세스를 다시 띄우지 않도록 풀부터 정리
+            await pool_manager.remove_pool(server_id)
             success = await process_manager.stop_process(server_id)
             
             if success:
@@ -1230,13 +1309,67 @@ class MCPService:
         
         status = process_manager.get_process_status(server_id)
         pid = process_manager.get_process_pid(server_id)
+        pool = pool_manager.get_pool(server_id)
         
         return {
             "server_id": server_id,
             "status": status.value,
             "pid": pid,
-            "process_status": server.get('process_status', 'stopped')
+            "process_status": server.get('process_status', 'stopped'),
+            "buffer": process_manager.get_buffer_stats(server_id),
+            "pool": pool.stats() if pool is not None else None
+        }
+    
+    async def prewarm_stdio_pools(self) -> int:
+        """설정된 stdio 서버의 프로세스 풀을 사전 기동.
+        
+        MCP_PROCESS_POOL_SERVERS에 지정된 서버(이름 또는 ID)마다
+        MCP_PROCESS_POOL_MIN_SIZE개의 워커를 띄우고 initialize까지 마칩니다.
+        
+        Returns:
+            시작된 풀 수
+        """
+        settings = get_settings()
+        targets = {
+            name.strip()
+            for name in settings.MCP_PROCESS_POOL_SERVERS.split(",")
+            if name.strip()
         }
+        if not targets:
+            return 0
+        
+        servers_result = await self.list_servers(enabled_only=True, page=1, size=1000)
+        started = 0
+        for listed in servers_result.get('servers', []):
+            if listed.get('transport_type') != 'stdio':
+                continue
+            if listed.get('id') not in targets and listed.get('name') not in targets:
+                continue
+            
+            server = await self._get_server_internal(listed['id'])
+            if not server or not server.get('command'):
+                continue
+            
+            env = server.get('env_vars') or {}
+            if isinstance(env, str):
+                env = json.loads(env)
+            
+            try:
+                await pool_manager.create_pool(
+                    server_id=server['id'],
+                    command=server['command'],
+                    cwd=server.get('local_path'),
+                    env=env,
+                    min_size=settings.MCP_PROCESS_POOL_MIN_SIZE,
+                    max_size=settings.MCP_PROCESS_POOL_MAX_SIZE,
+                    health_interval=settings.MCP_PROCESS_POOL_HEALTH_INTERVAL
+                )
+                started += 1
+            except Exception as e:
+                logger.error(f"Failed to pre-warm process pool for {server.get('name')}: {e}")
+        
+        logger.info(f"Pre-warmed {started} stdio MCP process pool(s)")
+        return started
     
     async def get_stdio_process_logs(
         self,
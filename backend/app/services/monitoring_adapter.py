@@ -5,13 +5,18 @@ ClickHouse에서 OTEL 트레이스 데이터를 조회하는 어댑터.
 LiteLLM → OTEL Collector → ClickHouse 파이프라인에서 저장된 데이터 조회.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+import asyncio
+import base64
 import httpx
 import json
 import os
+import re
+import time
 import logging
 from app.config import get_settings
+from app.services.clickhouse_client import clickhouse_client
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,89 @@ CLICKHOUSE_USER = os.getenv('CLICKHOUSE_USER', 'default')
 CLICKHOUSE_PASSWORD = os.getenv('CLICKHOUSE_PASSWORD', 'password')
 CLICKHOUSE_DATABASE = os.getenv('CLICKHOUSE_DATABASE', 'otel_2')
 
+# 트레이스 목록 총 개수 모드
+# - exact: count(DISTINCT TraceId)
+# - approx: uniqCombined(TraceId) 근사치
+# - none: 총 개수 생략 (has_more만 반환, 무한 스크롤용)
+TRACE_COUNT_MODES = ('exact', 'approx', 'none')
+
+# otel_traces에 MATERIALIZED로 추가한 GenAI 컬럼 (otel-collector/clickhouse/migrations/add_genai_columns.sql)
+# 이름 -> (컬럼, 컬럼이 없을 때 Map에서 읽는 원래 식). {t}는 테이블 alias 자리
+GENAI_COLUMNS = {
+    'project_id': ('ResourceProjectId', "{t}ResourceAttributes['project_id']"),
+    'prompt_tokens': ('PromptTokens', """greatest(
+                toUInt64OrZero({t}SpanAttributes['gen_ai.usage.prompt_tokens']),
+                toUInt64OrZero({t}SpanAttributes['llm.usage.prompt_tokens']),
+                toUInt64OrZero(extractAll({t}SpanAttributes['llm.openrouter.usage'], '\\'prompt_tokens\\': ([0-9]+)')[1])
+            )"""),
+    'completion_tokens': ('CompletionTokens', """greatest(
+                toUInt64OrZero({t}SpanAttributes['gen_ai.usage.completion_tokens']),
+                toUInt64OrZero({t}SpanAttributes['llm.usage.completion_tokens']),
+                toUInt64OrZero(extractAll({t}SpanAttributes['llm.openrouter.usage'], '\\'completion_tokens\\': ([0-9]+)')[1])
+            )"""),
+    'llm_total_tokens': ('LlmTotalTokens', "toUInt64OrZero({t}SpanAttributes['llm.usage.total_tokens'])"),
+    'total_tokens': ('TotalTokens', """greatest(
+                toUInt64OrZero({t}SpanAttributes['gen_ai.usage.total_tokens']),
+                toUInt64OrZero({t}SpanAttributes['llm.usage.total_tokens'])
+            )"""),
+    # OpenRouter 응답에서 저장된 비용만 사용 (metadata.usage_object에 cost 필드)
+    'cost': ('Cost', """toFloat64OrZero(extractAll({t}SpanAttributes['metadata.usage_object'], '''cost'':\\s*([0-9.eE+-]+)')[1])"""),
+    'agent_id': ('AgentId', "{t}SpanAttributes['metadata.agent_id']"),
+    'model': ('Model', """multiIf(
+                {t}SpanAttributes['gen_ai.request.model'] != '', {t}SpanAttributes['gen_ai.request.model'],
+                {t}SpanAttributes['gen_ai.response.model'] != '', {t}SpanAttributes['gen_ai.response.model'],
+                {t}SpanAttributes['llm.request.model']
+            )"""),
+}
+
+# 비용/토큰 추이 rollup 테이블 (큰 단위부터): (테이블, 버킷 크기, 버킷 시작으로 자르는 필드)
+USAGE_ROLLUP_LEVELS = (
+    ('otel_usage_rollup_1d', timedelta(days=1), dict(hour=0, minute=0, second=0, microsecond=0)),
+    ('otel_usage_rollup_1h', timedelta(hours=1), dict(minute=0, second=0, microsecond=0)),
+    ('otel_usage_rollup_1m', timedelta(minutes=1), dict(second=0, microsecond=0)),
+)
+
+_CURSOR_TIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d{1,9})?$')
+_CURSOR_TRACE_ID_RE = re.compile(r'^[0-9A-Za-z_-]{1,128}$')
+
+
+def encode_trace_cursor(start_time: str, trace_id: str) -> str:
+    """트레이스 목록 keyset 커서 생성 (마지막 행의 start_time, trace_id).
+    
+    Args:
+        start_time: ClickHouse가 반환한 start_time 문자열
+        trace_id: 트레이스 ID
+    
+    Returns:
+        불투명(opaque) 커서 문자열
+    """
+    payload = json.dumps({"t": start_time, "id": trace_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_trace_cursor(cursor: str) -> Tuple[str, str]:
+    """encode_trace_cursor로 만든 커서 해석.
+    
+    Args:
+        cursor: 불투명 커서 문자열
+    
+    Returns:
+        (start_time, trace_id)
+    
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        start_time, trace_id = str(data["t"]), str(data["id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    # 커서 값은 쿼리에 그대로 들어가므로 형식을 엄격히 검사
+    if not _CURSOR_TIME_RE.match(start_time) or not _CURSOR_TRACE_ID_RE.match(trace_id):
+        raise ValueError("Invalid cursor")
+    return start_time, trace_id
+
 
 class MonitoringAdapter:
     """
@@ -33,25 +121,27 @@ class MonitoringAdapter:
     
     def __init__(self):
         self.base_url = f"http://{CLICKHOUSE_HOST}:{CLICKHOUSE_PORT}/"
+        # 사전 집계 테이블 존재 여부 (otel_trace_summary, otel_usage_rollup_*)
+        self._table_available: Dict[str, bool] = {}
+        # otel_traces GenAI MATERIALIZED 컬럼 존재 여부 (None = 아직 확인 안 함)
+        self._genai_columns_available: Optional[bool] = None
+        # 대시보드 결과 캐시: (project, 버킷 단위 기간, interval) -> (expires_at, result)
+        self._dashboard_cache: Dict[Tuple[str, str, str, str], Tuple[float, Dict[str, Any]]] = {}
+        # 같은 키로 진행 중인 대시보드 조회 (동시 요청은 한 번만 실행)
+        self._dashboard_inflight: Dict[Tuple[str, str, str, str], asyncio.Task] = {}
     
     async def _execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """ClickHouse 쿼리 실행 헬퍼 메서드.
         
+        공유 keep-alive ClickHouse 클라이언트로 실행 (app/services/clickhouse_client.py).
+        
         Args:
-            query: SQL 쿼리 문자열
-            params: 쿼리 파라미터 (선택적)
+            query: SQL 쿼리 문자열 (파라미터는 {name:Type} 형식)
+            params: 서버 측 쿼리 파라미터 (선택적)
             
         Returns:
             쿼리 결과 리스트
         """
-        headers = {
-            "X-ClickHouse-User": CLICKHOUSE_USER,
-            "X-ClickHouse-Key": CLICKHOUSE_PASSWORD,
-        }
-        
-        # JSONEachRow 형식으로 결과 반환
-        full_query = f"{query} FORMAT JSONEachRow"
-        
         # 디버깅: list_query와 count_query만 로깅 및 파일 저장
         if "GROUP BY TraceId" in query:
             # trace_id_filter 포함 여부 확인
@@ -67,20 +157,7 @@ class MonitoringAdapter:
                     pass
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.base_url,
-                    headers=headers,
-                    content=full_query
-                )
-                response.raise_for_status()
-                
-                # JSONEachRow 파싱
-                result = []
-                for line in response.text.strip().split('\n'):
-                    if line:
-                        result.append(json.loads(line))
-                return result
+            return await clickhouse_client.query(query, params)
         except httpx.HTTPStatusError as e:
             error_text = str(e.response.text) if e.response else ""
             # 테이블이 없거나 컬럼이 없는 경우 등 ClickHouse 에러 처리
@@ -92,12 +169,74 @@ class MonitoringAdapter:
         except (httpx.ConnectError, httpx.NetworkError, OSError) as e:
             # ClickHouse 연결 실패 - 서비스가 실행되지 않았거나 네트워크 문제
             error_msg = str(e)
-            logger.error(f"ClickHouse connection failed ({self.base_url}): {error_msg[:200]}")
+            logger.error(f"ClickHouse connection failed ({clickhouse_client.base_url}): {error_msg[:200]}")
             raise
         except Exception as e:
             logger.error(f"Unexpected error executing ClickHouse query: {str(e)[:200]}")
             raise
     
+    async def _has_table(self, table: str) -> bool:
+        """사전 집계 테이블 존재 여부 (결과는 프로세스 내 캐시).
+        
+        Args:
+            table: 테이블 이름 (CLICKHOUSE_DATABASE 기준)
+        
+        Returns:
+            테이블이 있으면 True
+        """
+        if table in self._table_available:
+            return self._table_available[table]
+        
+        try:
+            result = await self._execute_query("""
+            SELECT count() as cnt
+            FROM system.tables
+            WHERE database = {database:String} AND name = {table:String}
+            """, {"database": CLICKHOUSE_DATABASE, "table": table})
+        except Exception as e:
+            # 확인 실패 시 캐시하지 않고 이번 요청만 raw 쿼리 사용
+            logger.warning(f"Failed to check {table} table: {str(e)[:200]}")
+            return False
+        
+        available = bool(result and int(result[0]['cnt']) > 0)
+        self._table_available[table] = available
+        if not available:
+            logger.info(f"{table} table not found, falling back to otel_traces")
+        return available
+    
+    async def _genai(self, alias: str = '') -> Dict[str, str]:
+        """GenAI 값 SQL 식 (GENAI_COLUMNS 이름 -> 식).
+        
+        otel_traces에 MATERIALIZED 컬럼이 모두 있으면 컬럼을, 없으면 Map에서 읽는 원래 식을 반환.
+        
+        Args:
+            alias: 테이블 alias (예: 'a.')
+        
+        Returns:
+            이름 -> SQL 식
+        """
+        if self._genai_columns_available is None:
+            columns = [column for column, _ in GENAI_COLUMNS.values()]
+            try:
+                result = await self._execute_query("""
+                SELECT count() as cnt
+                FROM system.columns
+                WHERE database = {database:String}
+                  AND table = 'otel_traces'
+                  AND name IN {columns:Array(String)}
+                """, {"database": CLICKHOUSE_DATABASE, "columns": columns})
+                self._genai_columns_available = bool(result and int(result[0]['cnt']) == len(columns))
+            except Exception as e:
+                # 확인 실패 시 캐시하지 않고 이번 요청만 원래 식 사용
+                logger.warning(f"Failed to check otel_traces GenAI columns: {str(e)[:200]}")
+                return {name: expr.replace('{t}', alias) for name, (_, expr) in GENAI_COLUMNS.items()}
+            if not self._genai_columns_available:
+                logger.info("otel_traces GenAI columns not found, reading SpanAttributes map")
+        
+        if self._genai_columns_available:
+            return {name: f"{alias}{column}" for name, (column, _) in GENAI_COLUMNS.items()}
+        return {name: expr.replace('{t}', alias) for name, (_, expr) in GENAI_COLUMNS.items()}
+    
     async def get_traces(
         self,
         project_id: str,
@@ -106,17 +245,212 @@ class MonitoringAdapter:
         search: Optional[str] = None,
         page: int = 1,
         size: int = 20,
-        trace_type: Optional[str] = None
+        trace_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = 'exact'
     ) -> Dict[str, Any]:
         """
         트레이스 목록 조회.
         LLM/Agent 호출만 필터링 (auth, postgres 등 내부 호출 제외).
         
+        otel_trace_summary (trace 단위 사전 집계 테이블)가 있으면 그 테이블을,
+        없으면 otel_traces를 직접 집계.
+        
+        정렬은 (start_time, trace_id) 내림차순. cursor가 있으면 OFFSET 대신
+        커서 이후 행부터 조회 (keyset pagination, page는 무시).
+        
         Args:
             trace_type: 'agent', 'llm', 또는 None (모두)
+            cursor: 이전 응답의 next_cursor
+            count_mode: 'exact', 'approx' (uniqCombined), 'none' (총 개수 생략)
+        
+        Returns:
+            {traces, total, page, size, has_more, next_cursor}
+        
+        Raises:
+            ValueError: 잘못된 cursor 또는 count_mode
+        """
+        if count_mode not in TRACE_COUNT_MODES:
+            raise ValueError(f"Invalid count_mode: {count_mode}")
+        after = decode_trace_cursor(cursor) if cursor else None
+        
+        if settings.MONITORING_TRACE_SUMMARY_ENABLED and await self._has_table('otel_trace_summary'):
+            return await self._get_traces_summary(
+                project_id, start_time, end_time, search, page, size, trace_type, after, count_mode
+            )
+        return await self._get_traces_raw(
+            project_id, start_time, end_time, search, page, size, trace_type, after, count_mode
+        )
+    
+    @staticmethod
+    def _trace_page_clauses(
+        after: Optional[Tuple[str, str]],
+        page: int,
+        size: int
+    ) -> Tuple[str, str]:
+        """트레이스 목록 페이지 조건.
+        
+        Args:
+            after: 커서 (start_time, trace_id), 없으면 page 기반 OFFSET
+            page: 페이지 번호
+            size: 페이지 크기
+        
+        Returns:
+            (HAVING용 keyset 조건 또는 "", LIMIT 절)
+        """
+        # has_more 판단을 위해 한 행 더 조회
+        if after:
+            after_time, after_trace_id = after
+            keyset = f"(start_time, trace_id) < (toDateTime64('{after_time}', 9), '{after_trace_id}')"
+            return keyset, f"LIMIT {size + 1}"
+        return "", f"LIMIT {size + 1} OFFSET {(page - 1) * size}"
+    
+    @staticmethod
+    def _trace_page_result(
+        rows: List[Dict[str, Any]],
+        total: Optional[int],
+        page: int,
+        size: int
+    ) -> Dict[str, Any]:
+        """size + 1행 조회 결과로 응답 구성."""
+        has_more = len(rows) > size
+        traces = rows[:size]
+        next_cursor = None
+        if has_more and traces:
+            last = traces[-1]
+            next_cursor = encode_trace_cursor(str(last['start_time']), str(last['trace_id']))
+        return {
+            "traces": traces,
+            "total": total,
+            "page": page,
+            "size": size,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
+    
+    async def _get_traces_summary(
+        self,
+        project_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        search: Optional[str],
+        page: int,
+        size: int,
+        trace_type: Optional[str],
+        after: Optional[Tuple[str, str]],
+        count_mode: str
+    ) -> Dict[str, Any]:
+        """
+        otel_trace_summary에서 트레이스 목록 조회.
+        LLM/Agent 필터와 비용/토큰 추출은 materialized view가 수집 시점에 이미 적용.
+        같은 trace가 여러 행(insert 블록/날짜)으로 나뉠 수 있으므로 TraceId로 다시 합침.
+        """
+        start_str = start_time.strftime('%Y-%m-%d %H:%M:%S')
+        end_str = end_time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # project_id/search는 서버 측 파라미터로 전달 (따옴표가 든 검색어도 안전)
+        params: Dict[str, Any] = {"project_id": project_id}
+        
+        # 기간 필터는 파티션/정렬 키(Day)로 먼저 줄이고 HAVING에서 정확한 시각으로 자름
+        where_clause = f"""
+        WHERE (ProjectId = {{project_id:String}} OR ProjectId = '')
+          AND Day >= toDate('{start_str}')
+          AND Day <= toDate('{end_str}')
+        """
+        
+        having_conditions = [
+            f"start_time >= '{start_str}'",
+            f"start_time <= '{end_str}'",
+        ]
+        # 근사 개수용 행 단위 조건 (GROUP BY 없이 uniqCombined)
+        row_conditions = [f"Start <= '{end_str}'", f"End >= '{start_str}'"]
+        span_name_select = "any(SpanName) as span_name"
+        if trace_type == 'llm':
+            having_conditions.append("max(IsLlm) = 1")
+            row_conditions.append("IsLlm = 1")
+            span_name_select = "argMaxMerge(LlmSpanName) as span_name"
+        elif trace_type == 'agent':
+            having_conditions.append("max(IsAgent) = 1")
+            row_conditions.append("IsAgent = 1")
+            span_name_select = "argMaxMerge(AgentSpanName) as span_name"
+        if search:
+            params["search"] = search
+            having_conditions.append(
+                "(position(trace_id, {search:String}) > 0"
+                " OR arrayExists(n -> position(n, {search:String}) > 0, groupUniqArrayArray(SpanNames)))"
+            )
+            row_conditions.append(
+                "(position(TraceId, {search:String}) > 0"
+                " OR arrayExists(n -> position(n, {search:String}) > 0, SpanNames))"
+            )
+        having_clause = "HAVING " + " AND ".join(having_conditions)
+        
+        total = None
+        if count_mode == 'exact':
+            count_query = f"""
+            SELECT count() as total
+            FROM (
+                SELECT TraceId as trace_id, min(Start) as start_time
+                FROM {CLICKHOUSE_DATABASE}.otel_trace_summary
+                {where_clause}
+                GROUP BY TraceId
+                {having_clause}
+            )
+            """
+        elif count_mode == 'approx':
+            count_query = f"""
+            SELECT uniqCombined(TraceId) as total
+            FROM {CLICKHOUSE_DATABASE}.otel_trace_summary
+            {where_clause}
+              AND {' AND '.join(row_conditions)}
+            """
+        if count_mode != 'none':
+            count_result = await self._execute_query(count_query, params)
+            total = int(count_result[0]['total']) if count_result else 0
+        
+        keyset, limit_clause = self._trace_page_clauses(after, page, size)
+        if keyset:
+            having_clause += f" AND {keyset}"
+        
+        list_query = f"""
+        SELECT
+            TraceId as trace_id,
+            any(ServiceName) as service_name,
+            {span_name_select},
+            min(Start) as start_time,
+            sum(DurationNs) / 1000000 as duration,
+            sum(SpanCount) as span_count,
+            sum(ErrorCount) as error_count,
+            sum(TotalCost) as total_cost,
+            sum(PromptTokens) as prompt_tokens,
+            sum(CompletionTokens) as completion_tokens
+        FROM {CLICKHOUSE_DATABASE}.otel_trace_summary
+        {where_clause}
+        GROUP BY TraceId
+        {having_clause}
+        ORDER BY start_time DESC, trace_id DESC
+        {limit_clause}
         """
-        offset = (page - 1) * size
+        rows = await self._execute_query(list_query, params)
         
+        return self._trace_page_result(rows, total, page, size)
+    
+    async def _get_traces_raw(
+        self,
+        project_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        search: Optional[str],
+        page: int,
+        size: int,
+        trace_type: Optional[str],
+        after: Optional[Tuple[str, str]],
+        count_mode: str
+    ) -> Dict[str, Any]:
+        """
+        otel_traces를 직접 집계하여 트레이스 목록 조회 (otel_trace_summary가 없을 때).
+        """
+        g = await self._genai()
         # 검색 조건
         search_clause = ""
         if search:
@@ -132,7 +466,7 @@ class MonitoringAdapter:
         # - dart.llm_call.*, dart.tool_call.* (레거시)
         # - litellm_request (LiteLLM 프록시)
         # - legislation.* (법률 에이전트)
-        llm_filter = """
+        llm_filter = f"""
           AND (
             -- GenAI 표준: LLM 호출 (completion)
             SpanName = 'gen_ai.content.completion'
@@ -146,8 +480,7 @@ class MonitoringAdapter:
             OR SpanAttributes['gen_ai.agent.id'] != ''
             OR SpanAttributes['gen_ai.agent.name'] != ''
             -- 토큰이 있는 LLM 호출 (실제 API 호출) - GenAI 표준 속성도 포함
-            OR toUInt64OrZero(SpanAttributes['gen_ai.usage.total_tokens']) > 0
-            OR toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) > 0
+            OR {g['total_tokens']} > 0
             -- DART 에이전트 호출 (모든 dart.* 패턴 포함)
             OR SpanName LIKE 'dart.%'
             -- 법률 에이전트 호출 (legislation.* 패턴)
@@ -177,7 +510,7 @@ class MonitoringAdapter:
             AND TraceId IN (
               SELECT DISTINCT TraceId
               FROM {CLICKHOUSE_DATABASE}.otel_traces
-              WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+              WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
                 AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
                 AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
                 {llm_filter}
@@ -194,7 +527,7 @@ class MonitoringAdapter:
             AND TraceId IN (
               SELECT DISTINCT TraceId
               FROM {CLICKHOUSE_DATABASE}.otel_traces
-              WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+              WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
                 AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
                 AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
                 {llm_filter}
@@ -216,19 +549,25 @@ class MonitoringAdapter:
         
         # 총 개수 (trace_type 필터 적용)
         # Note: project_id가 비어있는 데이터도 포함 (LiteLLM 기본 설정)
+        count_expr = "uniqCombined(TraceId)" if count_mode == 'approx' else "count(DISTINCT TraceId)"
         count_query = f"""
-        SELECT count(DISTINCT TraceId) as total
+        SELECT {count_expr} as total
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+        WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
           {llm_filter}
           {trace_id_filter}
           {search_clause}
         """
-        logging.info(f"Count query (trace_type={trace_type}): {count_query}")
-        count_result = await self._execute_query(count_query)
-        total = count_result[0]['total'] if count_result else 0
+        total = None
+        if count_mode != 'none':
+            logging.info(f"Count query (trace_type={trace_type}): {count_query}")
+            count_result = await self._execute_query(count_query)
+            total = int(count_result[0]['total']) if count_result else 0
+        
+        keyset, limit_clause = self._trace_page_clauses(after, page, size)
+        keyset_having = f"HAVING {keyset}" if keyset else ""
         
         # 트레이스 목록 (집계)
         # Note: LiteLLM/OpenRouter stores cost in llm.openrouter.usage field
@@ -280,30 +619,21 @@ class MonitoringAdapter:
             countIf(StatusCode = 'ERROR') as error_count,
             sum(
                 -- OpenRouter 응답에서 저장된 비용만 사용 (metadata.usage_object에 cost 필드)
-                toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\\s*([0-9.eE+-]+)')[1])
+                {g['cost']}
             ) as total_cost,
-            sum(greatest(
-                toUInt64OrZero(SpanAttributes['gen_ai.usage.prompt_tokens']),
-                toUInt64OrZero(SpanAttributes['llm.usage.prompt_tokens']),
-                -- Extract from llm.openrouter.usage
-                toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'prompt_tokens\\': ([0-9]+)')[1])
-            )) as prompt_tokens,
-            sum(greatest(
-                toUInt64OrZero(SpanAttributes['gen_ai.usage.completion_tokens']),
-                toUInt64OrZero(SpanAttributes['llm.usage.completion_tokens']),
-                -- Extract from llm.openrouter.usage
-                toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'completion_tokens\\': ([0-9]+)')[1])
-            )) as completion_tokens
+            sum({g['prompt_tokens']}) as prompt_tokens,
+            sum({g['completion_tokens']}) as completion_tokens
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+        WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
           {llm_filter}
           {trace_id_filter}
           {search_clause}
         GROUP BY TraceId
-        ORDER BY start_time DESC
-        LIMIT {size} OFFSET {offset}
+        {keyset_having}
+        ORDER BY start_time DESC, trace_id DESC
+        {limit_clause}
         """
         logging.info(f"List query (trace_type={trace_type}): {list_query[:500]}...")
         
@@ -313,14 +643,9 @@ class MonitoringAdapter:
             logger.error(f"trace_id_filter length: {len(trace_id_filter)}")
             logger.error(f"list_query WHERE clause: {list_query[list_query.find('WHERE'):list_query.find('GROUP BY')]}")
         
-        traces = await self._execute_query(list_query)
+        rows = await self._execute_query(list_query)
         
-        return {
-            "traces": traces,
-            "total": total,
-            "page": page,
-            "size": size
-        }
+        return self._trace_page_result(rows, total, page, size)
     
     async def get_trace_detail(self, trace_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -328,6 +653,7 @@ class MonitoringAdapter:
         Duration은 나노초에서 밀리초로 변환하여 반환.
         총 비용도 백엔드에서 집계하여 반환.
         """
+        g = await self._genai()
         query = f"""
         SELECT 
             TraceId as trace_id,
@@ -341,28 +667,32 @@ class MonitoringAdapter:
             StatusMessage as status_message,
             SpanAttributes as span_attributes,
             ResourceAttributes as resource_attributes,
-            ResourceAttributes['project_id'] as project_id
+            {g['project_id']} as project_id
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE TraceId = '{trace_id}'
+        WHERE TraceId = {{trace_id:String}}
         ORDER BY Timestamp ASC
         """
-        spans = await self._execute_query(query)
-        
-        if not spans:
-            return None
         
         # 총 비용 집계 (백엔드에서 계산)
         total_cost_query = f"""
         SELECT 
             sum(
                 -- OpenRouter 응답에서 저장된 비용만 사용 (metadata.usage_object에 cost 필드)
-                toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\\s*([0-9.eE+-]+)')[1])
+                {g['cost']}
             ) as total_cost,
             count() as total_spans
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE TraceId = '{trace_id}'
+        WHERE TraceId = {{trace_id:String}}
         """
-        cost_result = await self._execute_query(total_cost_query)
+        params = {"trace_id": trace_id}
+        spans, cost_result = await asyncio.gather(
+            self._execute_query(query, params),
+            self._execute_query(total_cost_query, params)
+        )
+        
+        if not spans:
+            return None
+        
         total_cost = cost_result[0]['total_cost'] if cost_result and cost_result[0] else 0.0
         total_spans = cost_result[0]['total_spans'] if cost_result and cost_result[0] else len(spans)
         
@@ -374,6 +704,65 @@ class MonitoringAdapter:
             "spans": spans
         }
     
+    async def get_live_spans(
+        self,
+        project_id: str,
+        since: Optional[str],
+        lookback_seconds: int,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        라이브 테일용 신규 스팬 조회 (trace_live_tail 폴러가 사용).
+        
+        스팬은 끝난 뒤 배치로 들어오므로 Timestamp가 high-water mark보다 조금 이전인 스팬도
+        늦게 도착할 수 있음. since에서 lookback_seconds만큼 겹쳐 읽고 중복은 호출 측에서 SpanId로 제거.
+        겹쳐 읽는 구간이 limit보다 많으면 after keyset으로 이어서 읽음.
+        
+        Args:
+            project_id: 프로젝트 ID
+            since: 지금까지 받은 가장 큰 Timestamp (ClickHouse 문자열 그대로, 없으면 현재 시각 기준)
+            lookback_seconds: since 이전으로 겹쳐 읽을 초
+            limit: 최대 행 수
+            after: 직전 페이지 마지막 스팬의 (Timestamp, SpanId) - 있으면 그 이후부터 조회
+        
+        Returns:
+            (Timestamp, SpanId) 오름차순 스팬 리스트
+        """
+        g = await self._genai()
+        if since:
+            since_clause = "Timestamp >= {since:DateTime64(9)} - toIntervalSecond({lookback:UInt32})"
+        else:
+            since_clause = "Timestamp >= now64(9) - toIntervalSecond({lookback:UInt32})"
+        if after:
+            since_clause += " AND (Timestamp, SpanId) > ({after_timestamp:DateTime64(9)}, {after_span_id:String})"
+        
+        query = f"""
+        SELECT 
+            TraceId as trace_id,
+            SpanId as span_id,
+            ParentSpanId as parent_span_id,
+            SpanName as span_name,
+            ServiceName as service_name,
+            Timestamp as timestamp,
+            Duration / 1000000 as duration,
+            StatusCode as status_code,
+            {g['model']} as model,
+            {g['total_tokens']} as total_tokens,
+            {g['cost']} as cost
+        FROM {CLICKHOUSE_DATABASE}.otel_traces
+        WHERE ({g['project_id']} = {{project_id:String}} OR {g['project_id']} = '')
+          AND {since_clause}
+        ORDER BY Timestamp ASC, SpanId ASC
+        LIMIT {int(limit)}
+        """
+        params: Dict[str, Any] = {"project_id": project_id, "lookback": int(lookback_seconds)}
+        if since:
+            params["since"] = since
+        if after:
+            params["after_timestamp"], params["after_span_id"] = after
+        return await self._execute_query(query, params)
+    
     async def get_metrics(
         self,
         project_id: str,
@@ -384,6 +773,7 @@ class MonitoringAdapter:
         메트릭 집계.
         LLM/Agent 호출만 집계 (auth, postgres 등 내부 호출 제외).
         """
+        g = await self._genai()
         # LLM/Agent 호출만 필터링하는 조건 (GenAI 표준 span 이름 기반)
         # Note: LiteLLM uses 'llm.usage.total_tokens' instead of 'gen_ai.usage.prompt_tokens'
         llm_filter = """
@@ -422,14 +812,14 @@ class MonitoringAdapter:
             ) as agent_call_count,
             sum(
                 -- OpenRouter 응답에서 저장된 비용만 사용 (metadata.usage_object에 cost 필드)
-                toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\\s*([0-9.eE+-]+)')[1])
+                {g['cost']}
             ) as total_cost,
             sum(greatest(
-                toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']),
+                {g['llm_total_tokens']},
                 toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'prompt_tokens\\': ([0-9]+)')[1])
             )) as prompt_tokens,
             sum(greatest(
-                toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']),
+                {g['llm_total_tokens']},
                 toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'completion_tokens\\': ([0-9]+)')[1])
             )) as completion_tokens,
             sum(toUInt64OrZero(SpanAttributes['gen_ai.usage.cache_read_input_tokens'])) as cache_read_input_tokens,
@@ -439,7 +829,7 @@ class MonitoringAdapter:
             quantile(0.95)(Duration) / 1000000 as p95_duration,
             quantile(0.99)(Duration) / 1000000 as p99_duration
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+        WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
           {llm_filter}
@@ -480,58 +870,124 @@ class MonitoringAdapter:
         sorted_spans = sorted(spans, key=lambda s: s['timestamp'])
         
         # 이벤트로 변환
-        events = []
+        start_time = self._replay_timestamp(sorted_spans[0]['timestamp'])
+        events = [self._replay_event(span, start_time) for span in sorted_spans]
+        
+        return {
+            'trace_id': trace_id,
+            'events': events,
+            'timeline': [e['relative_time'] for e in events],
+            'total_duration': self._replay_end(sorted_spans[-1], start_time),
+            'start_time': int(start_time.timestamp() * 1000)
+        }
+    
+    async def stream_session_replay(
+        self,
+        trace_id: str,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        세션 리플레이 스트리밍.
+        
+        스팬을 (Timestamp, SpanId) keyset으로 page_size개씩 읽어 바로 이벤트로 변환하므로
+        긴 세션도 첫 페이지가 도착하는 즉시 재생을 시작할 수 있음.
+        트레이스가 없으면 아무것도 yield하지 않음.
+        
+        Yields:
+            ('start', {trace_id, start_time}) 1회,
+            ('event', get_session_replay의 events 항목) 스팬마다,
+            ('end', {trace_id, total_duration, event_count}) 1회
+        """
+        if page_size is None:
+            page_size = settings.MONITORING_REPLAY_PAGE_SIZE
+        
+        query = f"""
+        SELECT 
+            SpanId as span_id,
+            ParentSpanId as parent_span_id,
+            SpanName as span_name,
+            ServiceName as service_name,
+            Timestamp as timestamp,
+            Duration / 1000000 as duration,
+            StatusCode as status_code,
+            StatusMessage as status_message,
+            SpanAttributes as span_attributes
+        FROM {CLICKHOUSE_DATABASE}.otel_traces
+        WHERE TraceId = {{trace_id:String}}
+          {{after}}
+        ORDER BY Timestamp ASC, SpanId ASC
+        LIMIT {int(page_size)}
+        """
+        after_clause = "AND (Timestamp, SpanId) > ({after_timestamp:DateTime64(9)}, {after_span_id:String})"
+        
+        params: Dict[str, Any] = {"trace_id": trace_id}
         start_time = None
+        last_span = None
+        event_count = 0
         
-        for span in sorted_spans:
-            timestamp_str = span['timestamp']
-            # ClickHouse DateTime64 형식 처리
-            if isinstance(timestamp_str, str):
-                # 나노초 제거
-                if '.' in timestamp_str:
-                    timestamp_str = timestamp_str.split('.')[0]
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', ''))
-            else:
-                timestamp = timestamp_str
+        while True:
+            spans = await self._execute_query(
+                query.replace("{after}", after_clause if last_span else ""),
+                params
+            )
+            if not spans:
+                break
             
             if start_time is None:
-                start_time = timestamp
-            
-            relative_time = int((timestamp - start_time).total_seconds() * 1000)
+                start_time = self._replay_timestamp(spans[0]['timestamp'])
+                yield 'start', {
+                    'trace_id': trace_id,
+                    'start_time': int(start_time.timestamp() * 1000)
+                }
             
-            # 이벤트 타입 추론
-            event_type = self._infer_event_type(span)
+            for span in spans:
+                yield 'event', self._replay_event(span, start_time)
+            event_count += len(spans)
             
-            events.append({
-                'timestamp': timestamp.isoformat(),
-                'relative_time': relative_time,
-                'type': event_type,
-                'span_id': span['span_id'],
-                'span_name': span['span_name'],
-                'data': self._extract_event_data(span, event_type)
-            })
-        
-        # 마지막 스팬의 종료 시간 계산
-        last_span = sorted_spans[-1]
-        last_timestamp_str = last_span['timestamp']
-        if isinstance(last_timestamp_str, str):
-            if '.' in last_timestamp_str:
-                last_timestamp_str = last_timestamp_str.split('.')[0]
-            last_timestamp = datetime.fromisoformat(last_timestamp_str.replace('Z', ''))
-        else:
-            last_timestamp = last_timestamp_str
+            last_span = spans[-1]
+            if len(spans) < page_size:
+                break
+            params["after_timestamp"] = last_span['timestamp']
+            params["after_span_id"] = last_span['span_id']
+        
+        if start_time is not None:
+            yield 'end', {
+                'trace_id': trace_id,
+                'total_duration': self._replay_end(last_span, start_time),
+                'event_count': event_count
+            }
+    
+    @staticmethod
+    def _replay_timestamp(timestamp: Any) -> datetime:
+        """ClickHouse DateTime64 형식 처리 (나노초 제거)."""
+        if isinstance(timestamp, str):
+            if '.' in timestamp:
+                timestamp = timestamp.split('.')[0]
+            return datetime.fromisoformat(timestamp.replace('Z', ''))
+        return timestamp
+    
+    def _replay_event(self, span: Dict[str, Any], start_time: datetime) -> Dict[str, Any]:
+        """스팬 하나를 리플레이 이벤트로 변환."""
+        timestamp = self._replay_timestamp(span['timestamp'])
         
-        duration_ns = int(last_span.get('duration', 0) or 0)
-        total_duration = int((last_timestamp - start_time).total_seconds() * 1000) + int(duration_ns / 1000000)
+        # 이벤트 타입 추론
+        event_type = self._infer_event_type(span)
         
         return {
-            'trace_id': trace_id,
-            'events': events,
-            'timeline': [e['relative_time'] for e in events],
-            'total_duration': total_duration,
-            'start_time': int(start_time.timestamp() * 1000) if start_time else 0
+            'timestamp': timestamp.isoformat(),
+            'relative_time': int((timestamp - start_time).total_seconds() * 1000),
+            'type': event_type,
+            'span_id': span['span_id'],
+            'span_name': span['span_name'],
+            'data': self._extract_event_data(span, event_type)
         }
     
+    def _replay_end(self, last_span: Dict[str, Any], start_time: datetime) -> int:
+        """마지막 스팬의 종료 시간 (start_time 기준 ms). duration은 이미 밀리초."""
+        last_timestamp = self._replay_timestamp(last_span['timestamp'])
+        duration_ms = float(last_span.get('duration', 0) or 0)
+        return int((last_timestamp - start_time).total_seconds() * 1000) + int(duration_ms)
+    
     def _infer_event_type(self, span: Dict[str, Any]) -> str:
         """스팬에서 이벤트 타입 추론"""
         attrs = span.get('span_attributes', {})
@@ -667,9 +1123,27 @@ class MonitoringAdapter:
                 'duration': duration_ms
             }
     
-    async def get_trace_timeline(self, trace_id: str) -> Optional[Dict[str, Any]]:
+    async def get_trace_timeline(
+        self,
+        trace_id: str,
+        max_depth: Optional[int] = None,
+        root_span_id: Optional[str] = None,
+        window_start: Optional[int] = None,
+        window_end: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         트레이스 타임라인 생성 (계층 구조 포함).
+        
+        크리티컬 패스는 항상 전체 트리 기준으로 계산하고, 응답 트리만 잘라서 반환.
+        잘린 노드는 children이 비어 있고 child_count로 하위 스팬 수를 알 수 있음
+        (UI에서 root_span_id로 하위 트리를 따로 요청).
+        
+        Args:
+            trace_id: 트레이스 ID
+            max_depth: 반환할 트리 깊이 (root 기준, 0이면 root만)
+            root_span_id: 이 스팬의 하위 트리만 반환
+            window_start: 이 시각(ms) 이후에 끝나는 스팬만 반환
+            window_end: 이 시각(ms) 이전에 시작하는 스팬만 반환
         """
         trace_detail = await self.get_trace_detail(trace_id)
         if not trace_detail:
@@ -680,150 +1154,260 @@ class MonitoringAdapter:
             return None
         
         # 스팬을 트리 구조로 변환
-        span_nodes = self._build_span_tree(spans)
+        span_nodes, nodes_by_id = self._build_span_tree(spans)
         
         # 타임라인 정보 계산
-        timestamps = []
-        end_timestamps = []
-        
-        for span in spans:
-            timestamp_str = span['timestamp']
-            if isinstance(timestamp_str, str):
-                if '.' in timestamp_str:
-                    timestamp_str = timestamp_str.split('.')[0]
-                ts = datetime.fromisoformat(timestamp_str.replace('Z', ''))
-            else:
-                ts = timestamp_str
-            timestamps.append(ts)
-            
-            duration_ns = span.get('duration', 0)
-            end_timestamps.append(ts + timedelta(microseconds=duration_ns / 1000))
-        
-        start_time = min(timestamps) if timestamps else datetime.now()
-        end_time = max(end_timestamps) if end_timestamps else start_time
-        total_duration = int((end_time - start_time).total_seconds() * 1000)
+        start_time = min(node['start_time'] for node in nodes_by_id.values())
+        end_time = max(node['end_time'] for node in nodes_by_id.values())
         
         # 크리티컬 패스 계산 (가장 긴 경로)
         critical_path = self._calculate_critical_path(span_nodes)
         
+        if root_span_id is not None:
+            root = nodes_by_id.get(root_span_id)
+            if root is None:
+                return None
+            span_nodes = [root]
+        if max_depth is not None or window_start is not None or window_end is not None:
+            span_nodes = self._cut_span_tree(span_nodes, max_depth, window_start, window_end)
+        
         return {
             'trace_id': trace_id,
             'spans': span_nodes,
-            'total_duration': total_duration,
+            'total_duration': end_time - start_time,
             'critical_path': critical_path,
-            'start_time': int(start_time.timestamp() * 1000),
-            'end_time': int(end_time.timestamp() * 1000)
+            'start_time': start_time,
+            'end_time': end_time
         }
     
-    def _build_span_tree(self, spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """스팬을 계층 구조로 변환"""
-        span_map = {s['span_id']: s for s in spans}
-        roots = []
+    @staticmethod
+    def _span_start_ms(timestamp: Any) -> int:
+        """ClickHouse DateTime64 문자열(나노초 포함)을 epoch 밀리초로 변환."""
+        if isinstance(timestamp, str):
+            base, _, fraction = timestamp.replace('Z', '').partition('.')
+            parsed = datetime.fromisoformat(base)
+            return int(parsed.timestamp() * 1000) + int((fraction + '000')[:3])
+        return int(timestamp.timestamp() * 1000)
+    
+    def _build_span_tree(
+        self,
+        spans: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """스팬을 계층 구조로 변환 (span_id 인덱스로 O(n)).
+        
+        부모 스팬이 트레이스에 없는 스팬은 root로 취급.
+        
+        Returns:
+            (root 노드 리스트, span_id -> 노드)
+        """
+        nodes_by_id: Dict[str, Dict[str, Any]] = {}
+        ordered: List[Dict[str, Any]] = []
         
         for span in spans:
-            timestamp_str = span['timestamp']
-            if isinstance(timestamp_str, str):
-                if '.' in timestamp_str:
-                    timestamp_str = timestamp_str.split('.')[0]
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', ''))
-            else:
-                timestamp = timestamp_str
-            
-            duration_ns = int(span.get('duration', 0) or 0)
-            duration_ms = duration_ns / 1000000 if duration_ns else 0
+            start_ms = self._span_start_ms(span['timestamp'])
+            # get_trace_detail의 duration은 이미 밀리초
+            duration_ms = float(span.get('duration', 0) or 0)
             
             node = {
                 'span_id': span['span_id'],
                 'parent_span_id': span.get('parent_span_id'),
                 'span_name': span['span_name'],
-                'start_time': int(timestamp.timestamp() * 1000),
-                'end_time': int(timestamp.timestamp() * 1000) + int(duration_ms),
+                'start_time': start_ms,
+                'end_time': start_ms + int(duration_ms),
                 'duration': duration_ms,
                 'status': span.get('status_code', 'UNSET'),
                 'children': [],
+                'child_count': 0,
                 'attributes': span.get('span_attributes', {}),
                 'depth': 0,
                 'is_critical_path': False
             }
-            
-            if not span.get('parent_span_id'):
+            nodes_by_id[node['span_id']] = node
+            ordered.append(node)
+        
+        roots = []
+        for node in ordered:
+            parent = nodes_by_id.get(node['parent_span_id']) if node['parent_span_id'] else None
+            if parent is None or parent is node:
                 roots.append(node)
+            else:
+                parent['children'].append(node)
+                parent['child_count'] += 1
         
-        # 계층 구조 구축
-        def attach_children(node, depth=0):
-            node['depth'] = depth
-            for span in spans:
-                if span.get('parent_span_id') == node['span_id']:
-                    timestamp_str = span['timestamp']
-                    if isinstance(timestamp_str, str):
-                        if '.' in timestamp_str:
-                            timestamp_str = timestamp_str.split('.')[0]
-                        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', ''))
-                    else:
-                        timestamp = timestamp_str
-                    
-                    duration_ns = span.get('duration', 0)
-                    duration_ms = duration_ns / 1000000 if duration_ns else 0
-                    
-                    child = {
-                        'span_id': span['span_id'],
-                        'parent_span_id': span.get('parent_span_id'),
-                        'span_name': span['span_name'],
-                        'start_time': int(timestamp.timestamp() * 1000),
-                        'end_time': int(timestamp.timestamp() * 1000) + int(duration_ms),
-                        'duration': duration_ms,
-                        'status': span.get('status_code', 'UNSET'),
-                        'children': [],
-                        'attributes': span.get('span_attributes', {}),
-                        'depth': depth + 1,
-                        'is_critical_path': False
-                    }
-                    node['children'].append(child)
-                    attach_children(child, depth + 1)
-        
-        for root in roots:
-            attach_children(root)
-        
-        return roots
+        # 깊이 계산 (재귀 없이 BFS)
+        queue = list(roots)
+        for node in queue:
+            for child in node['children']:
+                child['depth'] = node['depth'] + 1
+                queue.append(child)
+        
+        return roots, nodes_by_id
     
     def _calculate_critical_path(self, span_nodes: List[Dict[str, Any]]) -> List[str]:
-        """크리티컬 패스 계산 (가장 긴 경로)"""
-        def find_longest_path(node):
-            if not node['children']:
-                return [node['span_id']], node['duration']
-            
-            longest_path = []
-            max_duration = 0
-            
-            for child in node['children']:
-                path, duration = find_longest_path(child)
-                if duration > max_duration:
-                    max_duration = duration
-                    longest_path = path
-            
-            return [node['span_id']] + longest_path, node['duration'] + max_duration
+        """크리티컬 패스 계산 (duration 합이 가장 긴 root-leaf 경로).
         
-        critical_path = []
-        max_duration = 0
+        후위 순회 한 번으로 노드별 최장 경로를 메모이제이션 (O(n)).
+        """
+        # 전위 순회 순서를 뒤집으면 자식이 항상 부모보다 먼저 처리됨
+        order: List[Dict[str, Any]] = []
+        stack = list(span_nodes)
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node['children'])
+        
+        # span_id -> (경로 duration 합, 다음 노드)
+        best: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        for node in reversed(order):
+            longest, next_node = 0, None
+            for child in node['children']:
+                duration = best[child['span_id']][0]
+                if duration > longest:
+                    longest, next_node = duration, child
+            best[node['span_id']] = (node['duration'] + longest, next_node)
         
+        head, max_duration = None, 0
         for root in span_nodes:
-            path, duration = find_longest_path(root)
+            duration = best[root['span_id']][0]
             if duration > max_duration:
-                max_duration = duration
-                critical_path = path
+                head, max_duration = root, duration
         
         # 크리티컬 패스 마킹
-        def mark_critical(node):
-            if node['span_id'] in critical_path:
-                node['is_critical_path'] = True
-            for child in node['children']:
-                mark_critical(child)
-        
-        for root in span_nodes:
-            mark_critical(root)
+        critical_path = []
+        while head is not None:
+            head['is_critical_path'] = True
+            critical_path.append(head['span_id'])
+            head = best[head['span_id']][1]
         
         return critical_path
     
+    @staticmethod
+    def _cut_span_tree(
+        span_nodes: List[Dict[str, Any]],
+        max_depth: Optional[int],
+        window_start: Optional[int],
+        window_end: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """응답용 트리 복사본 (깊이/시간 구간 밖의 하위 트리 제외).
+        
+        Args:
+            span_nodes: root 노드 리스트
+            max_depth: 첫 root 기준 최대 깊이
+            window_start: 구간 시작 (ms)
+            window_end: 구간 끝 (ms)
+        
+        Returns:
+            잘린 root 노드 리스트 (원본 노드는 수정하지 않음)
+        """
+        def in_window(node: Dict[str, Any]) -> bool:
+            if window_start is not None and node['end_time'] < window_start:
+                return False
+            if window_end is not None and node['start_time'] > window_end:
+                return False
+            return True
+        
+        base_depth = span_nodes[0]['depth'] if span_nodes else 0
+        result = []
+        # (원본 노드, 복사본을 붙일 부모 children 리스트)
+        stack = [(node, result) for node in reversed(span_nodes) if in_window(node)]
+        while stack:
+            node, siblings = stack.pop()
+            copy = dict(node)
+            copy['children'] = []
+            siblings.append(copy)
+            if max_depth is not None and node['depth'] - base_depth >= max_depth:
+                continue
+            for child in reversed(node['children']):
+                if in_window(child):
+                    stack.append((child, copy['children']))
+        return result
+    
+    @staticmethod
+    def _trend_time_format(interval: str, column: str) -> str:
+        """추이 차트 시간 간격별 그룹화 식."""
+        if interval == 'hour':
+            return f"formatDateTime({column}, '%Y-%m-%d %H:00:00')"
+        elif interval == 'week':
+            return f"formatDateTime({column}, '%Y-%W')"
+        else:  # day
+            return f"formatDateTime({column}, '%Y-%m-%d')"
+    
+    async def _use_usage_rollups(self) -> bool:
+        """otel_usage_rollup_* 테이블을 모두 사용할 수 있는지 여부."""
+        if not settings.MONITORING_USAGE_ROLLUPS_ENABLED:
+            return False
+        for table, _, _ in USAGE_ROLLUP_LEVELS:
+            if not await self._has_table(table):
+                return False
+        return True
+    
+    @staticmethod
+    def _usage_rollup_segments(
+        start_time: datetime,
+        end_time: datetime,
+        levels: Tuple[Tuple[str, timedelta, Dict[str, int]], ...]
+    ) -> List[Tuple[str, datetime, datetime]]:
+        """조회 기간을 rollup 단위 구간으로 분할.
+        
+        가운데 정렬된 구간은 큰 단위 테이블, 앞뒤 남는 구간은 더 작은 단위 테이블로 읽음.
+        가장 작은 단위(1분)는 양 끝을 분 경계로 넓혀서 읽음.
+        
+        Returns:
+            [(테이블, 구간 시작, 구간 끝(미포함))]
+        """
+        table, step, truncate = levels[0]
+        floor_start = start_time.replace(**truncate)
+        floor_end = end_time.replace(**truncate)
+        if len(levels) == 1:
+            ceil_end = floor_end if floor_end == end_time else floor_end + step
+            return [(table, floor_start, ceil_end)]
+        
+        ceil_start = floor_start if floor_start == start_time else floor_start + step
+        if ceil_start >= floor_end:
+            return MonitoringAdapter._usage_rollup_segments(start_time, end_time, levels[1:])
+        
+        segments = []
+        if start_time < ceil_start:
+            segments += MonitoringAdapter._usage_rollup_segments(start_time, ceil_start, levels[1:])
+        segments.append((table, ceil_start, floor_end))
+        if floor_end < end_time:
+            segments += MonitoringAdapter._usage_rollup_segments(floor_end, end_time, levels[1:])
+        return segments
+    
+    def _usage_rollup_source(
+        self,
+        project_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str,
+        columns: List[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """요청 기간에 맞는 가장 큰 단위 rollup 테이블들의 UNION ALL 서브쿼리.
+        
+        Args:
+            interval: 차트 시간 간격 (hour면 1시간, day/week면 1일 테이블까지 사용)
+            columns: 읽을 합계 컬럼
+        
+        Returns:
+            (FROM 절에 넣을 서브쿼리 (Bucket + columns), 서버 측 쿼리 파라미터)
+        """
+        # 차트 간격보다 큰 단위는 버킷이 간격 경계를 넘을 수 있으므로 사용하지 않음
+        levels = USAGE_ROLLUP_LEVELS[1:] if interval == 'hour' else USAGE_ROLLUP_LEVELS
+        params: Dict[str, Any] = {"project_id": project_id}
+        selects = []
+        segments = self._usage_rollup_segments(start_time, end_time, levels)
+        for i, (table, seg_start, seg_end) in enumerate(segments):
+            params[f"seg_start_{i}"] = seg_start.strftime('%Y-%m-%d %H:%M:%S')
+            params[f"seg_end_{i}"] = seg_end.strftime('%Y-%m-%d %H:%M:%S')
+            selects.append(f"""
+                SELECT Bucket, {', '.join(columns)}
+                FROM {CLICKHOUSE_DATABASE}.{table}
+                WHERE (ProjectId = {{project_id:String}} OR ProjectId = '')
+                  AND Bucket >= {{seg_start_{i}:DateTime}}
+                  AND Bucket < {{seg_end_{i}:DateTime}}
+            """)
+        return "(" + "UNION ALL".join(selects) + ")", params
+    
     async def get_cost_trend(
         self,
         project_id: str,
@@ -832,36 +1416,43 @@ class MonitoringAdapter:
         interval: str = 'day'
     ) -> List[Dict[str, Any]]:
         """비용 추이 데이터"""
-        # 시간 간격별 그룹화
-        if interval == 'hour':
-            time_format = "formatDateTime(Timestamp, '%Y-%m-%d %H:00:00')"
-        elif interval == 'week':
-            time_format = "formatDateTime(Timestamp, '%Y-%W')"
-        else:  # day
-            time_format = "formatDateTime(Timestamp, '%Y-%m-%d')"
-        
-        query = f"""
-        SELECT 
-            {time_format} as timestamp,
-            -- OpenRouter 응답에서 저장된 비용만 사용 (metadata.usage_object에 cost 필드)
-            sum(toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\\s*([0-9.eE+-]+)')[1])) as cost
-        FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
-          AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
-          AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
-          AND (
-            SpanName = 'gen_ai.session'
-            OR SpanName = 'gen_ai.content.completion'
-            OR SpanName = 'gen_ai.tool.call'
-            OR SpanName LIKE 'gen_ai.agent.%'
-            OR SpanName = 'litellm_request'
-            OR ServiceName LIKE 'agent-%'
-            OR SpanAttributes['llm.usage.total_tokens'] != ''
-          )
-        GROUP BY timestamp
-        ORDER BY timestamp ASC
-        """
-        results = await self._execute_query(query)
+        g = await self._genai()
+        params = None
+        if await self._use_usage_rollups():
+            source, params = self._usage_rollup_source(project_id, start_time, end_time, interval, ['Cost'])
+            query = f"""
+            SELECT
+                {self._trend_time_format(interval, 'Bucket')} as timestamp,
+                sum(Cost) as cost
+            FROM {source}
+            GROUP BY timestamp
+            ORDER BY timestamp ASC
+            """
+        else:
+            # 시간 간격별 그룹화
+            time_format = self._trend_time_format(interval, 'Timestamp')
+            query = f"""
+            SELECT 
+                {time_format} as timestamp,
+                -- OpenRouter 응답에서 저장된 비용만 사용 (metadata.usage_object에 cost 필드)
+                sum({g['cost']}) as cost
+            FROM {CLICKHOUSE_DATABASE}.otel_traces
+            WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
+              AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
+              AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
+              AND (
+                SpanName = 'gen_ai.session'
+                OR SpanName = 'gen_ai.content.completion'
+                OR SpanName = 'gen_ai.tool.call'
+                OR SpanName LIKE 'gen_ai.agent.%'
+                OR SpanName = 'litellm_request'
+                OR ServiceName LIKE 'agent-%'
+                OR SpanAttributes['llm.usage.total_tokens'] != ''
+              )
+            GROUP BY timestamp
+            ORDER BY timestamp ASC
+            """
+        results = await self._execute_query(query, params)
         
         return [
             {
@@ -879,27 +1470,38 @@ class MonitoringAdapter:
         interval: str = 'day'
     ) -> List[Dict[str, Any]]:
         """토큰 사용량 추이"""
-        if interval == 'hour':
-            time_format = "formatDateTime(Timestamp, '%Y-%m-%d %H:00:00')"
-        elif interval == 'week':
-            time_format = "formatDateTime(Timestamp, '%Y-%W')"
+        g = await self._genai()
+        params = None
+        if await self._use_usage_rollups():
+            source, params = self._usage_rollup_source(
+                project_id, start_time, end_time, interval, ['LlmTotalTokens', 'CacheReadTokens']
+            )
+            query = f"""
+            SELECT
+                {self._trend_time_format(interval, 'Bucket')} as timestamp,
+                sum(LlmTotalTokens) as prompt_tokens,
+                sum(LlmTotalTokens) as completion_tokens,
+                sum(CacheReadTokens) as cache_hits
+            FROM {source}
+            GROUP BY timestamp
+            ORDER BY timestamp ASC
+            """
         else:
-            time_format = "formatDateTime(Timestamp, '%Y-%m-%d')"
-        
-        query = f"""
-        SELECT 
-            {time_format} as timestamp,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as prompt_tokens,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as completion_tokens,
-            sum(toUInt64OrZero(SpanAttributes['gen_ai.usage.cache_read_input_tokens'])) as cache_hits
-        FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
-          AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
-          AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
-        GROUP BY timestamp
-        ORDER BY timestamp ASC
-        """
-        results = await self._execute_query(query)
+            time_format = self._trend_time_format(interval, 'Timestamp')
+            query = f"""
+            SELECT 
+                {time_format} as timestamp,
+                sum({g['llm_total_tokens']}) as prompt_tokens,
+                sum({g['llm_total_tokens']}) as completion_tokens,
+                sum(toUInt64OrZero(SpanAttributes['gen_ai.usage.cache_read_input_tokens'])) as cache_hits
+            FROM {CLICKHOUSE_DATABASE}.otel_traces
+            WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
+              AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
+              AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
+            GROUP BY timestamp
+            ORDER BY timestamp ASC
+            """
+        results = await self._execute_query(query, params)
         
         return [
             {
@@ -918,6 +1520,7 @@ class MonitoringAdapter:
         end_time: datetime
     ) -> List[Dict[str, Any]]:
         """성능 메트릭 (레이턴시 분포)"""
+        g = await self._genai()
         query = f"""
         SELECT 
             TraceId as trace_id,
@@ -925,7 +1528,7 @@ class MonitoringAdapter:
             sum(Duration) / 1000000 as duration,
             if(countIf(StatusCode = 'ERROR') > 0, 'error', 'success') as status
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+        WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
         GROUP BY TraceId
@@ -963,7 +1566,8 @@ class MonitoringAdapter:
         - Output Guardrail: 출력 검증 (유해 콘텐츠 필터링, 형식 검증)
         - 가드레일 차단 시 StatusCode = 'Error' 또는 특정 패턴으로 감지
         """
-        where_clause = f"ResourceAttributes['project_id'] = '{project_id}'"
+        g = await self._genai()
+        where_clause = f"{g['project_id']} = '{project_id}'"
         if trace_id:
             where_clause += f" AND TraceId = '{trace_id}'"
         if start_time and end_time:
@@ -988,14 +1592,14 @@ class MonitoringAdapter:
             END as stage,
             count(DISTINCT TraceId) as call_count,
             avg(Duration) / 1000000 as avg_latency_ms,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as total_prompt_tokens,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as total_completion_tokens,
+            sum({g['llm_total_tokens']}) as total_prompt_tokens,
+            sum({g['llm_total_tokens']}) as total_completion_tokens,
             sum(
                 greatest(
                     toFloat64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'cost\\': ([0-9.]+)')[1]),
                     toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], 'cost.: ([0-9.eE-]+)')[1]),
-                    (toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) * 0.000000072) +
-                    (toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) * 0.000000464)
+                    ({g['llm_total_tokens']} * 0.000000072) +
+                    ({g['llm_total_tokens']} * 0.000000464)
                 )
             ) as total_cost,
             countIf(StatusCode = 'Error') as error_count,
@@ -1107,6 +1711,7 @@ class MonitoringAdapter:
         - metadata.applied_guardrails: 적용된 가드레일 목록
         - 특정 에러 메시지 패턴
         """
+        g = await self._genai()
         query = f"""
         SELECT 
             -- 전체 요청 수
@@ -1127,13 +1732,13 @@ class MonitoringAdapter:
             countIf(SpanName = 'batch_write_to_db' AND StatusCode = 'Error') as output_guardrail_blocks,
             
             -- 비용 관련 (토큰 사용량)
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as total_prompt_tokens,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as total_completion_tokens,
+            sum({g['llm_total_tokens']}) as total_prompt_tokens,
+            sum({g['llm_total_tokens']}) as total_completion_tokens,
             
             -- 평균 응답 시간 (가드레일 포함)
             avg(Duration) / 1000000 as avg_latency_ms
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
+        WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
         """
@@ -1198,6 +1803,8 @@ class MonitoringAdapter:
         Agent 호출만 필터링 (langflow, flowise, autogen 등).
         LiteLLM 프록시 호출은 제외 (LLM 호출은 별도 집계).
         """
+        ga = await self._genai('a.')
+        gb = await self._genai('b.')
         # Agent 호출만 필터링 (LiteLLM 프록시 제외)
         # SpanAttributes['agent.id']가 있는 트레이스 또는 알려진 에이전트 서비스
         # Agent 호출만 필터링 (LiteLLM 프록시 제외)
@@ -1286,10 +1893,10 @@ class MonitoringAdapter:
             )) as agent_name,
             any(a.ServiceName) as service_name,
             count(DISTINCT a.TraceId) as event_count,
-            sum(toUInt64OrZero(b.SpanAttributes['llm.usage.total_tokens'])) as total_tokens,
+            sum({gb['llm_total_tokens']}) as total_tokens,
             -- Agent의 TraceId로 연결된 모든 LLM span의 비용 합산
             sum(
-                toFloat64OrZero(extractAll(b.SpanAttributes['metadata.usage_object'], '''cost'':\\s*([0-9.eE+-]+)')[1])
+                {gb['cost']}
             ) as total_cost,
             avg(a.Duration) / 1000000 as avg_latency_ms,
             countIf(a.StatusCode = 'ERROR') as error_count
@@ -1299,9 +1906,9 @@ class MonitoringAdapter:
             AND b.SpanName = 'litellm_request'
             AND b.SpanAttributes['metadata.usage_object'] LIKE '%cost%'
         WHERE (
-            a.ResourceAttributes['project_id'] = '{project_id}' 
-            OR a.ResourceAttributes['project_id'] = '' 
-            OR a.ResourceAttributes['project_id'] = 'default-project'
+            {ga['project_id']} = '{project_id}' 
+            OR {ga['project_id']} = '' 
+            OR {ga['project_id']} = 'default-project'
           )
           AND a.Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND a.Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
@@ -1347,19 +1954,20 @@ class MonitoringAdapter:
         agent_id (metadata.agent_id)로 필터링하여 해당 에이전트의
         상세 메트릭과 트레이스 목록을 반환.
         """
+        g = await self._genai()
         # 에이전트 메트릭 쿼리
         metrics_query = f"""
         SELECT 
             count(DISTINCT TraceId) as trace_count,
             count() as span_count,
             sum(toUInt64OrZero(SpanAttributes['gen_ai.usage.total_tokens'])) as total_tokens,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as llm_tokens,
+            sum({g['llm_total_tokens']}) as llm_tokens,
             sum(
                 greatest(
                     toFloat64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'cost\\': ([0-9.]+)')[1]),
                     toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], 'cost.: ([0-9.eE-]+)')[1]),
-                    (toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) * 0.000000072) +
-                    (toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) * 0.000000464)
+                    ({g['llm_total_tokens']} * 0.000000072) +
+                    ({g['llm_total_tokens']} * 0.000000464)
                 )
             ) as total_cost,
             avg(Duration) / 1000000 as avg_latency_ms,
@@ -1367,7 +1975,7 @@ class MonitoringAdapter:
             quantile(0.95)(Duration) / 1000000 as p95_latency,
             countIf(StatusCode = 'ERROR') as error_count
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE SpanAttributes['metadata.agent_id'] = '{agent_id}'
+        WHERE {g['agent_id']} = '{agent_id}'
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
         """
@@ -1384,7 +1992,7 @@ class MonitoringAdapter:
             Timestamp as timestamp,
             SpanAttributes['metadata.agent_name'] as agent_name
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE SpanAttributes['metadata.agent_id'] = '{agent_id}'
+        WHERE {g['agent_id']} = '{agent_id}'
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
         ORDER BY Timestamp DESC
@@ -1400,7 +2008,7 @@ class MonitoringAdapter:
             count() as call_count,
             countIf(StatusCode = 'ERROR') as error_count
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE SpanAttributes['metadata.agent_id'] = '{agent_id}'
+        WHERE {g['agent_id']} = '{agent_id}'
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
         GROUP BY hour
@@ -1461,26 +2069,27 @@ class MonitoringAdapter:
         metadata.agent_id가 있는 트레이스를 집계하고,
         에이전트 레지스트리의 정보와 결합.
         """
+        g = await self._genai()
         # ClickHouse에서 agent_id별 집계
         query = f"""
         SELECT 
-            SpanAttributes['metadata.agent_id'] as agent_id,
+            {g['agent_id']} as agent_id,
             SpanAttributes['metadata.agent_name'] as agent_name,
             count(DISTINCT TraceId) as event_count,
-            sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) as total_tokens,
+            sum({g['llm_total_tokens']}) as total_tokens,
             sum(
                 greatest(
                     toFloat64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\\'cost\\': ([0-9.]+)')[1]),
                     toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], 'cost.: ([0-9.eE-]+)')[1]),
-                    (toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) * 0.000000072) +
-                    (toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) * 0.000000464)
+                    ({g['llm_total_tokens']} * 0.000000072) +
+                    ({g['llm_total_tokens']} * 0.000000464)
                 )
             ) as total_cost,
             avg(Duration) / 1000000 as avg_latency_ms,
             countIf(StatusCode = 'ERROR') as error_count
         FROM {CLICKHOUSE_DATABASE}.otel_traces
-        WHERE (ResourceAttributes['project_id'] = '{project_id}' OR ResourceAttributes['project_id'] = '')
-          AND SpanAttributes['metadata.agent_id'] != ''
+        WHERE ({g['project_id']} = '{project_id}' OR {g['project_id']} = '')
+          AND {g['agent_id']} != ''
           AND Timestamp >= '{start_time.strftime('%Y-%m-%d %H:%M:%S')}'
           AND Timestamp <= '{end_time.strftime('%Y-%m-%d %H:%M:%S')}'
         GROUP BY agent_id, agent_name
@@ -1507,6 +2116,94 @@ class MonitoringAdapter:
             })
         
         return agent_stats
+    
+    async def get_dashboard(
+        self,
+        project_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = 'day'
+    ) -> Dict[str, Any]:
+        """
+        대시보드 데이터 일괄 조회.
+        metrics, cost_trend, token_usage, performance, guardrails, agent_usage를
+        동시에 조회하고 짧은 TTL로 캐시.
+        
+        기간은 MONITORING_DASHBOARD_BUCKET_SECONDS 단위로 맞춰(시작은 내림, 끝은 올림)
+        같은 대시보드를 보는 여러 탭/사용자가 같은 캐시 항목을 공유.
+        
+        Args:
+            interval: cost_trend/token_usage 시간 간격 (hour/day/week)
+        
+        Returns:
+            {metrics, cost_trend, token_usage, performance, guardrails, agent_usage,
+             start_time, end_time, errors}
+            (실패한 항목은 None, errors에 항목별 오류 메시지)
+        """
+        bucket = max(1, settings.MONITORING_DASHBOARD_BUCKET_SECONDS)
+        start_offset = start_time.timestamp() % bucket
+        end_offset = end_time.timestamp() % bucket
+        start_time = start_time - timedelta(seconds=start_offset)
+        if end_offset:
+            end_time = end_time + timedelta(seconds=bucket - end_offset)
+        
+        key = (
+            project_id,
+            start_time.strftime('%Y-%m-%d %H:%M:%S'),
+            end_time.strftime('%Y-%m-%d %H:%M:%S'),
+            interval
+        )
+        cached = self._dashboard_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        task = self._dashboard_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load_dashboard(project_id, start_time, end_time, interval))
+            self._dashboard_inflight[key] = task
+            task.add_done_callback(lambda _: self._dashboard_inflight.pop(key, None))
+        # 요청 하나가 끊겨도 같은 키를 기다리는 다른 요청은 계속 진행
+        result = await asyncio.shield(task)
+        
+        ttl = settings.MONITORING_DASHBOARD_CACHE_TTL
+        if ttl > 0 and not result["errors"]:
+            now = time.monotonic()
+            for expired in [k for k, (expires_at, _) in self._dashboard_cache.items() if expires_at <= now]:
+                del self._dashboard_cache[expired]
+            self._dashboard_cache[key] = (now + ttl, result)
+        return result
+    
+    async def _load_dashboard(
+        self,
+        project_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str
+    ) -> Dict[str, Any]:
+        """대시보드 항목을 asyncio.gather로 동시 조회."""
+        sections = {
+            "metrics": self.get_metrics(project_id, start_time, end_time),
+            "cost_trend": self.get_cost_trend(project_id, start_time, end_time, interval),
+            "token_usage": self.get_token_usage(project_id, start_time, end_time, interval),
+            "performance": self.get_performance_metrics(project_id, start_time, end_time),
+            "guardrails": self.get_guardrail_stats(project_id, start_time, end_time),
+            "agent_usage": self.get_agent_usage_stats(project_id, start_time, end_time),
+        }
+        results = await asyncio.gather(*sections.values(), return_exceptions=True)
+        
+        dashboard: Dict[str, Any] = {
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "errors": {}
+        }
+        for name, result in zip(sections, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Dashboard section {name} failed: {str(result)[:200]}")
+                dashboard[name] = None
+                dashboard["errors"][name] = str(result)
+            else:
+                dashboard[name] = result
+        return dashboard
 
 
 # Singleton
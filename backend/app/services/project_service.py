@@ -11,6 +11,8 @@ import json
 import os
 import aiomysql
 
+from app.services.db_pool import db_pool_manager
+
 # MariaDB 설정
 MARIADB_HOST = os.getenv('MARIADB_HOST', 'mariadb')
 MARIADB_PORT = int(os.getenv('MARIADB_PORT', '3306'))
@@ -22,15 +24,15 @@ MARIADB_DATABASE = os.getenv('MARIADB_DATABASE', 'agent_portal')
 class ProjectService:
     """프로젝트 관리 서비스."""
     
-    async def _get_connection(self):
-        """MariaDB 연결 획득."""
-        return await aiomysql.connect(
+    def _get_connection(self):
+        """공유 풀에서 MariaDB 연결 획득 (async with로 사용)."""
+        return db_pool_manager.acquire(
+            "project",
             host=MARIADB_HOST,
             port=MARIADB_PORT,
             user=MARIADB_USER,
             password=MARIADB_PASSWORD,
-            db=MARIADB_DATABASE,
-            autocommit=True
+            db=MARIADB_DATABASE
         )
     
     async def list_projects(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -39,8 +41,7 @@ class ProjectService:
         user_id가 제공되면 해당 사용자가 접근 가능한 프로젝트만 반환.
         """
         try:
-            conn = await self._get_connection()
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
+            async with self._get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
                 if user_id:
                     # 사용자가 속한 팀의 프로젝트만 조회
                     await cursor.execute("""
@@ -69,7 +70,6 @@ class ProjectService:
                         project['updated_at'] = project['updated_at'].isoformat()
                     projects.append(project)
                 
-                conn.close()
                 return projects
         except Exception as e:
             # 테이블이 없는 경우 기본 프로젝트 반환
@@ -86,14 +86,12 @@ class ProjectService:
     async def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         """프로젝트 상세 조회."""
         try:
-            conn = await self._get_connection()
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
+            async with self._get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute(
                     "SELECT * FROM projects WHERE id = %s",
                     (project_id,)
                 )
                 row = await cursor.fetchone()
-                conn.close()
                 
                 if row:
                     project = dict(row)
@@ -128,15 +126,13 @@ class ProjectService:
         settings: Optional[dict] = None
     ) -> Dict[str, Any]:
         """새 프로젝트 생성."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             settings_json = json.dumps(settings) if settings else None
             await cursor.execute("""
                 INSERT INTO projects (id, name, description, default_model, settings)
                 VALUES (%s, %s, %s, %s, %s)
             """, (project_id, name, description, default_model, settings_json))
             
-        conn.close()
         return await self.get_project(project_id)
     
     async def update_project(
@@ -153,8 +149,7 @@ class ProjectService:
         if not existing:
             return None
         
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             updates = []
             values = []
             
@@ -178,7 +173,6 @@ class ProjectService:
                     tuple(values)
                 )
         
-        conn.close()
         return await self.get_project(project_id)
     
     async def delete_project(self, project_id: str) -> bool:
@@ -187,13 +181,11 @@ class ProjectService:
         if not existing:
             return False
         
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute(
                 "DELETE FROM projects WHERE id = %s",
                 (project_id,)
             )
-        conn.close()
         return True
 
 
@@ -201,8 +193,7 @@ class ProjectService:
     async def list_teams(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """팀 목록 조회."""
         try:
-            conn = await self._get_connection()
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
+            async with self._get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
                 if user_id:
                     await cursor.execute("""
                         SELECT DISTINCT t.* 
@@ -224,7 +215,6 @@ class ProjectService:
                         team['updated_at'] = team['updated_at'].isoformat()
                     teams.append(team)
                 
-                conn.close()
                 return teams
         except Exception:
             return []
@@ -232,11 +222,9 @@ class ProjectService:
     async def get_team(self, team_id: str) -> Optional[Dict[str, Any]]:
         """팀 상세 조회."""
         try:
-            conn = await self._get_connection()
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
+            async with self._get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute("SELECT * FROM teams WHERE id = %s", (team_id,))
                 row = await cursor.fetchone()
-                conn.close()
                 
                 if row:
                     team = dict(row)
@@ -256,13 +244,11 @@ class ProjectService:
         description: Optional[str] = None
     ) -> Dict[str, Any]:
         """새 팀 생성."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("""
                 INSERT INTO teams (id, name, description)
                 VALUES (%s, %s, %s)
             """, (team_id, name, description))
-        conn.close()
         return await self.get_team(team_id)
     
     async def update_team(
@@ -276,8 +262,7 @@ class ProjectService:
         if not existing:
             return None
         
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             updates = []
             values = []
             
@@ -294,7 +279,6 @@ class ProjectService:
                     f"UPDATE teams SET {', '.join(updates)} WHERE id = %s",
                     tuple(values)
                 )
-        conn.close()
         return await self.get_team(team_id)
     
     async def delete_team(self, team_id: str) -> bool:
@@ -303,23 +287,19 @@ class ProjectService:
         if not existing:
             return False
         
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("DELETE FROM teams WHERE id = %s", (team_id,))
-        conn.close()
         return True
     
     # Team Members
     async def list_team_members(self, team_id: str) -> List[Dict[str, Any]]:
         """팀 멤버 목록 조회."""
         try:
-            conn = await self._get_connection()
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
+            async with self._get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute("""
                     SELECT * FROM team_members WHERE team_id = %s
                 """, (team_id,))
                 rows = await cursor.fetchall()
-                conn.close()
                 
                 members = []
                 for row in rows:
@@ -340,14 +320,12 @@ class ProjectService:
         role: str = "member"
     ) -> Dict[str, Any]:
         """팀에 멤버 추가."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("""
                 INSERT INTO team_members (team_id, user_id, role)
                 VALUES (%s, %s, %s)
                 ON DUPLICATE KEY UPDATE role = VALUES(role)
             """, (team_id, user_id, role))
-        conn.close()
         return {"team_id": team_id, "user_id": user_id, "role": role}
     
     async def update_team_member_role(
@@ -357,34 +335,28 @@ class ProjectService:
         role: str
     ) -> Optional[Dict[str, Any]]:
         """팀 멤버 역할 변경."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("""
                 UPDATE team_members SET role = %s WHERE team_id = %s AND user_id = %s
             """, (role, team_id, user_id))
             if cursor.rowcount == 0:
-                conn.close()
                 return None
-        conn.close()
         return {"team_id": team_id, "user_id": user_id, "role": role}
     
     async def remove_team_member(self, team_id: str, user_id: str) -> bool:
         """팀에서 멤버 제거."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("""
                 DELETE FROM team_members WHERE team_id = %s AND user_id = %s
             """, (team_id, user_id))
             success = cursor.rowcount > 0
-        conn.close()
         return success
     
     # Team Projects
     async def list_team_projects(self, team_id: str) -> List[Dict[str, Any]]:
         """팀에 할당된 프로젝트 목록 조회."""
         try:
-            conn = await self._get_connection()
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
+            async with self._get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute("""
                     SELECT p.* FROM projects p
                     JOIN team_projects tp ON p.id = tp.project_id
@@ -392,7 +364,6 @@ class ProjectService:
                     ORDER BY p.created_at DESC
                 """, (team_id,))
                 rows = await cursor.fetchall()
-                conn.close()
                 
                 projects = []
                 for row in rows:
@@ -410,25 +381,21 @@ class ProjectService:
     
     async def add_team_project(self, team_id: str, project_id: str) -> Dict[str, Any]:
         """팀에 프로젝트 할당."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("""
                 INSERT INTO team_projects (team_id, project_id)
                 VALUES (%s, %s)
                 ON DUPLICATE KEY UPDATE team_id = VALUES(team_id)
             """, (team_id, project_id))
-        conn.close()
         return {"team_id": team_id, "project_id": project_id}
     
     async def remove_team_project(self, team_id: str, project_id: str) -> bool:
         """팀에서 프로젝트 제거."""
-        conn = await self._get_connection()
-        async with conn.cursor() as cursor:
+        async with self._get_connection() as conn, conn.cursor() as cursor:
             await cursor.execute("""
                 DELETE FROM team_projects WHERE team_id = %s AND project_id = %s
             """, (team_id, project_id))
             success = cursor.rowcount > 0
-        conn.close()
         return success
 
 
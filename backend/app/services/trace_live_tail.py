@@ -0,0 +1,198 @@
+"""
+Trace Live Tail
+
+Per-project span poller for /api/monitoring/traces/live.
+
+- 프로젝트마다 폴러 하나가 MONITORING_LIVE_TAIL_INTERVAL마다 otel_traces를 조회
+  (시청자 수와 관계없이 간격당 ClickHouse 쿼리 1회)
+- high-water mark(지금까지 받은 가장 큰 Timestamp) 이후 스팬만 읽고, 늦게 들어오는 스팬을 위해
+  lookback 구간을 겹쳐 읽은 뒤 SpanId로 중복 제거 (lookback 구간 동안 받은 SpanId를 모두 보관)
+- 겹쳐 읽는 구간이 batch_size보다 많으면 (Timestamp, SpanId) keyset으로 다음 조회에서 이어서 읽음
+- 새 스팬 배치를 구독자별 bounded queue에 fan-out (느린 구독자는 오래된 배치부터 버림)
+- 첫 구독자가 들어오면 폴러 시작, 마지막 구독자가 나가면 종료
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.mcp.metrics import record_counter, record_histogram
+from app.services.monitoring_adapter import monitoring_adapter
+
+logger = logging.getLogger(__name__)
+
+
+class _ProjectPoller:
+    """한 프로젝트의 폴링 상태."""
+    
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.task: Optional[asyncio.Task] = None
+        self.high_water: Optional[str] = None
+        self.primed = False
+        # lookback 구간 안에서 받은 SpanId -> Timestamp (겹쳐 읽는 스팬 중복 제거, 오래된 것부터 정리)
+        self.seen: Dict[str, str] = {}
+        # 직전 조회가 LIMIT에 걸렸으면 마지막 스팬의 (Timestamp, SpanId)부터 이어서 조회
+        self.cursor: Optional[Tuple[str, str]] = None
+
+
+class TraceLiveTail:
+    """Fans out newly ingested spans to live-tail subscribers."""
+    
+    def __init__(
+        self,
+        interval: float = 2.0,
+        lookback_seconds: int = 30,
+        batch_size: int = 1000,
+        queue_size: int = 50
+    ):
+        """Initialize live tail.
+        
+        Args:
+            interval: Poll interval in seconds
+            lookback_seconds: Re-read this many seconds before the high-water mark
+            batch_size: Maximum spans per poll
+            queue_size: Maximum pending batches per subscriber
+        """
+        self.interval = interval
+        self.lookback_seconds = lookback_seconds
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        
+        self._pollers: Dict[str, _ProjectPoller] = {}
+    
+    def configure_from_settings(self) -> None:
+        """Apply MONITORING_LIVE_TAIL_* settings."""
+        from app.config import get_settings
+        settings = get_settings()
+        self.interval = settings.MONITORING_LIVE_TAIL_INTERVAL
+        self.lookback_seconds = settings.MONITORING_LIVE_TAIL_LOOKBACK
+        self.batch_size = settings.MONITORING_LIVE_TAIL_BATCH_SIZE
+        self.queue_size = settings.MONITORING_LIVE_TAIL_QUEUE_SIZE
+    
+    def start(self) -> None:
+        """Apply settings (폴러는 구독 시 시작)."""
+        self.configure_from_settings()
+    
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(poller.subscribers) for poller in self._pollers.values())
+    
+    @asynccontextmanager
+    async def subscribe(self, project_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Subscribe to new spans of a project.
+        
+        Args:
+            project_id: 프로젝트 ID
+        
+        Yields:
+            Queue of span batches (List[Dict]) in Timestamp order
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        poller = self._pollers.get(project_id)
+        if poller is None:
+            poller = self._pollers[project_id] = _ProjectPoller(project_id)
+        poller.subscribers.add(queue)
+        if poller.task is None or poller.task.done():
+            poller.task = asyncio.create_task(self._run(poller))
+            logger.info(f"Live tail poller started (project={project_id})")
+        try:
+            yield queue
+        finally:
+            poller.subscribers.discard(queue)
+            if not poller.subscribers:
+                await self._stop_poller(poller)
+    
+    async def _run(self, poller: _ProjectPoller) -> None:
+        """Poll until the last subscriber leaves."""
+        while poller.subscribers:
+            try:
+                spans = await self._poll(poller)
+                if spans:
+                    self._publish(poller, spans)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Live tail poll failed (project={poller.project_id}): {str(e)[:200]}")
+                record_counter("monitoring_live_tail_poll_errors_total")
+            await asyncio.sleep(self.interval)
+    
+    async def _poll(self, poller: _ProjectPoller) -> List[Dict[str, Any]]:
+        """high-water mark 이후 새 스팬 조회.
+        
+        첫 조회는 기준점만 잡고 아무것도 반환하지 않음 (기존 스팬은 /traces로 조회).
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        rows = await monitoring_adapter.get_live_spans(
+            poller.project_id,
+            since=poller.high_water,
+            lookback_seconds=self.lookback_seconds,
+            limit=self.batch_size,
+            after=poller.cursor
+        )
+        record_histogram("monitoring_live_tail_poll_ms", (loop.time() - start_time) * 1000)
+        
+        new_spans = [row for row in rows if row['span_id'] not in poller.seen]
+        for row in new_spans:
+            poller.seen[row['span_id']] = row['timestamp']
+        # 구간을 다 읽지 못했으면 다음 조회는 이어서, 다 읽었으면 다시 lookback 구간 처음부터
+        poller.cursor = (rows[-1]['timestamp'], rows[-1]['span_id']) if len(rows) >= self.batch_size else None
+        if rows:
+            # rows는 Timestamp 오름차순 (ClickHouse 문자열 형식이 고정 길이라 문자열 비교로 충분)
+            poller.high_water = max(poller.high_water or '', rows[-1]['timestamp'])
+            self._prune_seen(poller)
+        
+        if not poller.primed:
+            # 기존 스팬은 구간을 끝까지 읽을 때까지 기준점으로만 사용
+            # (스팬이 없었으면 high_water 없이 다음 조회도 현재 시각 기준)
+            poller.primed = poller.cursor is None
+            return []
+        return new_spans
+    
+    def _prune_seen(self, poller: _ProjectPoller) -> None:
+        """다음 조회의 lookback 구간보다 오래된 SpanId 정리."""
+        try:
+            window_start = datetime.strptime(poller.high_water[:19], "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return
+        # 초 단위 문자열 prefix와 비교 (같은 초의 스팬은 남겨 둠)
+        cutoff = (window_start - timedelta(seconds=self.lookback_seconds)).strftime("%Y-%m-%d %H:%M:%S")
+        poller.seen = {
+            span_id: timestamp
+            for span_id, timestamp in poller.seen.items()
+            if timestamp >= cutoff
+        }
+    
+    def _publish(self, poller: _ProjectPoller, spans: List[Dict[str, Any]]) -> None:
+        """새 스팬 배치를 모든 구독자 큐에 넣음."""
+        for queue in list(poller.subscribers):
+            if queue.full():
+                # 느린 구독자: 가장 오래된 배치를 버리고 최신 배치 유지
+                queue.get_nowait()
+                record_counter("monitoring_live_tail_dropped_total")
+            queue.put_nowait(spans)
+        record_counter("monitoring_live_tail_spans_total", value=len(spans))
+    
+    async def _stop_poller(self, poller: _ProjectPoller) -> None:
+        if self._pollers.get(poller.project_id) is poller:
+            del self._pollers[poller.project_id]
+        if poller.task is not None and not poller.task.done():
+            poller.task.cancel()
+            try:
+                await poller.task
+            except asyncio.CancelledError:
+                pass
+        logger.info(f"Live tail poller stopped (project={poller.project_id})")
+    
+    async def stop(self) -> None:
+        """Stop every poller (구독자 스트림은 연결 종료 시 정리됨)."""
+        for poller in list(self._pollers.values()):
+            await self._stop_poller(poller)
+
+
+# Singleton instance
+trace_live_tail = TraceLiveTail()
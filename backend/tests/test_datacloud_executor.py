@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.datacloud_executor import DataCloudExecutors, DriverExecutorFull
+
+
+class TestDataCloudExecutors:
+    """Test cases for DataCloudExecutors.run cancellation."""
+    
+    def test_timeout_of_running_call_invokes_cancel_and_keeps_slot(self):
+        """A running call that times out calls the driver cancel hook and holds its slot until the thread ends."""
+        executors = DataCloudExecutors(max_workers=1, max_queue=1)
+        started = threading.Event()
+        release = threading.Event()
+        cancel_calls = []
+        
+        def blocking_call():
+            started.set()
+            release.wait(5)
+            return "done"
+        
+        def cancel():
+            cancel_calls.append(started.is_set())
+        
+        async def scenario():
+            with pytest.raises(asyncio.TimeoutError):
+                await executors.run("oracle", blocking_call, timeout=0.2, cancel=cancel)
+            
+            # 워커 스레드가 아직 실행 중 - 슬롯 유지, 추가 호출은 거부
+            assert cancel_calls == [True]
+            assert executors.stats()["oracle"]["pending"] == 1
+            with pytest.raises(DriverExecutorFull):
+                await executors.run("oracle", lambda: None)
+            
+            release.set()
+            for _ in range(50):
+                if executors.stats()["oracle"]["pending"] == 0:
+                    break
+                await asyncio.sleep(0.02)
+            assert executors.stats()["oracle"]["pending"] == 0
+        
+        try:
+            asyncio.run(scenario())
+        finally:
+            release.set()
+            executors.shutdown()
+    
+    def test_timeout_of_queued_call_skips_cancel(self):
+        """A call still waiting for a worker is cancelled without calling the driver cancel hook."""
+        executors = DataCloudExecutors(max_workers=1, max_queue=2)
+        release = threading.Event()
+        cancel_calls = []
+        
+        async def scenario():
+            running = asyncio.ensure_future(executors.run("hana", lambda: release.wait(5)))
+            await asyncio.sleep(0.05)
+            with pytest.raises(asyncio.TimeoutError):
+                await executors.run("hana", lambda: None, timeout=0.1, cancel=lambda: cancel_calls.append(1))
+            assert cancel_calls == []
+            
+            release.set()
+            assert await running is True
+            await asyncio.sleep(0.05)
+            assert executors.stats()["hana"]["pending"] == 0
+        
+        try:
+            asyncio.run(scenario())
+        finally:
+            release.set()
+            executors.shutdown()
+    
+    def test_returns_result(self):
+        """A call that finishes in time returns its result and frees its slot."""
+        executors = DataCloudExecutors(max_workers=2, max_queue=2)
+        
+        async def scenario():
+            assert await executors.run("databricks", lambda: 42, timeout=1) == 42
+            await asyncio.sleep(0.01)
+            assert executors.stats()["databricks"]["pending"] == 0
+        
+        try:
+            asyncio.run(scenario())
+        finally:
+            executors.shutdown()
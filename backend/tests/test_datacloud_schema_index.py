@@ -0,0 +1,47 @@
+import asyncio
+
+import numpy as np
+
+from app.services.datacloud_schema_index import SchemaIndexRegistry
+
+
+TABLES = [
+    {"name": "orders", "columns": [{"name": "id", "type": "int"}, {"name": "customer_id", "type": "int"}]},
+    {"name": "customers", "columns": [{"name": "id", "type": "int"}, {"name": "name", "type": "varchar"}]},
+]
+
+
+def _make_registry(monkeypatch):
+    registry = SchemaIndexRegistry(embedding_model="test-embedding")
+    
+    async def embed(texts):
+        return [np.ones(4, dtype=np.float32) / 2 for _ in texts]
+    
+    monkeypatch.setattr(registry, "_embed", embed)
+    return registry
+
+
+class TestSchemaIndexRegistry:
+    """Test cases for SchemaIndexRegistry invalidate/drop."""
+    
+    def test_invalidate_keeps_embeddings_for_rebuild(self, monkeypatch):
+        registry = _make_registry(monkeypatch)
+        asyncio.run(registry.build("conn-1", TABLES, []))
+        
+        registry.invalidate("conn-1")
+        assert registry.get("conn-1") is None
+        assert len(registry._retired_embeddings["conn-1"]) == 2
+    
+    def test_drop_releases_everything(self, monkeypatch):
+        registry = _make_registry(monkeypatch)
+        asyncio.run(registry.build("conn-1", TABLES, []))
+        asyncio.run(registry.build("conn-2", TABLES, []))
+        registry.invalidate("conn-1")
+        
+        # 무효화된 연결과 인덱스가 있는 연결 모두 메모리에서 제거
+        registry.drop("conn-1")
+        registry.drop("conn-2")
+        for connection_id in ("conn-1", "conn-2"):
+            assert registry.get(connection_id) is None
+            assert connection_id not in registry._retired_embeddings
+            assert connection_id not in registry._locks
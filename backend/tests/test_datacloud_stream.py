@@ -0,0 +1,109 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from app.services import datacloud_service as datacloud_module
+from app.services.datacloud_service import DataCloudService
+
+
+class _Attribute:
+    def __init__(self, name):
+        self.name = name
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self._rows = list(rows)
+    
+    async def fetch(self, n, timeout=None):
+        batch, self._rows = self._rows[:n], self._rows[n:]
+        return batch
+
+
+class _FakeStatement:
+    def __init__(self, rows):
+        self._rows = rows
+    
+    def get_attributes(self):
+        return [_Attribute("id")]
+    
+    async def cursor(self, timeout=None):
+        return _FakeCursor(self._rows)
+
+
+class _FakePgConnection:
+    """asyncpg 연결 흉내 - 트랜잭션 시작/종료를 events에 기록."""
+    
+    def __init__(self, rows, events):
+        self._rows = rows
+        self.events = events
+    
+    @asynccontextmanager
+    async def transaction(self):
+        self.events.append("begin")
+        try:
+            yield
+        except BaseException:
+            self.events.append("rollback")
+            raise
+        self.events.append("commit")
+    
+    async def prepare(self, query, timeout=None):
+        return _FakeStatement(self._rows)
+
+
+def _make_service(monkeypatch, row_count):
+    events = []
+    conn = _FakePgConnection([(i,) for i in range(row_count)], events)
+    
+    @asynccontextmanager
+    async def acquire(conn_info, decrypt_password):
+        events.append("acquire")
+        try:
+            yield conn
+        finally:
+            events.append("release")
+    
+    async def log_query(*args):
+        events.append("log")
+    
+    service = DataCloudService()
+    monkeypatch.setattr(datacloud_module.datacloud_pool_registry, "acquire", acquire)
+    monkeypatch.setattr(service, "_log_query", log_query)
+    return service, events
+
+
+CONN_INFO = {"id": "conn-1", "db_type": "postgresql"}
+
+
+class TestStreamQuery:
+    """Test cases for DataCloudService.stream_query."""
+    
+    def test_client_disconnect_closes_transaction_before_release(self, monkeypatch):
+        """Closing the stream mid-way rolls back the cursor transaction before the connection goes back to the pool."""
+        service, events = _make_service(monkeypatch, row_count=5000)
+        
+        async def scenario():
+            stream = service.stream_query(CONN_INFO, "SELECT id FROM t", "user", max_rows=5000)
+            assert (await stream.__anext__())["type"] == "columns"
+            assert (await stream.__anext__())["type"] == "rows"
+            await stream.aclose()
+        
+        asyncio.run(scenario())
+        assert events == ["acquire", "begin", "rollback", "release", "log"]
+    
+    def test_truncated_only_when_more_rows_exist(self, monkeypatch):
+        """truncated is set only if a row exists beyond max_rows."""
+        async def collect(service, max_rows):
+            return [line async for line in service.stream_query(CONN_INFO, "SELECT id FROM t", "user", max_rows)]
+        
+        service, _ = _make_service(monkeypatch, row_count=5)
+        lines = asyncio.run(collect(service, max_rows=5))
+        assert lines[-1]["type"] == "end"
+        assert lines[-1]["rows"] == 5
+        assert lines[-1]["truncated"] is False
+        
+        service, _ = _make_service(monkeypatch, row_count=5)
+        lines = asyncio.run(collect(service, max_rows=3))
+        assert sum(len(line["rows"]) for line in lines if line["type"] == "rows") == 3
+        assert lines[-1]["rows"] == 3
+        assert lines[-1]["truncated"] is True
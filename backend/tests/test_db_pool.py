@@ -0,0 +1,77 @@
+import asyncio
+
+import aiomysql
+import pytest
+
+from app.services.db_pool import DBPoolManager
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = False
+    
+    def close(self):
+        self.closed = True
+
+
+class _FakePool:
+    def __init__(self):
+        self.released = []
+    
+    async def acquire(self):
+        return _FakeConnection()
+    
+    def release(self, conn):
+        self.released.append(conn)
+
+
+def _make_manager(monkeypatch):
+    manager = DBPoolManager(pre_ping=False)
+    pool = _FakePool()
+    
+    async def get_pool(*args):
+        return pool
+    
+    monkeypatch.setattr(manager, "get_pool", get_pool)
+    return manager, pool
+
+
+async def _use_connection(manager, error):
+    async with manager.acquire("test", "localhost", 3306, "user", "password", "db") as conn:
+        if error is not None:
+            raise error
+    return conn
+
+
+class TestDBPoolAcquire:
+    """Test cases for DBPoolManager.acquire connection reuse."""
+    
+    @pytest.mark.parametrize("error", [
+        asyncio.CancelledError(),
+        asyncio.TimeoutError(),
+        aiomysql.OperationalError(2013, "Lost connection to MySQL server during query"),
+        aiomysql.InterfaceError(0, ""),
+    ])
+    def test_cancelled_or_broken_connection_is_closed(self, monkeypatch, error):
+        manager, pool = _make_manager(monkeypatch)
+        with pytest.raises(type(error)):
+            asyncio.run(_use_connection(manager, error))
+        
+        assert len(pool.released) == 1
+        assert pool.released[0].closed
+    
+    @pytest.mark.parametrize("error", [
+        None,
+        aiomysql.IntegrityError(1062, "Duplicate entry"),
+        aiomysql.ProgrammingError(1064, "You have an error in your SQL syntax"),
+    ])
+    def test_query_errors_keep_connection(self, monkeypatch, error):
+        manager, pool = _make_manager(monkeypatch)
+        if error is None:
+            asyncio.run(_use_connection(manager, error))
+        else:
+            with pytest.raises(type(error)):
+                asyncio.run(_use_connection(manager, error))
+        
+        assert len(pool.released) == 1
+        assert not pool.released[0].closed
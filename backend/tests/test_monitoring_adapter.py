@@ -0,0 +1,153 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.monitoring_adapter import (
+    USAGE_ROLLUP_LEVELS,
+    MonitoringAdapter,
+    decode_trace_cursor,
+    encode_trace_cursor,
+)
+
+
+def _span(span_id, parent=None, duration=10, offset_ms=0):
+    start = datetime(2026, 10, 17, 12, 0, 0) + timedelta(milliseconds=offset_ms)
+    return {
+        'span_id': span_id,
+        'parent_span_id': parent,
+        'span_name': f"span-{span_id}",
+        'timestamp': start.strftime('%Y-%m-%d %H:%M:%S.%f') + '000',
+        'duration': duration,
+    }
+
+
+def _recursive_critical_path(span_nodes):
+    """user-017 이전 재귀 구현 (비교 기준)."""
+    def find_longest_path(node):
+        if not node['children']:
+            return [node['span_id']], node['duration']
+        longest_path = []
+        max_duration = 0
+        for child in node['children']:
+            path, duration = find_longest_path(child)
+            if duration > max_duration:
+                max_duration = duration
+                longest_path = path
+        return [node['span_id']] + longest_path, node['duration'] + max_duration
+    
+    critical_path = []
+    max_duration = 0
+    for root in span_nodes:
+        path, duration = find_longest_path(root)
+        if duration > max_duration:
+            max_duration = duration
+            critical_path = path
+    return critical_path
+
+
+TREE_SPANS = [
+    _span('root', duration=100),
+    _span('a', 'root', duration=30, offset_ms=5),
+    _span('a1', 'a', duration=25, offset_ms=6),
+    _span('b', 'root', duration=40, offset_ms=40),
+    _span('b1', 'b', duration=5, offset_ms=41),
+    _span('b2', 'b', duration=12, offset_ms=50),
+    _span('b2x', 'b2', duration=8, offset_ms=51),
+]
+
+
+class TestSpanTree:
+    """Test cases for the span tree helpers."""
+    
+    def test_orphan_parents_become_roots(self):
+        """Spans whose parent is not in the trace are treated as roots."""
+        adapter = MonitoringAdapter()
+        spans = [_span('root'), _span('child', 'root'), _span('orphan', 'missing'), _span('self', 'self')]
+        roots, nodes_by_id = adapter._build_span_tree(spans)
+        
+        assert [root['span_id'] for root in roots] == ['root', 'orphan', 'self']
+        assert nodes_by_id['child']['depth'] == 1
+        assert roots[0]['child_count'] == 1
+    
+    def test_critical_path_matches_recursive_result(self):
+        """The iterative critical path equals the previous recursive implementation."""
+        adapter = MonitoringAdapter()
+        expected = _recursive_critical_path(adapter._build_span_tree(TREE_SPANS)[0])
+        
+        roots, nodes_by_id = adapter._build_span_tree(TREE_SPANS)
+        path = adapter._calculate_critical_path(roots)
+        
+        assert path == expected == ['root', 'b', 'b2', 'b2x']
+        assert {span_id for span_id, node in nodes_by_id.items() if node['is_critical_path']} == set(path)
+    
+    def test_cut_keeps_child_count_and_original_tree(self):
+        """Depth/window cuts drop subtrees but keep child_count and leave the source nodes untouched."""
+        adapter = MonitoringAdapter()
+        roots, nodes_by_id = adapter._build_span_tree(TREE_SPANS)
+        
+        cut = adapter._cut_span_tree(roots, max_depth=1, window_start=None, window_end=None)
+        assert [child['span_id'] for child in cut[0]['children']] == ['a', 'b']
+        assert all(child['children'] == [] for child in cut[0]['children'])
+        assert [child['child_count'] for child in cut[0]['children']] == [1, 2]
+        
+        start_ms = nodes_by_id['root']['start_time']
+        cut = adapter._cut_span_tree(roots, max_depth=None, window_start=start_ms + 40, window_end=start_ms + 45)
+        assert [child['span_id'] for child in cut[0]['children']] == ['b']
+        assert [child['span_id'] for child in cut[0]['children'][0]['children']] == ['b1']
+        assert cut[0]['children'][0]['child_count'] == 2
+        
+        assert len(nodes_by_id['b']['children']) == 2
+        assert len(nodes_by_id['root']['children']) == 2
+
+
+class TestTraceCursor:
+    """Test cases for trace list cursors."""
+    
+    def test_round_trip(self):
+        cursor = encode_trace_cursor('2026-10-17 12:00:00.123456789', 'abc123')
+        assert decode_trace_cursor(cursor) == ('2026-10-17 12:00:00.123456789', 'abc123')
+    
+    @pytest.mark.parametrize("payload", [
+        {"t": "2026-10-17 12:00:00", "id": "x' OR 1=1 --"},
+        {"t": "2026-10-17'; DROP TABLE otel_traces", "id": "abc"},
+        {"id": "abc"},
+    ])
+    def test_tampered_cursor_raises(self, payload):
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        with pytest.raises(ValueError):
+            decode_trace_cursor(cursor)
+    
+    def test_garbage_cursor_raises(self):
+        with pytest.raises(ValueError):
+            decode_trace_cursor("not-a-cursor!")
+
+
+class TestUsageRollupSegments:
+    """Test cases for MonitoringAdapter._usage_rollup_segments."""
+    
+    def test_ragged_window_is_covered_without_gaps_or_overlaps(self):
+        start = datetime(2026, 9, 1, 3, 17)
+        end = datetime(2026, 10, 1, 1, 2)
+        segments = MonitoringAdapter._usage_rollup_segments(start, end, USAGE_ROLLUP_LEVELS)
+        
+        assert segments[0][1] == start
+        assert segments[-1][2] == end
+        for (_, _, previous_end), (_, next_start, _) in zip(segments, segments[1:]):
+            assert previous_end == next_start
+        
+        tables = [table for table, _, _ in segments]
+        assert tables == [
+            'otel_usage_rollup_1m',
+            'otel_usage_rollup_1h',
+            'otel_usage_rollup_1d',
+            'otel_usage_rollup_1h',
+            'otel_usage_rollup_1m',
+        ]
+        steps = {table: step for table, step, _ in USAGE_ROLLUP_LEVELS}
+        for table, seg_start, seg_end in segments:
+            # 각 구간은 해당 테이블 버킷 경계에 정렬
+            assert seg_start < seg_end
+            assert (seg_end - seg_start) % steps[table] == timedelta(0)
+        assert segments[2][1:] == (datetime(2026, 9, 2), datetime(2026, 10, 1))
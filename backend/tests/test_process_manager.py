@@ -0,0 +1,86 @@
+import asyncio
+import json
+import time
+
+from app.mcp.process_manager import MessageBuffer, ProcessManager
+
+
+class _FakeProcess:
+    """stdout만 가진 stdio 서버 프로세스 흉내."""
+    
+    def __init__(self, lines):
+        self.returncode = None
+        self.stdout = asyncio.StreamReader()
+        for line in lines:
+            self.stdout.feed_data((json.dumps(line) + "\n").encode())
+        self.stdout.feed_eof()
+
+
+def _response(request_id):
+    return {"jsonrpc": "2.0", "id": request_id, "result": {"content": []}}
+
+
+class TestMessageBuffer:
+    """Test cases for MessageBuffer bounds."""
+    
+    def test_message_count_bound_drops_oldest(self):
+        buffer = MessageBuffer("server", max_messages=3)
+        for i in range(5):
+            buffer.append(f"line-{i}", i)
+        
+        assert buffer.lines() == ["line-2", "line-3", "line-4"]
+        assert buffer.consume(0) is None
+    
+    def test_byte_bound_drops_oldest(self):
+        buffer = MessageBuffer("server", max_bytes=10)
+        buffer.append("aaaa", 1)
+        buffer.append("bbbb", 2)
+        buffer.append("cccc", 3)
+        
+        assert buffer.lines() == ["bbbb", "cccc"]
+        assert buffer.size_bytes == 8
+    
+    def test_age_bound_expires_old_messages(self):
+        buffer = MessageBuffer("server", max_age=60)
+        buffer.append("old", 1)
+        buffer.append("new", 2)
+        
+        assert buffer.expire(time.monotonic() + 30) == 0
+        buffer._messages[0] = (time.monotonic() - 120, 1, "old")
+        assert buffer.expire() == 1
+        assert buffer.lines() == ["new"]
+        assert buffer.size_bytes == len("new")
+    
+    def test_abandoned_request_ids_are_bounded(self):
+        manager = ProcessManager()
+        manager.max_abandoned_requests = 2
+        
+        async def scenario():
+            for request_id in range(4):
+                manager.register_request("server", request_id)
+                manager.discard_request("server", request_id)
+        
+        asyncio.run(scenario())
+        assert list(manager._abandoned_requests["server"]) == [2, 3]
+
+
+class TestLateResponses:
+    """Test cases for responses that arrive after a request was abandoned."""
+    
+    def test_late_response_for_discarded_id_is_dropped(self):
+        manager = ProcessManager()
+        
+        async def scenario():
+            abandoned = manager.register_request("server", 1)
+            manager.discard_request("server", 1)
+            assert not abandoned.done()
+            next_waiter = manager.register_request("server", 2)
+            
+            await manager._read_logs("server", _FakeProcess([_response(1), _response(2)]))
+            return next_waiter
+        
+        next_waiter = asyncio.run(scenario())
+        assert next_waiter.result()["id"] == 2
+        assert manager.get_stdout_buffer("server") == []
+        assert manager.consume_stdout_message("server", 1) is None
+        assert not manager._abandoned_requests["server"]
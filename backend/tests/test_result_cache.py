@@ -0,0 +1,39 @@
+import asyncio
+
+from mcp.types import TextContent
+
+from app.mcp.result_cache import ToolResultCache
+
+
+TOOL = "get_corporation_info"
+ARGS = {"corp_code": "00164742"}
+
+
+class TestToolResultCache:
+    """Test cases for ToolResultCache copies and the disk tier."""
+    
+    def test_mutating_results_does_not_change_cache(self):
+        cache = ToolResultCache(tool_ttls={TOOL: 60})
+        
+        async def scenario():
+            result = {"content": [{"type": "text", "text": "현대자동차"}]}
+            await cache.set("dart", TOOL, ARGS, result)
+            result["content"].append({"type": "text", "text": "changed after set"})
+            
+            first = await cache.get("dart", TOOL, ARGS)
+            first["content"][0]["text"] = "changed after get"
+            return await cache.get("dart", TOOL, ARGS)
+        
+        assert asyncio.run(scenario()) == {"content": [{"type": "text", "text": "현대자동차"}]}
+    
+    def test_disk_tier_serializes_sdk_content(self, tmp_path):
+        writer = ToolResultCache(tool_ttls={TOOL: 60}, disk_path=str(tmp_path))
+        reader = ToolResultCache(tool_ttls={TOOL: 60}, disk_path=str(tmp_path))
+        
+        async def scenario():
+            await writer.set("dart", TOOL, ARGS, [TextContent(type="text", text="현대자동차")])
+            return await reader.get("dart", TOOL, ARGS)
+        
+        result = asyncio.run(scenario())
+        assert result[0]["type"] == "text"
+        assert result[0]["text"] == "현대자동차"
@@ -0,0 +1,90 @@
+-- Migration script to promote hot GenAI span attributes to typed columns on otel_traces
+--
+-- MonitoringAdapter가 자주 읽는 SpanAttributes / ResourceAttributes 값을 MATERIALIZED 컬럼으로 저장합니다.
+-- 조회 시 Map 전체를 풀지 않고 좁은 컬럼만 읽습니다.
+-- 각 식은 adapter의 기존 쿼리 식과 같습니다 (app/services/monitoring_adapter.py GENAI_COLUMNS).
+
+-- ResourceAttributes['project_id'] (default DDL의 ProjectId 컬럼과 구분)
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS ResourceProjectId String
+    MATERIALIZED ResourceAttributes['project_id'] CODEC(ZSTD(1));
+
+-- 토큰 수
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS PromptTokens UInt64
+    MATERIALIZED greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.prompt_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.prompt_tokens']),
+        toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\'prompt_tokens\': ([0-9]+)')[1])
+    ) CODEC(ZSTD(1));
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS CompletionTokens UInt64
+    MATERIALIZED greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.completion_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.completion_tokens']),
+        toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\'completion_tokens\': ([0-9]+)')[1])
+    ) CODEC(ZSTD(1));
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS LlmTotalTokens UInt64
+    MATERIALIZED toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) CODEC(ZSTD(1));
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS TotalTokens UInt64
+    MATERIALIZED greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.total_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])
+    ) CODEC(ZSTD(1));
+
+-- OpenRouter 응답 비용 (metadata.usage_object의 cost 필드)
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS Cost Float64
+    MATERIALIZED toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\s*([0-9.eE+-]+)')[1]) CODEC(ZSTD(1));
+
+-- 포털 등록 에이전트 ID
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS AgentId String
+    MATERIALIZED SpanAttributes['metadata.agent_id'] CODEC(ZSTD(1));
+
+-- 요청 모델
+ALTER TABLE IF EXISTS otel_traces
+    ADD COLUMN IF NOT EXISTS Model LowCardinality(String)
+    MATERIALIZED multiIf(
+        SpanAttributes['gen_ai.request.model'] != '', SpanAttributes['gen_ai.request.model'],
+        SpanAttributes['gen_ai.response.model'] != '', SpanAttributes['gen_ai.response.model'],
+        SpanAttributes['llm.request.model']
+    ) CODEC(ZSTD(1));
+
+-- Skip indexes
+ALTER TABLE IF EXISTS otel_traces
+    ADD INDEX IF NOT EXISTS idx_resource_project_id ResourceProjectId TYPE bloom_filter(0.01) GRANULARITY 1;
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD INDEX IF NOT EXISTS idx_agent_id AgentId TYPE bloom_filter(0.01) GRANULARITY 1;
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD INDEX IF NOT EXISTS idx_model Model TYPE set(100) GRANULARITY 1;
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD INDEX IF NOT EXISTS idx_llm_total_tokens LlmTotalTokens TYPE minmax GRANULARITY 1;
+
+ALTER TABLE IF EXISTS otel_traces
+    ADD INDEX IF NOT EXISTS idx_cost Cost TYPE minmax GRANULARITY 1;
+
+-- 기존 part에 컬럼/인덱스 기록 (mutation, 백그라운드 실행)
+-- 실행 전에도 기존 part는 조회 시 식으로 계산되므로 결과는 같습니다.
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN ResourceProjectId;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN PromptTokens;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN CompletionTokens;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN LlmTotalTokens;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN TotalTokens;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN Cost;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN AgentId;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE COLUMN Model;
+
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE INDEX idx_resource_project_id;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE INDEX idx_agent_id;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE INDEX idx_model;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE INDEX idx_llm_total_tokens;
+ALTER TABLE IF EXISTS otel_traces MATERIALIZE INDEX idx_cost;
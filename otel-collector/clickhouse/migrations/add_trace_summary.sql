@@ -0,0 +1,135 @@
+-- Migration script to add a per-trace summary table for the monitoring traces list
+--
+-- otel_traces에 span이 들어올 때 materialized view가 LLM/Agent span만 trace 단위로 집계합니다.
+-- MonitoringAdapter.get_traces는 raw otel_traces 대신 이 테이블을 읽습니다.
+--
+-- 집계 기준은 MonitoringAdapter.get_traces의 기존 llm_filter / trace_type 조건과 같습니다.
+-- 같은 trace의 span이 여러 insert 블록이나 날짜로 나뉘면 행이 여러 개일 수 있으므로
+-- 조회 시 항상 GROUP BY TraceId로 다시 합칩니다.
+
+CREATE TABLE IF NOT EXISTS otel_trace_summary (
+    ProjectId String CODEC(ZSTD(1)),
+    Day Date CODEC(Delta, ZSTD(1)),
+    TraceId String CODEC(ZSTD(1)),
+    ServiceName SimpleAggregateFunction(any, String),
+    SpanName SimpleAggregateFunction(any, String),
+    LlmSpanName AggregateFunction(argMax, String, UInt8),
+    AgentSpanName AggregateFunction(argMax, String, UInt8),
+    SpanNames SimpleAggregateFunction(groupUniqArrayArray, Array(String)),
+    Start SimpleAggregateFunction(min, DateTime64(9)),
+    End SimpleAggregateFunction(max, DateTime64(9)),
+    DurationNs SimpleAggregateFunction(sum, UInt64),
+    SpanCount SimpleAggregateFunction(sum, UInt64),
+    ErrorCount SimpleAggregateFunction(sum, UInt64),
+    PromptTokens SimpleAggregateFunction(sum, UInt64),
+    CompletionTokens SimpleAggregateFunction(sum, UInt64),
+    TotalCost SimpleAggregateFunction(sum, Float64),
+    IsLlm SimpleAggregateFunction(max, UInt8),
+    IsAgent SimpleAggregateFunction(max, UInt8),
+    INDEX idx_trace_id TraceId TYPE bloom_filter(0.001) GRANULARITY 1
+) ENGINE = AggregatingMergeTree()
+PARTITION BY toYYYYMM(Day)
+ORDER BY (ProjectId, Day, TraceId)
+TTL Day + toIntervalDay(180)
+SETTINGS index_granularity=8192, ttl_only_drop_parts = 1;
+
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS otel_trace_summary_mv
+TO otel_trace_summary
+AS SELECT
+    ResourceAttributes['project_id'] AS ProjectId,
+    toDate(Timestamp) AS Day,
+    TraceId,
+    any(ServiceName) AS ServiceName,
+    any(SpanName) AS SpanName,
+    argMaxState(
+        toString(SpanName),
+        toUInt8(multiIf(
+            SpanName = 'gen_ai.content.completion', 3,
+            SpanName LIKE 'dart.llm_call.%', 2,
+            SpanName = 'litellm_request', 1,
+            0
+        ))
+    ) AS LlmSpanName,
+    argMaxState(
+        toString(SpanName),
+        toUInt8(multiIf(
+            SpanName = 'gen_ai.session', 6,
+            SpanName LIKE 'gen_ai.agent.%', 5,
+            SpanName = 'gen_ai.tool.call', 4,
+            SpanName LIKE 'legislation.%', 3,
+            SpanName LIKE 'dart.tool_call.%', 2,
+            SpanName LIKE '%agent%' OR SpanName LIKE '%text2sql%' OR ServiceName LIKE 'agent-%', 1,
+            0
+        ))
+    ) AS AgentSpanName,
+    groupUniqArray(toString(SpanName)) AS SpanNames,
+    min(Timestamp) AS Start,
+    max(Timestamp) AS End,
+    sum(Duration) AS DurationNs,
+    count() AS SpanCount,
+    countIf(StatusCode = 'ERROR') AS ErrorCount,
+    sum(greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.prompt_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.prompt_tokens']),
+        toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\'prompt_tokens\': ([0-9]+)')[1])
+    )) AS PromptTokens,
+    sum(greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.completion_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.completion_tokens']),
+        toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\'completion_tokens\': ([0-9]+)')[1])
+    )) AS CompletionTokens,
+    sum(toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\s*([0-9.eE+-]+)')[1])) AS TotalCost,
+    max(toUInt8(
+        SpanName = 'gen_ai.content.completion'
+        OR SpanName LIKE 'dart.llm_call.%'
+        OR SpanName = 'litellm_request'
+    )) AS IsLlm,
+    max(toUInt8(
+        SpanName = 'gen_ai.session'
+        OR SpanName LIKE 'gen_ai.agent.%'
+        OR SpanName = 'gen_ai.tool.call'
+        OR SpanName LIKE 'dart.tool_call.%'
+        OR SpanName LIKE 'legislation.%'
+        OR SpanAttributes['gen_ai.agent.id'] != ''
+        OR SpanAttributes['gen_ai.agent.name'] != ''
+        OR SpanName LIKE '%agent%'
+        OR SpanName LIKE '%text2sql%'
+        OR ServiceName LIKE 'agent-%'
+    )) AS IsAgent
+FROM otel_traces
+WHERE TraceId != ''
+  AND (
+    SpanName = 'gen_ai.content.completion'
+    OR SpanName = 'gen_ai.tool.call'
+    OR SpanName = 'gen_ai.session'
+    OR SpanName LIKE 'gen_ai.agent.%'
+    OR SpanAttributes['gen_ai.agent.id'] != ''
+    OR SpanAttributes['gen_ai.agent.name'] != ''
+    OR toUInt64OrZero(SpanAttributes['gen_ai.usage.total_tokens']) > 0
+    OR toUInt64OrZero(SpanAttributes['llm.usage.total_tokens']) > 0
+    OR SpanName LIKE 'dart.%'
+    OR SpanName LIKE 'legislation.%'
+    OR SpanName = 'litellm_request'
+    OR SpanName = 'raw_gen_ai_request'
+    OR SpanName LIKE '%langflow%'
+    OR SpanName LIKE '%flowise%'
+    OR SpanName LIKE '%autogen%'
+    OR ServiceName LIKE '%langflow%'
+    OR ServiceName LIKE '%flowise%'
+    OR ServiceName LIKE '%autogen%'
+    OR ServiceName LIKE 'agent-%'
+  )
+GROUP BY ProjectId, Day, TraceId;
+
+
+-- 기존 span 백필 (기존 설치에서 한 번만 수동 실행)
+-- materialized view 생성 이후 들어온 span은 이미 집계되므로 MV 생성 시각 이전 span만 넣어야 합니다.
+-- 아래 SELECT 본문은 otel_trace_summary_mv와 같고 WHERE 절에 시간 조건만 추가합니다.
+--
+--   INSERT INTO otel_trace_summary
+--   SELECT ... (otel_trace_summary_mv의 SELECT 목록)
+--   FROM otel_traces
+--   WHERE TraceId != '' AND (... 위와 같은 조건 ...)
+--     AND Timestamp < '<MV 생성 시각>'
+--   GROUP BY ProjectId, Day, TraceId
@@ -0,0 +1,162 @@
+-- Migration script to add per-minute, per-hour and per-day usage rollups
+--
+-- otel_traces에 span이 들어올 때 1분 단위로 비용/토큰을 합산하고,
+-- 1분 테이블에 들어온 행을 다시 1시간, 1일 단위로 합산합니다 (cascading materialized view).
+-- MonitoringAdapter.get_cost_trend / get_token_usage는 요청 기간에 맞는 가장 큰 단위를 읽습니다.
+--
+-- Cost는 get_cost_trend의 기존 span 조건을 만족하는 span만 합산합니다.
+-- LlmTotalTokens/CacheReadTokens는 get_token_usage와 같이 모든 span을 합산합니다.
+-- SummingMergeTree는 백그라운드 merge 시점에 합치므로 조회 시 항상 sum()으로 다시 합칩니다.
+
+CREATE TABLE IF NOT EXISTS otel_usage_rollup_1m (
+    ProjectId String CODEC(ZSTD(1)),
+    Bucket DateTime CODEC(Delta, ZSTD(1)),
+    ServiceName LowCardinality(String) CODEC(ZSTD(1)),
+    Model LowCardinality(String) CODEC(ZSTD(1)),
+    AgentId String CODEC(ZSTD(1)),
+    SpanCount UInt64,
+    ErrorCount UInt64,
+    Cost Float64,
+    PromptTokens UInt64,
+    CompletionTokens UInt64,
+    LlmTotalTokens UInt64,
+    CacheReadTokens UInt64
+) ENGINE = SummingMergeTree()
+PARTITION BY toDate(Bucket)
+ORDER BY (ProjectId, Bucket, ServiceName, Model, AgentId)
+TTL toDate(Bucket) + toIntervalDay(180)
+SETTINGS index_granularity=8192, ttl_only_drop_parts = 1;
+
+
+CREATE TABLE IF NOT EXISTS otel_usage_rollup_1h (
+    ProjectId String CODEC(ZSTD(1)),
+    Bucket DateTime CODEC(Delta, ZSTD(1)),
+    ServiceName LowCardinality(String) CODEC(ZSTD(1)),
+    Model LowCardinality(String) CODEC(ZSTD(1)),
+    AgentId String CODEC(ZSTD(1)),
+    SpanCount UInt64,
+    ErrorCount UInt64,
+    Cost Float64,
+    PromptTokens UInt64,
+    CompletionTokens UInt64,
+    LlmTotalTokens UInt64,
+    CacheReadTokens UInt64
+) ENGINE = SummingMergeTree()
+PARTITION BY toYYYYMM(Bucket)
+ORDER BY (ProjectId, Bucket, ServiceName, Model, AgentId)
+TTL toDate(Bucket) + toIntervalDay(180)
+SETTINGS index_granularity=8192, ttl_only_drop_parts = 1;
+
+
+CREATE TABLE IF NOT EXISTS otel_usage_rollup_1d (
+    ProjectId String CODEC(ZSTD(1)),
+    Bucket DateTime CODEC(Delta, ZSTD(1)),
+    ServiceName LowCardinality(String) CODEC(ZSTD(1)),
+    Model LowCardinality(String) CODEC(ZSTD(1)),
+    AgentId String CODEC(ZSTD(1)),
+    SpanCount UInt64,
+    ErrorCount UInt64,
+    Cost Float64,
+    PromptTokens UInt64,
+    CompletionTokens UInt64,
+    LlmTotalTokens UInt64,
+    CacheReadTokens UInt64
+) ENGINE = SummingMergeTree()
+PARTITION BY toYYYYMM(Bucket)
+ORDER BY (ProjectId, Bucket, ServiceName, Model, AgentId)
+TTL toDate(Bucket) + toIntervalDay(180)
+SETTINGS index_granularity=8192, ttl_only_drop_parts = 1;
+
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS otel_usage_rollup_1m_mv
+TO otel_usage_rollup_1m
+AS SELECT
+    ResourceAttributes['project_id'] AS ProjectId,
+    toStartOfMinute(Timestamp) AS Bucket,
+    ServiceName,
+    multiIf(
+        SpanAttributes['gen_ai.request.model'] != '', SpanAttributes['gen_ai.request.model'],
+        SpanAttributes['gen_ai.response.model'] != '', SpanAttributes['gen_ai.response.model'],
+        SpanAttributes['llm.request.model'] != '', SpanAttributes['llm.request.model'],
+        ''
+    ) AS Model,
+    multiIf(
+        SpanAttributes['gen_ai.agent.id'] != '', SpanAttributes['gen_ai.agent.id'],
+        SpanAttributes['metadata.agent_id'] != '', SpanAttributes['metadata.agent_id'],
+        ''
+    ) AS AgentId,
+    count() AS SpanCount,
+    countIf(StatusCode = 'ERROR') AS ErrorCount,
+    sumIf(
+        toFloat64OrZero(extractAll(SpanAttributes['metadata.usage_object'], '''cost'':\s*([0-9.eE+-]+)')[1]),
+        SpanName = 'gen_ai.session'
+        OR SpanName = 'gen_ai.content.completion'
+        OR SpanName = 'gen_ai.tool.call'
+        OR SpanName LIKE 'gen_ai.agent.%'
+        OR SpanName = 'litellm_request'
+        OR ServiceName LIKE 'agent-%'
+        OR SpanAttributes['llm.usage.total_tokens'] != ''
+    ) AS Cost,
+    sum(greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.prompt_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.prompt_tokens']),
+        toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\'prompt_tokens\': ([0-9]+)')[1])
+    )) AS PromptTokens,
+    sum(greatest(
+        toUInt64OrZero(SpanAttributes['gen_ai.usage.completion_tokens']),
+        toUInt64OrZero(SpanAttributes['llm.usage.completion_tokens']),
+        toUInt64OrZero(extractAll(SpanAttributes['llm.openrouter.usage'], '\'completion_tokens\': ([0-9]+)')[1])
+    )) AS CompletionTokens,
+    sum(toUInt64OrZero(SpanAttributes['llm.usage.total_tokens'])) AS LlmTotalTokens,
+    sum(toUInt64OrZero(SpanAttributes['gen_ai.usage.cache_read_input_tokens'])) AS CacheReadTokens
+FROM otel_traces
+GROUP BY ProjectId, Bucket, ServiceName, Model, AgentId;
+
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS otel_usage_rollup_1h_mv
+TO otel_usage_rollup_1h
+AS SELECT
+    ProjectId,
+    toStartOfHour(Bucket) AS Bucket,
+    ServiceName,
+    Model,
+    AgentId,
+    sum(SpanCount) AS SpanCount,
+    sum(ErrorCount) AS ErrorCount,
+    sum(Cost) AS Cost,
+    sum(PromptTokens) AS PromptTokens,
+    sum(CompletionTokens) AS CompletionTokens,
+    sum(LlmTotalTokens) AS LlmTotalTokens,
+    sum(CacheReadTokens) AS CacheReadTokens
+FROM otel_usage_rollup_1m
+GROUP BY ProjectId, Bucket, ServiceName, Model, AgentId;
+
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS otel_usage_rollup_1d_mv
+TO otel_usage_rollup_1d
+AS SELECT
+    ProjectId,
+    toStartOfDay(Bucket) AS Bucket,
+    ServiceName,
+    Model,
+    AgentId,
+    sum(SpanCount) AS SpanCount,
+    sum(ErrorCount) AS ErrorCount,
+    sum(Cost) AS Cost,
+    sum(PromptTokens) AS PromptTokens,
+    sum(CompletionTokens) AS CompletionTokens,
+    sum(LlmTotalTokens) AS LlmTotalTokens,
+    sum(CacheReadTokens) AS CacheReadTokens
+FROM otel_usage_rollup_1h
+GROUP BY ProjectId, Bucket, ServiceName, Model, AgentId;
+
+
+-- 기존 span 백필 (기존 설치에서 한 번만 수동 실행)
+-- 1분 테이블에 넣으면 1시간/1일 테이블은 materialized view가 채웁니다.
+-- MV 생성 이후 들어온 span은 이미 집계되므로 MV 생성 시각 이전 span만 넣어야 합니다.
+--
+--   INSERT INTO otel_usage_rollup_1m
+--   SELECT ... (otel_usage_rollup_1m_mv의 SELECT 목록)
+--   FROM otel_traces
+--   WHERE Timestamp < '<MV 생성 시각>'
+--   GROUP BY ProjectId, Bucket, ServiceName, Model, AgentId
@@ -0,0 +1,10 @@
+-- Migration script to add per-table fingerprints to the Data Cloud schema cache
+-- Run this if the table already exists
+
+-- 테이블 구조 해시 (NULL이면 다음 스키마 갱신 때 해당 테이블을 다시 기록)
+ALTER TABLE db_table_cache
+ADD COLUMN IF NOT EXISTS fingerprint CHAR(64) COMMENT '테이블 구조 SHA-256' AFTER data_size_bytes;
+
+-- 스키마 캐시 갱신 시 (connection_id, schema_name, table_name) 단위 삭제
+ALTER TABLE db_schema_cache
+ADD INDEX IF NOT EXISTS idx_connection_schema_table (connection_id, schema_name, table_name);
@@ -48,6 +48,7 @@ CREATE TABLE IF NOT EXISTS db_schema_cache (
     cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (connection_id) REFERENCES db_connections(id) ON DELETE CASCADE,
     INDEX idx_connection_table (connection_id, table_name),
+    INDEX idx_connection_schema_table (connection_id, schema_name, table_name),
     INDEX idx_schema_table (schema_name, table_name)
 );
 
@@ -61,6 +62,7 @@ CREATE TABLE IF NOT EXISTS db_table_cache (
     table_comment TEXT,
     row_count BIGINT,  -- 추정 행 수
     data_size_bytes BIGINT,  -- 추정 데이터 크기
+    fingerprint CHAR(64),  -- 테이블 구조 SHA-256 (바뀐 테이블만 컬럼 캐시 재기록)
     cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (connection_id) REFERENCES db_connections(id) ON DELETE CASCADE,
     UNIQUE KEY uk_connection_schema_table (connection_id, schema_name, table_name),
@@ -8,6 +8,8 @@ import type {
 	TraceDetail,
 	Metrics,
 	SessionReplay,
+	ReplayEvent,
+	LiveSpan,
 	TraceTimeline,
 	CostDataPoint,
 	TokenDataPoint,
@@ -37,7 +39,16 @@ export async function getTraces(params: {
 	size?: number;
 	search?: string;
 	trace_type?: 'agent' | 'llm' | 'all';
-}): Promise<{ traces: Trace[]; total: number; page: number; size: number }> {
+	cursor?: string;
+	count_mode?: 'exact' | 'approx' | 'none';
+}): Promise<{
+	traces: Trace[];
+	total: number | null;
+	page: number;
+	size: number;
+	has_more: boolean;
+	next_cursor: string | null;
+}> {
 	const queryParams = new URLSearchParams({
 		project_id: params.project_id,
 		start_time: params.start_time,
@@ -54,6 +65,14 @@ export async function getTraces(params: {
 		queryParams.append('trace_type', params.trace_type);
 	}
 
+	if (params.cursor) {
+		queryParams.append('cursor', params.cursor);
+	}
+
+	if (params.count_mode) {
+		queryParams.append('count_mode', params.count_mode);
+	}
+
 	const response = await fetch(`${API_BASE_URL}/traces?${queryParams}`);
 	if (!response.ok) {
 		throw new Error(`Failed to fetch traces: ${response.statusText}`);
@@ -99,8 +118,54 @@ export async function getSessionReplay(trace_id: string): Promise<SessionReplay>
 	return response.json();
 }
 
-export async function getTraceTimeline(trace_id: string): Promise<TraceTimeline> {
-	const response = await fetch(`${API_BASE_URL}/timeline/${trace_id}`);
+/**
+ * Stream session replay events (SSE) as spans are read page by page.
+ * Returns a function that closes the stream.
+ */
+export function streamSessionReplay(
+	trace_id: string,
+	handlers: {
+		onStart?: (data: { trace_id: string; start_time: number }) => void;
+		onEvent: (event: ReplayEvent) => void;
+		onEnd?: (data: { trace_id: string; total_duration: number; event_count: number }) => void;
+		onError?: (message: string) => void;
+	}
+): () => void {
+	const source = new EventSource(`${API_BASE_URL}/replay/${trace_id}/stream`);
+
+	source.addEventListener('start', (e) => handlers.onStart?.(JSON.parse((e as MessageEvent).data)));
+	source.addEventListener('event', (e) => handlers.onEvent(JSON.parse((e as MessageEvent).data)));
+	source.addEventListener('end', (e) => {
+		handlers.onEnd?.(JSON.parse((e as MessageEvent).data));
+		source.close();
+	});
+	source.addEventListener('error', (e) => {
+		const data = (e as MessageEvent).data;
+		handlers.onError?.(data ? JSON.parse(data).message : 'Session replay stream failed');
+		source.close();
+	});
+
+	return () => source.close();
+}
+
+export async function getTraceTimeline(
+	trace_id: string,
+	params: {
+		max_depth?: number;
+		span_id?: string;
+		window_start?: number;
+		window_end?: number;
+	} = {}
+): Promise<TraceTimeline> {
+	const queryParams = new URLSearchParams();
+	for (const [key, value] of Object.entries(params)) {
+		if (value !== undefined && value !== null) {
+			queryParams.append(key, String(value));
+		}
+	}
+
+	const query = queryParams.toString();
+	const response = await fetch(`${API_BASE_URL}/timeline/${trace_id}${query ? `?${query}` : ''}`);
 	if (!response.ok) {
 		throw new Error(`Failed to fetch trace timeline: ${response.statusText}`);
 	}
@@ -235,6 +300,25 @@ export async function createShareLink(trace_id: string, expires_in_days: number
 	return response.json();
 }
 
+/**
+ * Live tail of newly ingested spans (SSE). One server-side poller per project
+ * is shared by every viewer. Returns a function that closes the stream.
+ */
+export function subscribeToLiveSpans(
+	project_id: string,
+	onSpans: (spans: LiveSpan[]) => void,
+	onError?: (error: Event) => void
+): () => void {
+	const source = new EventSource(
+		`${API_BASE_URL}/traces/live?${new URLSearchParams({ project_id })}`
+	);
+
+	source.addEventListener('spans', (e) => onSpans(JSON.parse((e as MessageEvent).data).spans));
+	source.onerror = (e) => onError?.(e);
+
+	return () => source.close();
+}
+
 // ============================================================================
 // WebSocket Client
 // ============================================================================
@@ -410,3 +494,39 @@ export async function getGuardrailStats(params: {
 	}
 	return response.json();
 }
+
+// ============================================================================
+// Dashboard API (all overview sections in one request)
+// ============================================================================
+
+export interface DashboardData {
+	metrics: Metrics | null;
+	cost_trend: CostDataPoint[] | null;
+	token_usage: TokenDataPoint[] | null;
+	performance: PerformanceDataPoint[] | null;
+	guardrails: GuardrailStats | null;
+	agent_usage: AgentUsageStats[] | null;
+	start_time: string;
+	end_time: string;
+	errors: Record<string, string>;
+}
+
+export async function getDashboard(params: {
+	project_id: string;
+	start_time: string;
+	end_time: string;
+	interval?: 'hour' | 'day' | 'week';
+}): Promise<DashboardData> {
+	const queryParams = new URLSearchParams({
+		project_id: params.project_id,
+		start_time: params.start_time,
+		end_time: params.end_time,
+		interval: params.interval || 'day'
+	});
+
+	const response = await fetch(`${API_BASE_URL}/dashboard?${queryParams}`);
+	if (!response.ok) {
+		throw new Error(`Failed to fetch dashboard: ${response.statusText}`);
+	}
+	return response.json();
+}
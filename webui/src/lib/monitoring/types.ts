@@ -53,6 +53,20 @@ export interface TraceTimeline {
 	end_time: number;
 }
 
+export interface LiveSpan {
+	trace_id: string;
+	span_id: string;
+	parent_span_id: string;
+	span_name: string;
+	service_name: string;
+	timestamp: string;
+	duration: number;
+	status_code: string;
+	model: string;
+	total_tokens: number;
+	cost: number;
+}
+
 export interface SpanNode {
 	span_id: string;
 	parent_span_id: string | null;
@@ -62,6 +76,7 @@ export interface SpanNode {
 	duration: number;
 	status: 'OK' | 'ERROR' | 'UNSET';
 	children: SpanNode[];
+	child_count: number;
 	attributes: Record<string, any>;
 	depth: number;
 	is_critical_path: boolean;